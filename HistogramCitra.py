@@ -0,0 +1,275 @@
+import numpy as np
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import cv2
+except ImportError:  # latihan yang "tanpa OpenCV" tetap bisa memakai backend NumPy
+    cv2 = None
+
+# ==========================================
+# HISTOGRAM UINT8 BERSAMA
+# ==========================================
+# Pengganti np.histogram(img.flatten(), 256, [0, 256]): tanpa salinan flatten()
+# dan tanpa binning float. Backend 'opencv' memakai cv2.calcHist (jauh lebih
+# cepat, melepas GIL sehingga citra besar bisa dipecah ke beberapa thread);
+# backend 'numpy' memakai np.bincount per blok agar konversi ke intp tidak
+# pernah seukuran citra. Dipakai bersama oleh praktikum di folder "Pertemuan X".
+
+PARALLEL_MIN_PIXELS = 4_000_000
+BINCOUNT_BLOCK_PIXELS = 1 << 20
+# calcHist menghitung dalam float32 yang hanya eksak sampai 2^24, jadi setiap
+# panggilan dibatasi sebanyak itu piksel lalu hasilnya dijumlahkan sebagai int64
+CALCHIST_MAX_PIXELS = 1 << 24
+
+def _as_rows(image):
+    """View 2-D (baris, piksel) citra uint8 berapapun jumlah kanalnya"""
+    if image.dtype != np.uint8:
+        raise ValueError(f"Histogram 256-bin butuh citra uint8, bukan {image.dtype}")
+    if image.ndim == 1:
+        return image[None, :]
+    # reshape hanya menyalin jika baris tidak kontigu (mis. hasil slicing kolom)
+    return image.reshape(image.shape[0], -1)
+
+def _resolve_backend(backend):
+    if backend == 'auto':
+        return 'opencv' if cv2 is not None else 'numpy'
+    if backend == 'opencv' and cv2 is None:
+        raise ImportError("Backend 'opencv' butuh paket opencv-python")
+    if backend not in ('opencv', 'numpy'):
+        raise ValueError(f"Backend '{backend}' tidak dikenal (pilih 'auto', 'opencv' atau 'numpy')")
+    return backend
+
+def _calc_hist(image, channel=0):
+    """cv2.calcHist eksak: blok baris <= CALCHIST_MAX_PIXELS piksel per panggilan"""
+    row_pixels = image.shape[1]
+    if row_pixels > CALCHIST_MAX_PIXELS:
+        # Satu baris saja sudah melebihi batas float32: hitung dengan bincount
+        return _block_histogram(np.ascontiguousarray(image[..., channel]) if image.ndim == 3 else image, 'numpy')
+    hist = np.zeros(256, dtype=np.int64)
+    step = CALCHIST_MAX_PIXELS // row_pixels
+    for r0 in range(0, image.shape[0], step):
+        hist += cv2.calcHist([image[r0:r0 + step]], [channel], None, [256], [0, 256]).ravel().astype(np.int64)
+    return hist
+
+def _block_histogram(rows, backend):
+    if backend == 'opencv':
+        return _calc_hist(rows)
+    hist = np.zeros(256, dtype=np.int64)
+    step = max(1, BINCOUNT_BLOCK_PIXELS // max(rows.shape[1], 1))
+    for r0 in range(0, rows.shape[0], step):
+        hist += np.bincount(rows[r0:r0 + step].ravel(), minlength=256)
+    return hist
+
+def histogram_uint8(image, backend='auto', workers=None):
+    """
+    Histogram 256-bin (int64) semua nilai piksel citra uint8 (semua kanal digabung).
+    Citra >= PARALLEL_MIN_PIXELS dengan backend opencv dipecah per blok baris
+    ke thread pool lalu histogram parsialnya dijumlahkan.
+    """
+    backend = _resolve_backend(backend)
+    rows = _as_rows(image)
+    n_workers = workers or 4
+    if backend == 'opencv' and n_workers > 1 and rows.size >= PARALLEL_MIN_PIXELS and rows.shape[0] >= n_workers:
+        bounds = np.linspace(0, rows.shape[0], n_workers + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            parts = pool.map(lambda b: _block_histogram(rows[b[0]:b[1]], backend), zip(bounds[:-1], bounds[1:]))
+            return np.sum(list(parts), axis=0)
+    return _block_histogram(rows, backend)
+
+def channel_histograms(image, backend='auto'):
+    """Histogram 256-bin per kanal, bentuk (C, 256); citra gray -> (1, 256)"""
+    if image.ndim == 2:
+        return histogram_uint8(image, backend)[None, :]
+    backend = _resolve_backend(backend)
+    if backend == 'opencv':
+        # calcHist membaca kanal langsung dari citra interleaved (tanpa salinan per kanal)
+        return np.stack([_calc_hist(image, c) for c in range(image.shape[2])])
+    return np.stack([histogram_uint8(np.ascontiguousarray(image[..., c]), backend)
+                     for c in range(image.shape[2])])
+
+# ==========================================
+# CACHE PER CITRA
+# ==========================================
+_cache = {}
+
+def cached_histogram(image, backend='auto'):
+    """
+    Histogram citra yang dihitung sekali per objek array (read-only). Entri
+    dibuang otomatis saat array-nya dihapus. Citra dianggap tidak diubah
+    in-place setelah histogramnya diminta.
+    """
+    key = id(image)
+    entry = _cache.get(key)
+    if entry is not None and entry[0]() is image:
+        return entry[1]
+    hist = histogram_uint8(image, backend)
+    hist.flags.writeable = False
+    _cache[key] = (weakref.ref(image, lambda _, k=key: _cache.pop(k, None)), hist)
+    return hist
+
+def clear_histogram_cache():
+    _cache.clear()
+
+# ==========================================
+# AKUMULATOR STATISTIK SATU PASS
+# ==========================================
+_LEVELS = np.arange(256, dtype=np.float64)
+
+class StatsAccumulator:
+    """
+    Statistik citra dari satu pass data. uint8: semua besaran (mean, std,
+    min, max, entropi, persentil) diturunkan dari histogram 256-bin. Float:
+    mean/M2 per blok baris digabung dengan rumus Welford/Chan (entropi &
+    persentil tidak tersedia). Akumulator dari tile/thread berbeda bisa
+    digabung dengan merge().
+    """
+
+    def __init__(self):
+        self.hist = None
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        # dtype citra non-uint8, agar min/max kembali dalam tipe aslinya
+        self.dtype = None
+
+    def _check_mix(self, other_hist, other_n):
+        if (self.hist is not None and other_n) or (other_hist is not None and self.n):
+            raise ValueError("Akumulator histogram (uint8) tidak bisa dicampur dengan citra float")
+
+    def update(self, image, backend='auto'):
+        if image.dtype == np.uint8:
+            self._check_mix(True, 0)
+            hist = histogram_uint8(image, backend)
+            self.hist = hist if self.hist is None else self.hist + hist
+            return self
+        self._check_mix(None, image.size)
+        self.dtype = image.dtype if self.dtype is None else np.result_type(self.dtype, image.dtype)
+        rows = image.reshape(image.shape[0], -1) if image.ndim > 1 else image[None, :]
+        step = max(1, BINCOUNT_BLOCK_PIXELS // max(rows.shape[1], 1))
+        for r0 in range(0, rows.shape[0], step):
+            block = rows[r0:r0 + step].astype(np.float64, copy=False)
+            n_b = block.size
+            mean_b = block.mean()
+            m2_b = np.square(block - mean_b).sum()
+            self._combine(n_b, mean_b, m2_b, block.min(), block.max())
+        return self
+
+    def _combine(self, n_b, mean_b, m2_b, min_b, max_b):
+        n = self.n + n_b
+        if n == 0:
+            return
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+        self.min = min(self.min, min_b)
+        self.max = max(self.max, max_b)
+
+    def merge(self, other):
+        self._check_mix(other.hist, other.n)
+        if other.dtype is not None:
+            self.dtype = other.dtype if self.dtype is None else np.result_type(self.dtype, other.dtype)
+        if other.hist is not None:
+            self.hist = other.hist.copy() if self.hist is None else self.hist + other.hist
+        else:
+            self._combine(other.n, other.mean, other.m2, other.min, other.max)
+        return self
+
+    def _percentile(self, cdf, total, q):
+        # Sama dengan np.percentile (interpolasi linear) pada piksel yang diurutkan
+        k = q / 100 * (total - 1)
+        lo, hi = int(np.floor(k)), int(np.ceil(k))
+        v_lo = np.searchsorted(cdf, lo, side='right')
+        v_hi = np.searchsorted(cdf, hi, side='right')
+        return v_lo + (v_hi - v_lo) * (k - lo)
+
+    def result(self, name=None, percentiles=()):
+        """Dict {name, mean, std, min, max, dynamic_range, entropy, p<q>...}"""
+        if self.hist is not None:
+            hist = self.hist
+            total = int(hist.sum())
+            nonzero = np.flatnonzero(hist)
+            mean = float(hist @ _LEVELS) / total
+            var = float(hist @ np.square(_LEVELS - mean)) / total
+            p = hist[nonzero] / total
+            v_min, v_max = int(nonzero[0]), int(nonzero[-1])
+            entropy = float(-(p * np.log(p)).sum())
+            cdf = np.cumsum(hist)
+            extra = {f"p{q:g}": float(self._percentile(cdf, total, q)) for q in percentiles}
+        else:
+            mean = self.mean
+            var = self.m2 / self.n if self.n else 0.0
+            v_min, v_max = self.min, self.max
+            if self.n:
+                # Sama dengan image.min()/max() pada citra asli (mis. np.uint16, bukan float64)
+                v_min, v_max = self.dtype.type(v_min), self.dtype.type(v_max)
+            entropy = None
+            extra = {f"p{q:g}": None for q in percentiles}
+        stats = {
+            'name': name,
+            'mean': mean,
+            'std': float(np.sqrt(var)),
+            'min': v_min,
+            'max': v_max,
+            'dynamic_range': v_max - v_min,
+            'entropy': entropy,
+        }
+        stats.update(extra)
+        return stats
+
+def image_statistics(image, name=None, percentiles=(), workers=1):
+    """
+    Statistik satu citra lewat StatsAccumulator. workers > 1 memecah citra
+    per blok baris ke thread pool lalu menggabungkan akumulatornya.
+    """
+    if workers <= 1 or image.shape[0] < workers:
+        return StatsAccumulator().update(image).result(name, percentiles)
+    bounds = np.linspace(0, image.shape[0], workers + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(lambda b: StatsAccumulator().update(image[b[0]:b[1]], 'auto'),
+                              zip(bounds[:-1], bounds[1:])))
+    total = StatsAccumulator()
+    for part in parts:
+        total.merge(part)
+    return total.result(name, percentiles)
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    for shape in [(256, 256), (1080, 1920), (4000, 5000)]:
+        img = rng.integers(0, 256, shape, dtype=np.uint8)
+        ref = np.histogram(img.flatten(), 256, [0, 256])[0]
+        timings = []
+        for name, func in [('np.histogram', lambda: np.histogram(img.flatten(), 256, [0, 256])[0]),
+                           ('numpy', lambda: histogram_uint8(img, 'numpy')),
+                           ('opencv', lambda: histogram_uint8(img, 'opencv')),
+                           ('opencv x1', lambda: histogram_uint8(img, 'opencv', workers=1))]:
+            t0 = time.perf_counter()
+            hist = func()
+            timings.append(f"{name}: {(time.perf_counter() - t0) * 1000:.2f} ms")
+            assert np.array_equal(hist, ref), name
+        t0 = time.perf_counter()
+        cached_histogram(img)
+        cached_histogram(img)
+        timings.append(f"cache 2x: {(time.perf_counter() - t0) * 1000:.2f} ms")
+        print(f"{shape[0]}x{shape[1]} | " + " | ".join(timings))
+
+    # Statistik satu pass vs enam pass terpisah (min, max dua kali, mean, std, histogram)
+    img = rng.normal(128, 30, (4000, 5000)).clip(0, 255).astype(np.uint8)
+    t0 = time.perf_counter()
+    hist = np.histogram(img.flatten(), 256, [0, 256])[0]
+    p = hist[hist > 0] / hist.sum()
+    naive = [np.mean(img), np.std(img), np.min(img), np.max(img), np.max(img) - np.min(img), -(p * np.log(p)).sum()]
+    t_naive = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    res = image_statistics(img, percentiles=(1, 50, 99))
+    t_acc = time.perf_counter() - t0
+    ok = np.allclose([res[k] for k in ('mean', 'std', 'min', 'max', 'dynamic_range', 'entropy')], naive)
+    ok &= all(np.isclose(res[f"p{q}"], np.percentile(img, q)) for q in (1, 50, 99))
+    imgf = img.astype(np.float32) / 255
+    resf = image_statistics(imgf, workers=4)
+    ok &= np.isclose(resf['mean'], imgf.mean(dtype=np.float64)) and np.isclose(resf['std'], imgf.std(dtype=np.float64))
+    print(f"Statistik 20 MP | enam pass: {t_naive * 1000:.1f} ms | satu pass: {t_acc * 1000:.1f} ms | cocok: {ok}")
@@ -0,0 +1,201 @@
+import numpy as np
+import time
+
+try:
+    import cv2
+except ImportError:  # tanpa OpenCV LUT per kanal diterapkan dengan gather NumPy
+    cv2 = None
+
+from HistogramCitra import histogram_uint8, channel_histograms
+
+# ==========================================
+# KUANTISASI SKALAR BERBASIS HISTOGRAM
+# ==========================================
+# Semua tabel dibangun dari histogram 256-bin (dihitung sekali), untuk
+# banyak jumlah level sekaligus: baris ke-l adalah LUT 256 entri untuk
+# levels[l]. Piksel baru disentuh saat LUT diterapkan, dan MSE/PSNR juga
+# dihitung dari histogram (sum h(v) * (v - LUT[v])^2), bukan dari citra.
+# hist boleh satu histogram (256,) untuk semua baris, atau (L, 256) dengan
+# histogram sendiri per baris (dipakai untuk kuantisasi per kanal warna).
+
+VALUES = np.arange(256, dtype=np.float64)
+
+def uniform_tables(levels):
+    """LUT kuantisasi uniform (v // step) * step, step = 256 // levels"""
+    steps = (256 // np.asarray(levels))[:, None]
+    return ((VALUES[None, :] // steps) * steps).astype(np.uint8)
+
+def _cell_centroids(hist, cells, levels):
+    """
+    Rata-rata nilai (berbobot histogram) di setiap sel untuk semua baris
+    sekaligus: indeks sel digeser per baris lalu satu np.bincount.
+    Mengembalikan (centroid, offset baris, mask sel berisi piksel).
+    """
+    levels = np.asarray(levels)
+    offsets = np.concatenate([[0], np.cumsum(levels)[:-1]])
+    flat = (cells + offsets[:, None]).ravel()
+    weights = np.broadcast_to(hist, cells.shape).ravel().astype(np.float64)
+    total = np.bincount(flat, weights=weights, minlength=levels.sum())
+    moment = np.bincount(flat, weights=weights * np.tile(VALUES, len(levels)), minlength=levels.sum())
+    occupied = total > 0
+    centroids = np.divide(moment, total, out=np.zeros_like(moment), where=occupied)
+    return centroids, offsets, occupied
+
+def equal_probability_cells(hist, levels):
+    """Sel (levels, 256): nilai v masuk sel floor(CDF_tengah(v) * L), tiap sel ~ probabilitas sama"""
+    hist = np.atleast_2d(np.asarray(hist, dtype=np.float64))
+    cdf_mid = (np.cumsum(hist, axis=-1) - hist / 2) / hist.sum(axis=-1, keepdims=True)
+    levels = np.asarray(levels)
+    cells = np.floor(cdf_mid * levels[:, None]).astype(np.intp)
+    return np.minimum(cells, levels[:, None] - 1)
+
+def equal_probability_tables(hist, levels):
+    """LUT equal-probability (berbasis CDF) dengan nilai rekonstruksi = centroid sel"""
+    levels = np.asarray(levels)
+    cells = equal_probability_cells(hist, levels)
+    centroids, offsets, _ = _cell_centroids(hist, cells, levels)
+    # Sel kosong tidak pernah dirujuk LUT karena setiap v dengan h(v) > 0 ada di sel berisi
+    return np.rint(centroids[cells + offsets[:, None]]).astype(np.uint8)
+
+def lloyd_max_tables(hist, levels, max_iter=100, tol=1e-3):
+    """
+    LUT Lloyd–Max (MSE minimum) untuk semua jumlah level sekaligus, iterasi
+    hanya pada 256 bin: ambang = titik tengah dua level berurutan, level =
+    centroid sel. Inisialisasi dari sel equal-probability. Sel selalu berupa
+    interval nilai, jadi massa & momen tiap sel diambil dari cumsum histogram
+    di batas sel: O(level) per iterasi, tanpa menyusun ulang 256 bin.
+    """
+    hist = np.asarray(hist, dtype=np.float64)
+    levels = np.asarray(levels)
+    max_levels = levels.max()
+    cells = equal_probability_cells(hist, levels)
+    centroids, _, occupied = _cell_centroids(hist, cells, levels)
+    # Level disusun (baris, max_levels) dengan padding +inf agar ambang baris pendek tidak terpakai
+    valid = np.arange(max_levels)[None, :] < levels[:, None]
+    reps = np.full((len(levels), max_levels), np.inf)
+    reps[valid] = centroids
+    # Level awal untuk sel kosong diinterpolasi dari tetangganya yang berisi
+    mask = np.full_like(reps, True, dtype=bool)
+    mask[valid] = occupied
+    for r, n in enumerate(levels):
+        idx = np.arange(n)
+        ok = mask[r, :n]
+        if ok.any() and not ok.all():
+            reps[r, :n] = np.interp(idx, idx[ok], reps[r, :n][ok])
+    # Prefix sum massa & momen: sum h(v) untuk v di [a, b) = S[b] - S[a]
+    rows = np.broadcast_to(hist, (len(levels), 256))
+    zeros = np.zeros((len(levels), 1))
+    mass = np.hstack([zeros, np.cumsum(rows, axis=1)])
+    moment = np.hstack([zeros, np.cumsum(rows * VALUES, axis=1)])
+    first, last = np.zeros((len(levels), 1), np.intp), np.full((len(levels), 1), 256, np.intp)
+    for _ in range(max_iter):
+        thresholds = (reps[:, :-1] + reps[:, 1:]) / 2
+        # Nilai v masuk sel k jika ambang[k-1] < v <= ambang[k]; ambang inf -> batas 256
+        edges = np.hstack([first, np.clip(np.floor(thresholds) + 1, 0, 256).astype(np.intp), last])
+        total = np.diff(np.take_along_axis(mass, edges, axis=1), axis=1)
+        moments = np.diff(np.take_along_axis(moment, edges, axis=1), axis=1)
+        # Level tanpa piksel dipertahankan di posisinya (tidak runtuh ke 0)
+        occupied = valid & (total > 0)
+        new_reps = np.where(occupied, moments / np.where(occupied, total, 1), reps)
+        shift = np.abs(new_reps[valid] - reps[valid]).max()
+        reps = new_reps
+        if shift < tol:
+            break
+    thresholds = (reps[:, :-1] + reps[:, 1:]) / 2
+    cells = (VALUES[None, :, None] > thresholds[:, None, :]).sum(axis=2)
+    tables = np.rint(np.take_along_axis(reps, cells, axis=1)).astype(np.uint8)
+    # Level >= jumlah nilai yang muncul: optimum trivial (setiap nilai jadi level sendiri)
+    tables[levels >= np.count_nonzero(hist, axis=-1)] = VALUES.astype(np.uint8)
+    return tables
+
+QUANTIZERS = {
+    'uniform': lambda hist, levels: uniform_tables(levels),
+    'equal_probability': equal_probability_tables,
+    'lloyd_max': lloyd_max_tables,
+}
+
+def table_metrics(hist, tables):
+    """MSE & PSNR setiap LUT langsung dari histogram (tanpa membaca piksel)"""
+    hist = np.asarray(hist, dtype=np.float64)
+    err = (np.square(VALUES - tables.astype(np.float64)) * hist).sum(axis=-1) / hist.sum(axis=-1)
+    with np.errstate(divide='ignore'):
+        psnr = np.where(err > 0, 10 * np.log10(255 ** 2 / np.maximum(err, 1e-12)), np.inf)
+    return err, psnr
+
+def quantize_levels(image, levels, method='equal_probability', hist=None):
+    """
+    Kuantisasi citra gray uint8 ke beberapa jumlah level sekaligus.
+    Mengembalikan dict: tables (L, 256), images (L, h, w), mse (L,), psnr (L,).
+    """
+    if method not in QUANTIZERS:
+        raise ValueError(f"Metode '{method}' tidak dikenal (pilih dari {list(QUANTIZERS)})")
+    hist = histogram_uint8(image) if hist is None else hist
+    tables = QUANTIZERS[method](hist, levels)
+    mse, psnr = table_metrics(hist, tables)
+    # Satu gather untuk semua level: tables[:, image] -> (L, h, w)
+    return {'tables': tables, 'images': tables[:, image], 'mse': mse, 'psnr': psnr}
+
+def index_tables(hist, tables):
+    """
+    Ubah LUT nilai (R, 256) menjadi LUT indeks (R, 256) + palet (n, R) agar
+    hasil kuantisasi bisa disimpan sebagai indeks. Palet baris r = nilai
+    output yang benar-benar dipakai (h(v) > 0), diurutkan dan di-padding
+    dengan nilai terakhirnya.
+    """
+    hist = np.broadcast_to(hist, tables.shape)
+    used = [np.unique(t[h > 0]) if (h > 0).any() else t[:1] for t, h in zip(tables, hist)]
+    n = max(len(u) for u in used)
+    palette = np.stack([np.pad(u, (0, n - len(u)), mode='edge') for u in used], axis=1)
+    lut = np.stack([np.minimum(np.searchsorted(u, t), len(u) - 1) for t, u in zip(tables, used)])
+    return lut.astype(np.uint8), palette
+
+def apply_channel_tables(image, tables):
+    """Terapkan LUT (C, 256) ke kanal masing-masing dalam satu panggilan"""
+    if image.ndim == 2:
+        return tables[0][image]
+    if cv2 is not None and image.shape[2] <= 4:
+        # cv2.LUT menerima tabel (1, 256, C) dan memetakan tiap kanal dengan tabelnya sendiri
+        return cv2.LUT(image, np.ascontiguousarray(tables.T)[None])
+    return tables[np.arange(image.shape[2]), image]
+
+def quantize_channels(image, levels, method='lloyd_max', hist=None):
+    """
+    Kuantisasi per kanal citra uint8 (gray atau warna) dengan `levels` level
+    per kanal. Tabel semua kanal dibangun sekaligus dari histogram (C, 256),
+    lalu diterapkan dengan satu gather tables[kanal, piksel].
+    Mengembalikan dict: image, tables (C, 256), mse (C,), psnr (C,).
+    """
+    if method not in QUANTIZERS:
+        raise ValueError(f"Metode '{method}' tidak dikenal (pilih dari {list(QUANTIZERS)})")
+    hist = channel_histograms(image) if hist is None else np.atleast_2d(hist)
+    tables = QUANTIZERS[method](hist, np.full(len(hist), levels))
+    mse, psnr = table_metrics(hist, tables)
+    return {'image': apply_channel_tables(image, tables), 'tables': tables, 'mse': mse, 'psnr': psnr}
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    img = np.clip(np.concatenate([rng.normal(60, 12, 600_000), rng.normal(190, 25, 400_000)]), 0, 255)
+    img = img.astype(np.uint8).reshape(1000, 1000)
+    levels = [64, 16, 8, 4, 2]
+    hist = histogram_uint8(img)
+    print(f"{'Metode':<18} | {'Tabel (ms)':<10} | " + " | ".join(f"{lv:>3} lvl PSNR" for lv in levels))
+    print("-" * 100)
+    for method in QUANTIZERS:
+        t0 = time.perf_counter()
+        tables = QUANTIZERS[method](hist, levels)
+        t_table = time.perf_counter() - t0
+        mse, psnr = table_metrics(hist, tables)
+        # Validasi: MSE dari histogram harus sama dengan MSE piksel
+        direct = [np.mean((img.astype(float) - t[img]) ** 2) for t in tables]
+        assert np.allclose(mse, direct)
+        print(f"{method:<18} | {t_table * 1000:<10.3f} | " + " | ".join(f"{p:>12.2f}" for p in psnr))
+
+    # Per kanal: tiga histogram, satu panggilan, satu gather
+    color = np.stack([img, 255 - img, img // 2 + 64], axis=-1)
+    t0 = time.perf_counter()
+    res = quantize_channels(color, 4)
+    t_color = time.perf_counter() - t0
+    direct = np.mean((color.astype(float) - res['image']) ** 2, axis=(0, 1))
+    assert np.allclose(res['mse'], direct)
+    print(f"\nLloyd-Max per kanal (1 MP RGB, 4 level): {t_color * 1000:.2f} ms | "
+          f"PSNR per kanal: {', '.join(f'{p:.2f}' for p in res['psnr'])} dB")
@@ -0,0 +1,23 @@
+import numpy as np
+import time
+
+# ==========================================
+# PENGUKURAN WAKTU BERSAMA
+# ==========================================
+# Satu helper timing untuk semua benchmark di folder "Pertemuan X": warm-up
+# dulu (cache, alokasi, inisialisasi thread pool OpenCV), lalu beberapa
+# pengulangan dengan time.perf_counter. Median dipakai sebagai waktu, IQR
+# sebagai ukuran sebaran, agar satu sampel yang terganggu tidak merusak hasil.
+
+def time_call(func, warmup=1, repeats=7):
+    """Jalankan func() warmup + repeats kali; kembalikan (hasil terakhir, median detik, IQR detik)"""
+    result = None
+    for _ in range(warmup):
+        result = func()
+    samples = np.empty(repeats)
+    for i in range(repeats):
+        t0 = time.perf_counter()
+        result = func()
+        samples[i] = time.perf_counter() - t0
+    q1, med, q3 = np.percentile(samples, [25, 50, 75])
+    return result, float(med), float(q3 - q1)
@@ -0,0 +1,102 @@
+import numpy as np
+import time
+
+# ==========================================
+# ENGINE DIGITALISASI HEADLESS (TANPA PLOT)
+# ==========================================
+# Seluruh grid (sampling rate x level kuantisasi) dihitung dalam satu
+# komputasi broadcast: sampel disimpan sebagai array (rate, sampel) yang
+# di-padding, kuantisasi di-broadcast menjadi (rate, level, sampel).
+
+def quantize_signal(y, quantization_levels):
+    """
+    Kuantisasi sinyal berrentang -1..1 ke sejumlah level (bisa di-broadcast).
+    Sama dengan langkah kuantisasi pada simulate_digitization (latihan2.py).
+    """
+    max_level_val = np.asarray(quantization_levels) - 1
+    y_discrete_int = np.round((y + 1) / 2 * max_level_val)
+    return (y_discrete_int / max_level_val) * 2 - 1
+
+def alias_frequency(freq, sampling_rates):
+    """Frekuensi semu (bertanda) hasil folding: f - k*fs dengan k = round(f/fs)"""
+    fs = np.asarray(sampling_rates, dtype=np.float64)
+    return freq - fs * np.round(freq / fs)
+
+def digitization_sweep(sampling_rates, quantization_levels, freq=1.0, duration=2.0,
+                       analog_points=1000):
+    """
+    Evaluasi semua kombinasi sampling rate x level kuantisasi sekaligus.
+    Sampel diambil seragam pada t = k / fs dalam [0, duration).
+
+    Mengembalikan dict berisi array berukuran (len(rates), len(levels)):
+    - 'snr_db'         : SNR kuantisasi (daya sinyal analog / daya error kuantisasi)
+    - 'quant_error'    : RMS error kuantisasi pada titik sampel
+    - 'aliasing_error' : RMS selisih sinyal asli dengan sinus frekuensi alias
+                         (nol jika fs > 2f), sama untuk semua level
+    - 'total_error'    : RMS selisih sinyal asli dengan rekonstruksi ZOH dari
+                         sampel terkuantisasi
+    serta 'alias_freq' per rate.
+    """
+    rates = np.asarray(sampling_rates, dtype=np.float64)
+    levels = np.asarray(quantization_levels, dtype=np.float64)
+
+    # 1. SAMPLING: (R, Kmax) dengan mask untuk sampel valid tiap rate
+    n_samples = np.ceil(duration * rates - 1e-9).astype(np.int64)
+    k = np.arange(n_samples.max())
+    valid = k[None, :] < n_samples[:, None]
+    t_sampled = k[None, :] / rates[:, None]
+    y_sampled = np.sin(2 * np.pi * freq * t_sampled)
+
+    # 2. KUANTISASI: broadcast ke (R, Q, Kmax)
+    y_quantized = quantize_signal(y_sampled[:, None, :], levels[None, :, None])
+    q_err = np.where(valid[:, None, :], y_quantized - y_sampled[:, None, :], 0.0)
+    n_valid = n_samples[:, None].astype(np.float64)
+    noise_power = np.sum(q_err ** 2, axis=2) / n_valid
+
+    t_analog = np.linspace(0, duration, analog_points, endpoint=False)
+    y_analog = np.sin(2 * np.pi * freq * t_analog)
+    # Daya sinyal dari sinyal analog (bukan sampel): pada fs = f atau 2f semua
+    # sampel jatuh di titik nol sehingga daya sampel tidak bermakna
+    signal_power = np.mean(y_analog ** 2)
+    with np.errstate(divide='ignore'):
+        snr_db = 10 * np.log10(signal_power / noise_power)
+
+    # 3. ALIASING: sinus asli vs sinus frekuensi alias yang dibentuk sampel (R, P)
+    f_alias = alias_frequency(freq, rates)
+    y_alias = np.sin(2 * np.pi * f_alias[:, None] * t_analog[None, :])
+    # Alias tepat di fs/2: sin(pi * k) = 0 untuk semua sampel -> sinyal hilang
+    y_alias[np.isclose(np.abs(f_alias), rates / 2)] = 0.0
+    aliasing_error = np.sqrt(np.mean((y_alias - y_analog[None, :]) ** 2, axis=1))
+
+    # 4. REKONSTRUKSI ZOH dari sampel terkuantisasi: indeks (R, P) -> gather (R, Q, P)
+    idx = np.minimum(np.floor(t_analog[None, :] * rates[:, None]).astype(np.int64),
+                     n_samples[:, None] - 1)
+    y_recon = np.take_along_axis(y_quantized, idx[:, None, :], axis=2)
+    total_error = np.sqrt(np.mean((y_recon - y_analog[None, None, :]) ** 2, axis=2))
+
+    return {
+        'sampling_rates': rates,
+        'quantization_levels': levels.astype(np.int64),
+        'alias_freq': f_alias,
+        'snr_db': snr_db,
+        'quant_error': np.sqrt(noise_power),
+        'aliasing_error': np.broadcast_to(aliasing_error[:, None], snr_db.shape),
+        'total_error': total_error,
+    }
+
+if __name__ == "__main__":
+    rates = np.arange(1, 101)          # 1..100 Hz
+    levels = 2 ** np.arange(1, 9)      # 2..256 level (1..8 bit)
+    t0 = time.perf_counter()
+    result = digitization_sweep(rates, levels, freq=5.0, duration=2.0)
+    dt = time.perf_counter() - t0
+    print(f"Sweep {len(rates)} rate x {len(levels)} level = {len(rates) * len(levels)} konfigurasi "
+          f"dalam {dt * 1000:.1f} ms")
+
+    print(f"\n{'fs (Hz)':<8} | {'Level':<6} | {'SNR (dB)':<9} | {'Err Kuant':<9} | {'Err Alias':<9} | {'Err Total':<9}")
+    print("-" * 65)
+    for r in [4, 9, 19, 49]:
+        for q in [1, 3, 7]:
+            print(f"{rates[r]:<8} | {levels[q]:<6} | {result['snr_db'][r, q]:<9.2f} | "
+                  f"{result['quant_error'][r, q]:<9.4f} | {result['aliasing_error'][r, q]:<9.4f} | "
+                  f"{result['total_error'][r, q]:<9.4f}")
@@ -8,6 +8,11 @@ import matplotlib.pyplot as plt
 import requests
 from io import BytesIO
 from PIL import Image
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from HistogramCitra import image_statistics
+from KuantisasiSkalar import quantize_levels, quantize_channels
 
 print("=== PRAKTIKUM 1: DASAR-DASAR CITRA DIGITAL ===")
 print("Materi: Representasi Citra, Resolusi, Depth, Aspect Ratio\n")
@@ -51,9 +56,11 @@ def analyze_image_properties(img, name="Image"):
     
     # Calculate statistics
     if channels == 1:
-        print(f"Intensity Range: [{img.min()}, {img.max()}]")
-        print(f"Mean Intensity: {img.mean():.2f}")
-        print(f"Std Deviation: {img.std():.2f}")
+        # Min, max, mean dan std dari satu pass histogram
+        img_stats = image_statistics(img)
+        print(f"Intensity Range: [{img_stats['min']}, {img_stats['max']}]")
+        print(f"Mean Intensity: {img_stats['mean']:.2f}")
+        print(f"Std Deviation: {img_stats['std']:.2f}")
     
     return {
         'width': width,
@@ -119,6 +126,16 @@ images = [img_8bit, img_4bit, img_2bit, img_1bit]
 titles = ['8-bit (256 levels)', '4-bit (16 levels)', '2-bit (4 levels)', '1-bit (2 levels)']
 display_image_grid(images, titles, 1, 4, figsize=(16, 4))
 
+# Jumlah level sama, tetapi level Lloyd-Max (MSE minimum) dihitung dari histogram
+# 256-bin sekali saja; piksel baru disentuh saat LUT diterapkan
+lloyd = quantize_levels(gray_img, [16, 4, 2], method='lloyd_max')
+lloyd_color = quantize_channels(original_img, 4, method='lloyd_max')
+print(f"PSNR Lloyd-Max 4/2/1-bit: {', '.join(f'{p:.2f}' for p in lloyd['psnr'])} dB")
+print(f"PSNR Lloyd-Max warna 2-bit per kanal (B, G, R): {', '.join(f'{p:.2f}' for p in lloyd_color['psnr'])} dB")
+images = [lloyd_color['image']] + list(lloyd['images'])
+titles = ['Warna 2-bit/kanal (Lloyd-Max)'] + [f'Lloyd-Max {lv} levels ({p:.1f} dB)' for lv, p in zip([16, 4, 2], lloyd['psnr'])]
+display_image_grid(images, titles, 1, 4, figsize=(16, 4))
+
 # 5. ANALISIS ASPECT RATIO
 print("\n\n5. PENGARUH ASPECT RATIO")
 # Resize dengan aspect ratio berbeda
@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from DigitalisasiSweep import quantize_signal
 
 print("=== LATIHAN 2: SIMULASI SAMPLING & KUANTISASI ===")
 
@@ -32,15 +33,9 @@ def simulate_digitization(freq=1.0, duration=2.0, sampling_rate=10, quantization
     # 3. QUANTIZATION (Diskrit dalam Amplitudo)
     # Membulatkan nilai y ke level terdekat
     
-    # Normalisasi dulu dari range (-1 s/d 1) ke (0 s/d 1)
-    y_normalized = (y_sampled + 1) / 2
-    
-    # Skala ke integer (0 s/d levels-1)
-    max_level_val = quantization_levels - 1
-    y_discrete_int = np.round(y_normalized * max_level_val)
-    
-    # Kembalikan ke range aslinya (-1 s/d 1) untuk ditampilkan
-    y_quantized = (y_discrete_int / max_level_val) * 2 - 1
+    # Normalisasi ke (0 s/d 1), skala ke integer (0 s/d levels-1), lalu kembali ke (-1 s/d 1)
+    # Untuk sweep banyak konfigurasi sekaligus tanpa plot, lihat DigitalisasiSweep.py
+    y_quantized = quantize_signal(y_sampled, quantization_levels)
 
     # VISUALISASI
     plt.figure(figsize=(14, 6))
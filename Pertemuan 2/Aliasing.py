@@ -1,20 +1,15 @@
 import cv2
-import numpy as np
 import matplotlib.pyplot as plt
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PolaSintetis import get_pattern
 
 def create_zone_plate(size=512):
     """Membuat pola Zone Plate (Lingkaran konsentris) untuk tes Aliasing"""
-    x = np.linspace(-size/2, size/2, size)
-    y = np.linspace(-size/2, size/2, size)
-    xx, yy = np.meshgrid(x, y)
-    r = np.sqrt(xx**2 + yy**2)
-    # Fungsi sinus dengan frekuensi meningkat ke arah luar
-    km = 0.7 * np.pi
-    img = np.sin(km * r**2 / size)
-    
-    # Normalisasi ke 0-255
-    img_uint8 = ((img + 1) / 2 * 255).astype(np.uint8)
-    return img_uint8
+    # Fungsi sinus dengan frekuensi meningkat ke arah luar (km = 0.7*pi), dibuat
+    # dalam float32 dan di-cache oleh PolaSintetis
+    return get_pattern('zone_plate', size).copy()
 
 def simulate_image_aliasing(image, factor):
     """
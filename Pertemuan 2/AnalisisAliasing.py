@@ -0,0 +1,156 @@
+import cv2
+import numpy as np
+import time
+import os
+import argparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# ==========================================
+# 1. PIRAMIDA CITRA (DIBANGUN SEKALI)
+# ==========================================
+def build_pyramid(image, max_factor, mode='gaussian'):
+    """
+    Piramida level 0 (asli), 1 (1/2), 2 (1/4), ... sampai >= max_factor.
+    mode 'gaussian' memakai cv2.pyrDown, 'area' memakai resize INTER_AREA 1/2.
+    """
+    pyramid = [image]
+    while 2 ** (len(pyramid) - 1) * 2 <= max_factor:
+        prev = pyramid[-1]
+        if mode == 'gaussian':
+            pyramid.append(cv2.pyrDown(prev))
+        elif mode == 'area':
+            pyramid.append(cv2.resize(prev, (max(1, prev.shape[1] // 2), max(1, prev.shape[0] // 2)),
+                                      interpolation=cv2.INTER_AREA))
+        else:
+            raise ValueError(f"Mode piramida '{mode}' tidak dikenal (pilih 'gaussian' atau 'area')")
+    return pyramid
+
+def downsample_from_pyramid(pyramid, factor):
+    """
+    Downsample faktor sembarang: ambil level piramida 2^L <= factor terdekat,
+    lalu sisa faktornya diselesaikan dengan INTER_AREA dari level tersebut.
+    """
+    h, w = pyramid[0].shape[:2]
+    new_h, new_w = h // factor, w // factor
+    level = min(int(np.floor(np.log2(factor))), len(pyramid) - 1)
+    base = pyramid[level]
+    if base.shape[:2] == (new_h, new_w):
+        return base
+    return cv2.resize(base, (new_w, new_h), interpolation=cv2.INTER_AREA)
+
+# ==========================================
+# 2. ANALISIS SPEKTRUM (FFT DIHITUNG SEKALI)
+# ==========================================
+class SpectrumAnalyzer:
+    """Menyimpan FFT citra asli agar semua faktor memakai spektrum yang sama"""
+
+    def __init__(self, image):
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        self.shape = gray.shape
+        self.spectrum = np.fft.fftshift(np.fft.fft2(gray.astype(np.float32)))
+        power = np.abs(self.spectrum) ** 2
+        power[self.shape[0] // 2, self.shape[1] // 2] = 0  # abaikan DC
+        self.power = power
+        self.total_energy = power.sum()
+        self.fy = np.abs(np.fft.fftshift(np.fft.fftfreq(self.shape[0])))[:, None]
+        self.fx = np.abs(np.fft.fftshift(np.fft.fftfreq(self.shape[1])))[None, :]
+
+    def energy_above_nyquist(self, factor):
+        """Fraksi energi spektrum di atas Nyquist baru (0.5/factor siklus/piksel)"""
+        nyquist = 0.5 / factor
+        mask = (self.fy > nyquist) | (self.fx > nyquist)
+        return float(self.power[mask].sum() / self.total_energy)
+
+    def ideal_downsample(self, factor):
+        """Referensi bebas aliasing: crop spektrum (low-pass ideal) lalu IFFT"""
+        h, w = self.shape
+        new_h, new_w = h // factor, w // factor
+        y0, x0 = h // 2 - new_h // 2, w // 2 - new_w // 2
+        crop = self.spectrum[y0:y0 + new_h, x0:x0 + new_w]
+        ideal = np.real(np.fft.ifft2(np.fft.ifftshift(crop)))
+        return ideal * (new_h * new_w) / (h * w)
+
+def aliasing_error_db(result, ideal):
+    """Energi selisih terhadap referensi ideal relatif terhadap energi AC referensi (dB)"""
+    gray = result if result.ndim == 2 else cv2.cvtColor(result, cv2.COLOR_BGR2GRAY)
+    err = np.sum((gray.astype(np.float32) - ideal) ** 2)
+    ref = np.sum((ideal - ideal.mean()) ** 2)
+    return float(10 * np.log10(err / ref)) if err > 0 else float('-inf')
+
+# ==========================================
+# 3. ANALISIS BANYAK FAKTOR (PARALEL)
+# ==========================================
+def analyze_factors(image, factors=(2, 3, 4, 6, 8), pyramid_mode='gaussian', workers=None):
+    """
+    Bangun piramida & FFT sekali, lalu hitung semua faktor secara paralel
+    (thread: OpenCV & FFT NumPy melepas GIL, dan citra tidak perlu disalin).
+    """
+    t0 = time.perf_counter()
+    pyramid = build_pyramid(image, max(factors), pyramid_mode)
+    analyzer = SpectrumAnalyzer(image)
+    setup_time = time.perf_counter() - t0
+
+    def run(factor):
+        t_naive = time.perf_counter()
+        # Salin ke array kontigu agar waktu naive mencakup pembentukan citra, bukan hanya view
+        naive = np.ascontiguousarray(image[::factor, ::factor][:image.shape[0] // factor, :image.shape[1] // factor])
+        t_naive = time.perf_counter() - t_naive
+        t_pyr = time.perf_counter()
+        proper = downsample_from_pyramid(pyramid, factor)
+        t_pyr = time.perf_counter() - t_pyr
+        ideal = analyzer.ideal_downsample(factor)
+        return {
+            'Factor': factor,
+            'HF_Energy': round(analyzer.energy_above_nyquist(factor), 4),
+            'Naive_dB': round(aliasing_error_db(naive, ideal), 2),
+            'Pyramid_dB': round(aliasing_error_db(proper, ideal), 2),
+            'Naive_ms': round(t_naive * 1000, 3),
+            'Pyramid_ms': round(t_pyr * 1000, 3),
+        }
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        rows = list(pool.map(run, factors))
+    for r in rows:
+        r['Setup_ms'] = round(setup_time * 1000, 3)
+    return rows
+
+def _analyze_file(args):
+    path, factors, pyramid_mode = args
+    img = cv2.imread(path, 0)
+    if img is None:
+        return path, None
+    cv2.setNumThreads(1)
+    return path, analyze_factors(img, factors, pyramid_mode, workers=1)
+
+def analyze_dataset(image_paths, factors=(2, 3, 4, 6, 8), pyramid_mode='gaussian', workers=None):
+    """Karakterisasi kualitas resize untuk banyak citra (satu proses per citra)"""
+    tasks = [(p, tuple(factors), pyramid_mode) for p in image_paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(_analyze_file, tasks))
+
+def print_table(rows):
+    print(f"{'Faktor':<6} | {'Energi HF':<9} | {'Naive (dB)':<10} | {'Piramida (dB)':<13} | {'Naive (ms)':<10} | {'Piramida (ms)':<13}")
+    print("-" * 75)
+    for r in rows:
+        print(f"{r['Factor']:<6} | {r['HF_Energy']:<9} | {r['Naive_dB']:<10} | {r['Pyramid_dB']:<13} | {r['Naive_ms']:<10} | {r['Pyramid_ms']:<13}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analisis aliasing multi-faktor downsampling")
+    parser.add_argument("images", nargs="*", help="Path citra (kosong = pola Zone Plate)")
+    parser.add_argument("--factors", type=int, nargs="+", default=[2, 3, 4, 6, 8])
+    parser.add_argument("--pyramid", choices=["gaussian", "area"], default="gaussian")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.images:
+        paths = [p for p in args.images if os.path.exists(p)]
+        for path, rows in analyze_dataset(paths, args.factors, args.pyramid, args.workers).items():
+            print(f"\n--- {path} ---")
+            if rows is None:
+                print("Gagal membaca citra.")
+            else:
+                print_table(rows)
+    else:
+        from Aliasing import create_zone_plate
+        print("Menggunakan pola uji Zone Plate 600x600")
+        print_table(analyze_factors(create_zone_plate(size=600), args.factors, args.pyramid, args.workers))
@@ -1,6 +1,7 @@
 import cv2
 import numpy as np
 import matplotlib.pyplot as plt
+from KlasifikasiWarna import get_skin_classifier
 
 def create_dummy_image():
     """Membuat citra dummy untuk simulasi jika tidak ada file gambar"""
@@ -31,18 +32,16 @@ def analyze_color_model_suitability(image, application):
         # --- KASUS 1: DETEKSI KULIT (SKIN DETECTION) ---
         # Hipotesis: HSV lebih baik daripada RGB karena memisahkan warna (Hue) dari cahaya.
         
+        # Kedua aturan dikompilasi sekali menjadi LUT 24-bit (lihat KlasifikasiWarna.py),
+        # jadi klasifikasi cukup satu gather per piksel tanpa overflow uint8 pada |R-G|
+        
         # A. Pendekatan RGB (Sangat terpengaruh cahaya/bayangan)
         # Warna kulit sederhana: R > 95, G > 40, B > 20, dll.
-        b, g, r = cv2.split(image)
-        mask_rgb = (r > 95) & (g > 40) & (b > 20) & ((np.maximum(r,np.maximum(g,b)) - np.minimum(r,np.minimum(g,b))) > 15) & (np.abs(r-g) > 15) & (r > g) & (r > b)
-        mask_rgb = mask_rgb.astype(np.uint8) * 255
+        mask_rgb = get_skin_classifier('RGB').classify(image)
         
         # B. Pendekatan HSV (Lebih robust)
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        # Range warna kulit di HSV (biasanya Hue 0-20)
-        lower_skin = np.array([0, 48, 80], dtype=np.uint8)
-        upper_skin = np.array([20, 255, 255], dtype=np.uint8)
-        mask_hsv = cv2.inRange(hsv, lower_skin, upper_skin)
+        # Range warna kulit di HSV (biasanya Hue 0-20, S >= 48, V >= 80)
+        mask_hsv = get_skin_classifier('HSV').classify(image)
         
         # Visualisasi
         fig, ax = plt.subplots(1, 3, figsize=(15, 5))
@@ -0,0 +1,126 @@
+import cv2
+import numpy as np
+import time
+from functools import lru_cache
+
+# ==========================================
+# KLASIFIKASI WARNA VIA LOOKUP TABLE
+# ==========================================
+# Aturan warna per piksel (mis. deteksi kulit) dievaluasi SEKALI untuk semua
+# kemungkinan warna, lalu disimpan sebagai LUT. Klasifikasi frame cukup satu
+# gather terindeks: tidak ada temporary per aturan dan tidak ada overflow uint8.
+
+SPACE_CODES = {
+    'BGR': None,
+    'HSV': cv2.COLOR_BGR2HSV,
+    'LAB': cv2.COLOR_BGR2LAB,
+    'YCrCb': cv2.COLOR_BGR2YCrCb,
+}
+
+def _grid_colors(bits, b_values=None):
+    """Semua warna BGR pada grid bits-per-kanal sebagai citra (n, 1, 3) uint8"""
+    step = 1 << (8 - bits)
+    # Pusat sel untuk grid kasar, nilai asli untuk grid penuh 8-bit
+    levels = (np.arange(1 << bits) * step + step // 2).astype(np.uint8)
+    b_levels = levels if b_values is None else levels[b_values]
+    b, g, r = np.meshgrid(b_levels, levels, levels, indexing='ij')
+    return np.stack([b.ravel(), g.ravel(), r.ravel()], axis=1)[:, None, :]
+
+def _evaluate_rule(rule, colors_bgr, space):
+    converted = colors_bgr if SPACE_CODES[space] is None else cv2.cvtColor(colors_bgr, SPACE_CODES[space])
+    # Kanal dinaikkan ke int16 agar aturan seperti |r - g| tidak wrap-around
+    c = converted[:, 0, :].astype(np.int16)
+    return np.asarray(rule(c[:, 0], c[:, 1], c[:, 2]), dtype=bool)
+
+class ColorClassifier:
+    """
+    Kompilasi aturan rule(c0, c1, c2) -> bool (kanal pada ruang warna `space`)
+    menjadi LUT. mode 'lut32' memakai grid 32x32x32 (warna dievaluasi pada
+    pusat sel), mode 'bitset' menyimpan semua 2^24 warna sebagai bitset 2 MB.
+    """
+
+    def __init__(self, rule, space='BGR', mode='lut32'):
+        if space not in SPACE_CODES:
+            raise ValueError(f"Ruang warna '{space}' tidak dikenal (pilih dari {list(SPACE_CODES)})")
+        self.mode = mode
+        if mode == 'lut32':
+            self.lut = np.where(_evaluate_rule(rule, _grid_colors(5), space), 255, 0).astype(np.uint8)
+        elif mode == 'bitset':
+            # Evaluasi per bidang B (65536 warna) agar memori sementara tetap kecil;
+            # bit disusun little-endian sehingga bit ke-(code & 7) ada di byte code >> 3
+            planes = [np.packbits(_evaluate_rule(rule, _grid_colors(8, [bv]), space), bitorder='little')
+                      for bv in range(256)]
+            self.lut = np.concatenate(planes)
+        else:
+            raise ValueError(f"Mode '{mode}' tidak dikenal (pilih 'lut32' atau 'bitset')")
+
+    def classify(self, frame):
+        """Mask uint8 (0/255) untuk frame BGR uint8 (h, w, 3)"""
+        if self.mode == 'lut32':
+            q = frame >> 3
+            idx = q[..., 0].astype(np.uint16)
+            idx <<= 5
+            idx |= q[..., 1]
+            idx <<= 5
+            idx |= q[..., 2]
+            return np.take(self.lut, idx)
+        # RGBA little-endian dibaca sebagai uint32 = R | G<<8 | B<<16 | A<<24,
+        # jadi kode 24-bit (B<<16 | G<<8 | R) didapat tanpa menggeser tiap kanal
+        rgba = cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA)
+        shift = rgba[..., 0] & 7
+        code = rgba.view(np.uint32)[..., 0]
+        code &= 0xFFFFFF
+        code >>= 3
+        mask = np.take(self.lut, code)
+        mask >>= shift
+        mask &= 1
+        mask *= 255
+        return mask
+
+# ==========================================
+# ATURAN DETEKSI KULIT
+# ==========================================
+def skin_rule_rgb(b, g, r):
+    """Aturan kulit RGB klasik (kanal int16, tanpa overflow)"""
+    max_c = np.maximum(r, np.maximum(g, b))
+    min_c = np.minimum(r, np.minimum(g, b))
+    return ((r > 95) & (g > 40) & (b > 20) & ((max_c - min_c) > 15) &
+            (np.abs(r - g) > 15) & (r > g) & (r > b))
+
+def skin_rule_hsv(h, s, v):
+    """Range kulit HSV: H 0-20, S 48-255, V 80-255 (setara cv2.inRange)"""
+    return (h <= 20) & (s >= 48) & (v >= 80)
+
+@lru_cache(maxsize=None)
+def get_skin_classifier(model='RGB', mode='bitset'):
+    """Classifier kulit yang dikompilasi sekali lalu dipakai ulang"""
+    if model == 'RGB':
+        return ColorClassifier(skin_rule_rgb, 'BGR', mode)
+    if model == 'HSV':
+        return ColorClassifier(skin_rule_hsv, 'HSV', mode)
+    raise ValueError(f"Model '{model}' tidak dikenal (pilih 'RGB' atau 'HSV')")
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+
+    for model in ['RGB', 'HSV']:
+        for mode in ['lut32', 'bitset']:
+            t0 = time.perf_counter()
+            clf = get_skin_classifier(model, mode)
+            t_compile = time.perf_counter() - t0
+            clf.classify(frame)
+            t0 = time.perf_counter()
+            for _ in range(10):
+                mask = clf.classify(frame)
+            t_frame = (time.perf_counter() - t0) / 10
+            print(f"{model:<4} {mode:<7} | kompilasi: {t_compile * 1000:7.1f} ms | "
+                  f"1080p: {t_frame * 1000:6.2f} ms/frame ({1 / t_frame:.0f} fps) | kulit: {np.mean(mask > 0):.3f}")
+
+    # Validasi: bitset harus identik dengan evaluasi langsung per piksel
+    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    ref_hsv = cv2.inRange(hsv, np.array([0, 48, 80], np.uint8), np.array([20, 255, 255], np.uint8))
+    c = frame.astype(np.int16)
+    ref_rgb = np.where(skin_rule_rgb(c[..., 0], c[..., 1], c[..., 2]), 255, 0).astype(np.uint8)
+    print("Bitset HSV == cv2.inRange:", np.array_equal(get_skin_classifier('HSV', 'bitset').classify(frame), ref_hsv))
+    print("Bitset RGB == aturan langsung:", np.array_equal(get_skin_classifier('RGB', 'bitset').classify(frame), ref_rgb))
@@ -6,6 +6,13 @@ import cv2
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import signal
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from HistogramCitra import histogram_uint8
+from KuantisasiSkalar import quantize_levels
+from RekonstruksiSinyal import zero_order_hold
+from RuangWarna import ColorSpaceCache, batch_patches, split_batch
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -36,6 +43,9 @@ def create_color_patches():
 
 def analyze_color_model(image, model_name):
     """Analyze image in different color models"""
+    if isinstance(image, ColorSpaceCache):
+        # Konversi di-memo oleh cache: model yang sama tidak dikonversi ulang
+        return image.get(model_name) if model_name in ('HSV', 'LAB', 'GRAY') else image.image
     if model_name == 'RGB':
         return image
     elif model_name == 'HSV':
@@ -59,27 +69,34 @@ color_patches = create_color_patches()
 fig, axes = plt.subplots(4, 8, figsize=(20, 10))
 models = ['RGB', 'HSV', 'LAB', 'GRAY']
 
+# Semua patch digabung menjadi satu strip: satu konversi per model, bukan per patch
+patch_names, patch_strip = batch_patches(color_patches)
+patch_cache = ColorSpaceCache(patch_strip)
+
 for row, model in enumerate(models):
-    for col, (name, patch) in enumerate(color_patches):
-        if model == 'RGB':
-            display_img = cv2.cvtColor(patch, cv2.COLOR_BGR2RGB)
-            axes[row, col].imshow(display_img)
-        elif model == 'GRAY':
-            gray_img = cv2.cvtColor(patch, cv2.COLOR_BGR2GRAY)
-            axes[row, col].imshow(gray_img, cmap='gray')
+    if model == 'RGB':
+        display_strip = patch_cache.get('RGB_DISPLAY')
+    elif model == 'GRAY':
+        display_strip = patch_cache.get('GRAY')
+    else:
+        converted = analyze_color_model(patch_cache, model)
+        if model == 'HSV':
+            # Convert HSV to RGB for display
+            display_strip = cv2.cvtColor(converted, cv2.COLOR_HSV2RGB)
+        elif model == 'LAB':
+            # LAB needs special handling for display
+            lab = converted.astype(np.float32)
+            lab[:,:,0] = lab[:,:,0] * 255/100  # L from [0,100] to [0,255]
+            lab[:,:,1:] = lab[:,:,1:] + 128    # a,b from [-127,127] to [0,255]
+            lab = np.clip(lab, 0, 255).astype(np.uint8)
+            display_strip = cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
+    display_patches = split_batch(display_strip, len(patch_names))
+    
+    for col, name in enumerate(patch_names):
+        if model == 'GRAY':
+            axes[row, col].imshow(display_patches[col], cmap='gray')
         else:
-            converted = analyze_color_model(patch, model)
-            if model == 'HSV':
-                # Convert HSV to RGB for display
-                display_img = cv2.cvtColor(converted, cv2.COLOR_HSV2RGB)
-            elif model == 'LAB':
-                # LAB needs special handling for display
-                lab = converted.astype(np.float32)
-                lab[:,:,0] = lab[:,:,0] * 255/100  # L from [0,100] to [0,255]
-                lab[:,:,1:] = lab[:,:,1:] + 128    # a,b from [-127,127] to [0,255]
-                lab = np.clip(lab, 0, 255).astype(np.uint8)
-                display_img = cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
-            axes[row, col].imshow(display_img)
+            axes[row, col].imshow(display_patches[col])
         
         if row == 0:
             axes[row, col].set_title(name, fontsize=10)
@@ -105,16 +122,17 @@ if sample_img is None:
     cv2.ellipse(sample_img, (300, 200), (80, 40), 30, 0, 360, (0, 0, 255), -1)  # Red
     print("Menggunakan citra sintetik (file sample_image.jpg tidak ditemukan)")
 
-# Convert to different color spaces
-rgb_img = cv2.cvtColor(sample_img, cv2.COLOR_BGR2RGB)
-hsv_img = cv2.cvtColor(sample_img, cv2.COLOR_BGR2HSV)
-lab_img = cv2.cvtColor(sample_img, cv2.COLOR_BGR2LAB)
-gray_img = cv2.cvtColor(sample_img, cv2.COLOR_BGR2GRAY)
+# Convert to different color spaces (lazy, setiap model dikonversi sekali)
+sample_cache = ColorSpaceCache(sample_img)
+rgb_img = sample_cache.get('RGB_DISPLAY')
+hsv_img = sample_cache.get('HSV')
+lab_img = sample_cache.get('LAB')
+gray_img = sample_cache.get('GRAY')
 
-# Split channels for each model
-rgb_channels = cv2.split(sample_img)  # B, G, R
-hsv_channels = cv2.split(hsv_img)     # H, S, V
-lab_channels = cv2.split(lab_img)     # L, a, b
+# Split channels for each model (di-cache, tidak di-split ulang)
+rgb_channels = sample_cache.channels('RGB')  # B, G, R
+hsv_channels = sample_cache.channels('HSV')  # H, S, V
+lab_channels = sample_cache.channels('LAB')  # L, a, b
 
 # Display channel analysis
 fig, axes = plt.subplots(4, 4, figsize=(16, 12))
@@ -230,12 +248,9 @@ def demonstrate_sampling_aliasing():
         indices = (t_sampled * 1000).astype(int)
         signal_sampled = signal_combined[indices]
         
-        # Reconstruction (zero-order hold)
+        # Reconstruction (zero-order hold, searchsorted tanpa loop per sampel)
         t_recon = np.linspace(0, 1, 1000)
-        signal_recon = np.zeros_like(t_recon)
-        for i in range(len(t_sampled)-1):
-            mask = (t_recon >= t_sampled[i]) & (t_recon < t_sampled[i+1])
-            signal_recon[mask] = signal_sampled[i]
+        signal_recon = zero_order_hold(t_sampled, signal_sampled, t_recon)
         
         # Plot
         axes[idx].plot(t, signal_combined, 'b-', alpha=0.5, label='Original')
@@ -279,54 +294,29 @@ def demonstrate_quantization():
     # Uniform quantization
     quantization_levels = [256, 64, 16, 4, 2]  # 8-bit, 6-bit, 4-bit, 2-bit, 1-bit
     
-    fig, axes = plt.subplots(2, 5, figsize=(15, 6))
+    # Histogram dihitung sekali; semua LUT (uniform, equal-probability berbasis CDF,
+    # Lloyd-Max) dibangun dari histogram dan diterapkan ke semua level sekaligus
+    hist = histogram_uint8(test_img)
+    rows = [
+        ('uniform', 'Uniform'),
+        ('equal_probability', 'Non-Uniform (CDF)'),
+        ('lloyd_max', 'Lloyd-Max'),
+    ]
     
-    # Uniform quantization
-    for idx, levels in enumerate(quantization_levels):
-        # Calculate step size
-        step = 256 // levels
-        quantized_uniform = (test_img // step) * step
-        
-        # Display
-        axes[0, idx].imshow(quantized_uniform, cmap='gray', vmin=0, vmax=255)
-        axes[0, idx].set_title(f'Uniform\n{levels} levels\n({int(np.log2(levels))}-bit)')
-        axes[0, idx].axis('off')
-        
-        # Calculate MSE
-        mse = np.mean((test_img.astype(float) - quantized_uniform.astype(float))**2)
-        psnr = 10 * np.log10(255**2 / mse) if mse > 0 else float('inf')
-        axes[0, idx].text(0.5, -0.1, f'MSE: {mse:.1f}\nPSNR: {psnr:.1f}dB', 
-                         transform=axes[0, idx].transAxes, ha='center', fontsize=8)
-    
-    # Non-uniform quantization (using histogram equalization principle)
-    for idx, levels in enumerate(quantization_levels):
-        # Calculate histogram
-        hist, bins = np.histogram(test_img.flatten(), 256, [0, 256])
-        
-        # Calculate cumulative distribution
-        cdf = hist.cumsum()
-        cdf_normalized = cdf / cdf.max()
-        
-        # Create mapping function for non-uniform quantization
-        mapping = np.zeros(256, dtype=np.uint8)
-        for i in range(levels):
-            lower = i * 256 // levels
-            upper = (i + 1) * 256 // levels
-            mapping[lower:upper] = i * 255 // (levels - 1)
-        
-        # Apply non-uniform quantization
-        quantized_nonuniform = mapping[test_img]
-        
-        # Display
-        axes[1, idx].imshow(quantized_nonuniform, cmap='gray', vmin=0, vmax=255)
-        axes[1, idx].set_title(f'Non-Uniform\n{levels} levels')
-        axes[1, idx].axis('off')
-        
-        # Calculate MSE
-        mse = np.mean((test_img.astype(float) - quantized_nonuniform.astype(float))**2)
-        psnr = 10 * np.log10(255**2 / mse) if mse > 0 else float('inf')
-        axes[1, idx].text(0.5, -0.1, f'MSE: {mse:.1f}\nPSNR: {psnr:.1f}dB', 
-                         transform=axes[1, idx].transAxes, ha='center', fontsize=8)
+    fig, axes = plt.subplots(len(rows), 5, figsize=(15, 9))
+    
+    for row, (method, label) in enumerate(rows):
+        result = quantize_levels(test_img, quantization_levels, method, hist=hist)
+        for idx, levels in enumerate(quantization_levels):
+            # Display
+            axes[row, idx].imshow(result['images'][idx], cmap='gray', vmin=0, vmax=255)
+            axes[row, idx].set_title(f'{label}\n{levels} levels\n({int(np.log2(levels))}-bit)')
+            axes[row, idx].axis('off')
+            
+            # MSE & PSNR dihitung dari histogram
+            mse, psnr = result['mse'][idx], result['psnr'][idx]
+            axes[row, idx].text(0.5, -0.1, f'MSE: {mse:.1f}\nPSNR: {psnr:.1f}dB', 
+                                transform=axes[row, idx].transAxes, ha='center', fontsize=8)
     
     plt.suptitle('Perbandingan Kuantisasi Uniform vs Non-Uniform', 
                 fontsize=14, fontweight='bold')
@@ -354,8 +344,11 @@ def demonstrate_color_conversion_applications():
     else:
         demo_img = sample_img
     
+    # Konversi sample_img sudah ada di sample_cache, tidak perlu diulang
+    demo_cache = sample_cache if demo_img is sample_img else ColorSpaceCache(demo_img)
+    
     # Application 1: Skin Detection using HSV
-    hsv_img = cv2.cvtColor(demo_img, cv2.COLOR_BGR2HSV)
+    hsv_img = demo_cache.get('HSV')
     
     # Define skin color range in HSV
     lower_skin = np.array([0, 20, 70], dtype=np.uint8)
@@ -368,8 +361,8 @@ def demonstrate_color_conversion_applications():
     skin_detected = cv2.bitwise_and(demo_img, demo_img, mask=skin_mask)
     
     # Application 2: Shadow removal using LAB
-    lab_img = cv2.cvtColor(demo_img, cv2.COLOR_BGR2LAB)
-    L, a, b = cv2.split(lab_img)
+    lab_img = demo_cache.get('LAB')
+    L, a, b = demo_cache.channels('LAB')
     
     # Apply CLAHE to L channel (improves shadow details)
     clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
@@ -0,0 +1,162 @@
+import cv2
+import numpy as np
+import os
+import csv
+import argparse
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from PengukuranWaktu import time_call
+
+# ==========================================
+# 1. KONVERSI RUANG WARNA: OPENCV vs NUMPY
+# ==========================================
+OPENCV_CODES = {
+    'GRAY': cv2.COLOR_BGR2GRAY,
+    'HSV': cv2.COLOR_BGR2HSV,
+    'LAB': cv2.COLOR_BGR2LAB,
+}
+
+# Bobot ITU-R BT.601 dalam urutan B, G, R
+GRAY_WEIGHTS = np.array([0.114, 0.587, 0.299], dtype=np.float32)
+
+# Matriks sRGB (linear) -> XYZ, dinormalisasi dengan white point D65 (urutan R, G, B)
+RGB2XYZ = np.array([[0.412453, 0.357580, 0.180423],
+                    [0.212671, 0.715160, 0.072169],
+                    [0.019334, 0.119193, 0.950227]], dtype=np.float32)
+RGB2XYZ_D65 = RGB2XYZ / np.array([[0.950456], [1.0], [1.088754]], dtype=np.float32)
+
+# LUT gamma sRGB -> linear untuk input uint8 (gather 256 entri, bukan pow per piksel)
+_c = np.arange(256, dtype=np.float32) / 255
+SRGB_TO_LINEAR = np.where(_c <= 0.04045, _c / 12.92, ((_c + 0.055) / 1.055) ** 2.4).astype(np.float32)
+
+def bgr2gray_numpy(img):
+    return np.rint(img.astype(np.float32) @ GRAY_WEIGHTS).astype(np.uint8)
+
+def bgr2hsv_numpy(img):
+    """BGR -> HSV 8-bit dengan konvensi OpenCV (H 0-179, S/V 0-255)"""
+    # Per kanal kontigu: reduksi max/min pada sumbu terakhir (panjang 3) sangat lambat
+    b, g, r = (np.ascontiguousarray(img[..., i], dtype=np.float32) for i in range(3))
+    v = np.maximum(np.maximum(b, g), r)
+    delta = v - np.minimum(np.minimum(b, g), r)
+    safe = np.where(delta == 0, 1, delta)
+    s = np.where(v > 0, delta * 255 / np.where(v == 0, 1, v), 0)
+    h = np.where(v == r, 60 * (g - b) / safe,
+                 np.where(v == g, 120 + 60 * (b - r) / safe, 240 + 60 * (r - g) / safe))
+    h = np.where(delta == 0, 0, h)
+    h = np.where(h < 0, h + 360, h)
+    out = np.empty_like(img)
+    out[..., 0] = np.rint(h / 2) % 180
+    out[..., 1] = np.rint(s)
+    out[..., 2] = v
+    return out
+
+def bgr2lab_numpy(img):
+    """BGR -> LAB 8-bit dengan konvensi OpenCV (L*255/100, a+128, b+128)"""
+    lin = SRGB_TO_LINEAR[img[..., ::-1]]
+    xyz = lin @ RGB2XYZ_D65.T
+    fxyz = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16 / 116)
+    y = xyz[..., 1]
+    L = np.where(y > 0.008856, 116 * fxyz[..., 1] - 16, 903.3 * y)
+    out = np.empty_like(img)
+    out[..., 0] = np.clip(np.rint(L * 255 / 100), 0, 255)
+    out[..., 1] = np.clip(np.rint(500 * (fxyz[..., 0] - fxyz[..., 1]) + 128), 0, 255)
+    out[..., 2] = np.clip(np.rint(200 * (fxyz[..., 1] - fxyz[..., 2]) + 128), 0, 255)
+    return out
+
+NUMPY_CONVERSIONS = {
+    'GRAY': bgr2gray_numpy,
+    'HSV': bgr2hsv_numpy,
+    'LAB': bgr2lab_numpy,
+}
+
+# ==========================================
+# 2. TIMING (WARM-UP + PENGULANGAN)
+# ==========================================
+def time_conversion(img, conversion, warmup=2, repeats=10):
+    """Waktu median satu konversi OpenCV (dipakai juga oleh process_and_analyze)"""
+    code = OPENCV_CODES[conversion]
+    return time_call(lambda: cv2.cvtColor(img, code), warmup, repeats)[1]
+
+def conversion_backends(img, conversion):
+    """Tiga varian yang dibandingkan untuk satu citra & konversi"""
+    code = OPENCV_CODES[conversion]
+    # Buffer tujuan dialokasikan sekali lalu dipakai ulang lewat dst=
+    dst = cv2.cvtColor(img, code)
+    return {
+        'opencv': lambda: cv2.cvtColor(img, code),
+        'opencv-dst': lambda: cv2.cvtColor(img, code, dst=dst),
+        'numpy': lambda: NUMPY_CONVERSIONS[conversion](img),
+    }
+
+# ==========================================
+# 3. BENCHMARK BATCH
+# ==========================================
+def benchmark_conversions(images, resolutions=(480, 1080, 2160), thread_counts=(1, 0),
+                          conversions=('GRAY', 'HSV', 'LAB'), warmup=2, repeats=10):
+    """
+    Jalankan setiap konversi pada semua citra & resolusi (tinggi piksel, rasio
+    aspek dipertahankan) untuk setiap jumlah thread OpenCV. Throughput (MP/s)
+    dihitung dari total piksel / total waktu median seluruh citra.
+    thread_count 0 = default OpenCV (semua core).
+    """
+    default_threads = cv2.getNumThreads()
+    rows = []
+    try:
+        for height in resolutions:
+            batch = [cv2.resize(img, (int(img.shape[1] * height / img.shape[0]), height),
+                                interpolation=cv2.INTER_AREA) for img in images]
+            megapixels = sum(img.shape[0] * img.shape[1] for img in batch) / 1e6
+            for threads in thread_counts:
+                cv2.setNumThreads(threads if threads > 0 else default_threads)
+                for conversion in conversions:
+                    totals = {}
+                    for img in batch:
+                        for backend, func in conversion_backends(img, conversion).items():
+                            totals[backend] = totals.get(backend, 0.0) + time_call(func, warmup, repeats)[1]
+                    for backend, total in totals.items():
+                        rows.append({
+                            'Resolution': f"{height}p",
+                            'Threads': threads if threads > 0 else default_threads,
+                            'Conversion': conversion,
+                            'Backend': backend,
+                            'Images': len(batch),
+                            'Time_ms': round(total * 1000, 3),
+                            'MPps': round(megapixels / total, 1),
+                        })
+    finally:
+        cv2.setNumThreads(default_threads)
+    return rows
+
+def print_table(rows):
+    print(f"{'Res':<6} | {'Thr':<3} | {'Konversi':<8} | {'Backend':<10} | {'Waktu (ms)':<10} | {'MP/s':<8}")
+    print("-" * 60)
+    for r in rows:
+        print(f"{r['Resolution']:<6} | {r['Threads']:<3} | {r['Conversion']:<8} | {r['Backend']:<10} | {r['Time_ms']:<10} | {r['MPps']:<8}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark konversi ruang warna (MP/s)")
+    parser.add_argument("images", nargs="*", default=['terang.jpg', 'normal.jpg', 'redup.jpg'])
+    parser.add_argument("--resolutions", type=int, nargs="+", default=[480, 1080, 2160])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 0])
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--csv", default=None)
+    args = parser.parse_args()
+
+    images = [img for img in (cv2.imread(p) for p in args.images if os.path.exists(p)) if img is not None]
+    if not images:
+        print(f"Error: Tidak ada citra yang bisa dibaca dari {args.images}")
+    else:
+        # Cek kesesuaian implementasi NumPy terhadap OpenCV
+        for name, func in NUMPY_CONVERSIONS.items():
+            ref = cv2.cvtColor(images[0], OPENCV_CODES[name]).astype(np.int16)
+            diff = np.abs(func(images[0]).astype(np.int16) - ref)
+            if name == 'HSV':
+                diff[..., 0] = np.minimum(diff[..., 0], 180 - diff[..., 0])
+            print(f"Selisih maksimum NumPy vs OpenCV ({name}): {diff.max()}")
+        rows = benchmark_conversions(images, args.resolutions, args.threads, repeats=args.repeats)
+        print_table(rows)
+        if args.csv:
+            with open(args.csv, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+                writer.writeheader()
+                writer.writerows(rows)
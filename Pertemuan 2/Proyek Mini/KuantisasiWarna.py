@@ -0,0 +1,309 @@
+import numpy as np
+import time
+
+# ==========================================
+# KUANTISASI WARNA CEPAT (K-MEANS PADA HISTOGRAM)
+# ==========================================
+# Palet di-fit pada histogram warna 3-D (32x32x32 bin, tiap bin menyimpan
+# rata-rata warna dan jumlah piksel) atau pada sampel piksel acak, bukan pada
+# seluruh piksel. Assignment semua piksel memakai LUT RGB->palet 32^3.
+
+LUT_BITS = 5  # 5 bit per kanal -> 32^3 = 32768 entri
+
+def color_codes(image, bits=LUT_BITS):
+    """Kode bin 3-D (int32) untuk setiap piksel citra uint8 (h, w, 3)"""
+    shift = 8 - bits
+    c = image.reshape(-1, 3)
+    return (((c[:, 0] >> shift).astype(np.int32) << (2 * bits))
+            | ((c[:, 1] >> shift).astype(np.int32) << bits)
+            | (c[:, 2] >> shift).astype(np.int32))
+
+def color_histogram(image, bits=LUT_BITS):
+    """Histogram warna kompak: (warna rata-rata per bin float32, jumlah piksel)"""
+    codes = color_codes(image, bits)
+    n_bins = 1 << (3 * bits)
+    counts = np.bincount(codes, minlength=n_bins)
+    pixels = image.reshape(-1, 3)
+    sums = np.stack([np.bincount(codes, weights=pixels[:, ch], minlength=n_bins)
+                     for ch in range(3)], axis=1)
+    used = counts > 0
+    colors = (sums[used] / counts[used, None]).astype(np.float32)
+    return colors, counts[used].astype(np.float32)
+
+def sample_pixels(image, n_samples=20000, seed=42):
+    """Sampel piksel acak (float32) beserta bobot 1"""
+    pixels = image.reshape(-1, 3)
+    rng = np.random.default_rng(seed)
+    n = min(n_samples, len(pixels))
+    idx = rng.choice(len(pixels), n, replace=False)
+    return pixels[idx].astype(np.float32), np.ones(n, dtype=np.float32)
+
+def nearest_centroid(points, centroids):
+    """Indeks centroid terdekat (jarak Euclid kuadrat, tervektorisasi)"""
+    d = (np.sum(points ** 2, axis=1)[:, None]
+         - 2 * points @ centroids.T
+         + np.sum(centroids ** 2, axis=1)[None, :])
+    return np.argmin(d, axis=1)
+
+def kmeans_plus_plus(points, weights, k, rng):
+    """Inisialisasi k-means++ berbobot"""
+    centroids = np.empty((k, points.shape[1]), dtype=np.float32)
+    prob = weights / weights.sum()
+    centroids[0] = points[rng.choice(len(points), p=prob)]
+    d2 = np.sum((points - centroids[0]) ** 2, axis=1)
+    for i in range(1, k):
+        w = d2 * weights
+        total = w.sum()
+        if total <= 0:
+            # Warna unik lebih sedikit dari k: isi sisa dengan centroid yang sama
+            centroids[i:] = centroids[i - 1]
+            break
+        centroids[i] = points[rng.choice(len(points), p=w / total)]
+        d2 = np.minimum(d2, np.sum((points - centroids[i]) ** 2, axis=1))
+    return centroids
+
+def fit_palette(points, weights, n_colors=16, batch_size=1024, max_iter=100,
+                refine_iter=5, seed=42):
+    """Mini-batch k-means berbobot (float32) + beberapa iterasi Lloyd penuh"""
+    rng = np.random.default_rng(seed)
+    points = points.astype(np.float32)
+    weights = weights.astype(np.float32)
+    k = min(n_colors, len(points))
+    centroids = kmeans_plus_plus(points, weights, k, rng)
+
+    # Mini-batch: sampel berbobot, learning rate per centroid = 1 / jumlah
+    prob = weights / weights.sum()
+    seen = np.zeros(k, dtype=np.float32)
+    for _ in range(max_iter):
+        idx = rng.choice(len(points), min(batch_size, len(points)), p=prob)
+        batch = points[idx]
+        labels = nearest_centroid(batch, centroids)
+        counts = np.bincount(labels, minlength=k).astype(np.float32)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, batch)
+        seen += counts
+        hit = counts > 0
+        lr = counts[hit] / seen[hit]
+        centroids[hit] += lr[:, None] * (sums[hit] / counts[hit, None] - centroids[hit])
+
+    # Refinement Lloyd penuh (murah karena titik = bin histogram)
+    for _ in range(refine_iter):
+        labels = nearest_centroid(points, centroids)
+        w = np.bincount(labels, weights=weights, minlength=k)
+        hit = w > 0
+        for ch in range(points.shape[1]):
+            s = np.bincount(labels, weights=weights * points[:, ch], minlength=k)
+            centroids[hit, ch] = s[hit] / w[hit]
+    return centroids
+
+def build_palette_lut(palette, bits=LUT_BITS):
+    """LUT RGB->indeks palet untuk setiap pusat bin 3-D"""
+    levels = np.arange(1 << bits, dtype=np.float32) * (1 << (8 - bits)) + (1 << (8 - bits)) / 2
+    r, g, b = np.meshgrid(levels, levels, levels, indexing='ij')
+    centers = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
+    return nearest_centroid(centers, palette.astype(np.float32)).astype(np.uint8)
+
+def assign_pixels(image, palette, use_lut=True, chunk=1 << 18):
+    """Label palet untuk seluruh piksel: via LUT atau nearest-centroid eksak per chunk"""
+    h, w = image.shape[:2]
+    if use_lut:
+        return build_palette_lut(palette)[color_codes(image)].reshape(h, w)
+    pixels = image.reshape(-1, 3)
+    labels = np.empty(len(pixels), dtype=np.uint8)
+    pal = palette.astype(np.float32)
+    for i in range(0, len(pixels), chunk):
+        labels[i:i + chunk] = nearest_centroid(pixels[i:i + chunk].astype(np.float32), pal)
+    return labels.reshape(h, w)
+
+def kmeans_quantize(image, n_colors=16, method='histogram', use_lut=True,
+                    n_samples=20000, seed=42):
+    """
+    Kuantisasi warna k-means cepat untuk citra uint8 (h, w, 3).
+    method: 'histogram' (fit pada histogram warna) atau 'sample' (sampel acak).
+    Mengembalikan (citra terkuantisasi, label, palet uint8).
+    """
+    if method == 'histogram':
+        points, weights = color_histogram(image)
+    elif method == 'sample':
+        points, weights = sample_pixels(image, n_samples, seed)
+    else:
+        raise ValueError(f"Metode '{method}' tidak dikenal (pilih 'histogram' atau 'sample')")
+    palette = np.clip(np.rint(fit_palette(points, weights, n_colors, seed=seed)), 0, 255).astype(np.uint8)
+    labels = assign_pixels(image, palette, use_lut)
+    return palette[labels], labels, palette
+
+# ==========================================
+# MEDIAN-CUT & OCTREE (DETERMINISTIK, BERBASIS HISTOGRAM)
+# ==========================================
+def median_cut_palette(colors, counts, n_colors=16):
+    """Median-cut berbobot: belah box dengan rentang terbesar di median piksel"""
+    boxes = [np.arange(len(colors))]
+    while len(boxes) < n_colors:
+        # Pilih box dengan (rentang kanal terbesar x jumlah piksel) tertinggi
+        best, best_score, best_ch = -1, 0.0, 0
+        for i, idx in enumerate(boxes):
+            if len(idx) < 2:
+                continue
+            ranges = np.ptp(colors[idx], axis=0)
+            ch = int(np.argmax(ranges))
+            score = ranges[ch] * counts[idx].sum()
+            if score > best_score:
+                best, best_score, best_ch = i, score, ch
+        if best < 0:
+            break
+        idx = boxes.pop(best)
+        idx = idx[np.argsort(colors[idx, best_ch], kind='stable')]
+        cum = np.cumsum(counts[idx])
+        cut = int(np.searchsorted(cum, cum[-1] / 2))
+        cut = min(max(cut, 1), len(idx) - 1)
+        boxes.extend([idx[:cut], idx[cut:]])
+    return np.array([np.average(colors[idx], axis=0, weights=counts[idx]) for idx in boxes],
+                    dtype=np.float32)
+
+def octree_palette(colors, counts, n_colors=16, max_depth=LUT_BITS):
+    """
+    Octree reduction: mulai dari daun di kedalaman max_depth, lalu gabungkan
+    node parent dengan jumlah piksel terkecil (level terdalam dulu) sampai
+    jumlah daun <= n_colors.
+    """
+    rgb = np.clip(np.rint(colors), 0, 255).astype(np.int32)
+
+    def node_code(d):
+        s = 8 - d
+        return ((rgb[:, 0] >> s) << (2 * d)) | ((rgb[:, 1] >> s) << d) | (rgb[:, 2] >> s)
+
+    codes = {d: node_code(d) for d in range(max_depth + 1)}
+    depth = np.full(len(rgb), max_depth, dtype=np.int32)
+
+    def leaf_ids():
+        # Kode daun unik global: kedalaman disisipkan di bit teratas
+        key = np.choose(depth, [codes[d] for d in range(max_depth + 1)])
+        return np.unique((depth.astype(np.int64) << 32) | key, return_inverse=True)
+
+    for d in range(max_depth, 0, -1):
+        leaves, _ = leaf_ids()
+        excess = len(leaves) - n_colors
+        if excess <= 0:
+            break
+        at_d = depth == d
+        parent = codes[d - 1][at_d]
+        child = codes[d][at_d]
+        # Per parent: jumlah anak (daun) dan total piksel
+        pairs = np.unique((parent.astype(np.int64) << 32) | child)
+        parents, n_children = np.unique(pairs >> 32, return_counts=True)
+        p_idx = np.searchsorted(parents, parent)
+        weight = np.bincount(p_idx, weights=counts[at_d], minlength=len(parents))
+        order = np.argsort(weight, kind='stable')
+        gain = np.cumsum(n_children[order] - 1)
+        n_merge = min(int(np.searchsorted(gain, excess)) + 1, len(order))
+        merged = np.zeros(len(parents), dtype=bool)
+        merged[order[:n_merge]] = True
+        sel = np.flatnonzero(at_d)[merged[p_idx]]
+        depth[sel] = d - 1
+
+    _, inv = leaf_ids()
+    w = np.bincount(inv, weights=counts)
+    palette = np.stack([np.bincount(inv, weights=counts * colors[:, ch]) / w for ch in range(3)], axis=1)
+    return palette.astype(np.float32)
+
+# ==========================================
+# FLOYD-STEINBERG DITHERING (WAVEFRONT)
+# ==========================================
+def floyd_steinberg_dither(image, palette):
+    """
+    Dithering Floyd-Steinberg eksak. Piksel (y, x) hanya bergantung pada
+    t = x + 2y yang lebih kecil, jadi semua baris diproses bersamaan per
+    gelombang t (vektorisasi lintas baris, W + 2H langkah, bukan H x W).
+    """
+    h, w = image.shape[:2]
+    buf = np.zeros((h + 1, w + 2, 3), dtype=np.float32)
+    buf[:h, 1:w + 1] = image
+    labels = np.empty((h, w), dtype=np.uint8)
+    pal = palette.astype(np.float32)
+    all_rows = np.arange(h)
+    for t in range(w + 2 * (h - 1)):
+        y0 = max(0, (t - w + 2) // 2)
+        y1 = min(h - 1, t // 2)
+        ys = all_rows[y0:y1 + 1]
+        xs = t - 2 * ys
+        old = np.clip(buf[ys, xs + 1], 0, 255)
+        idx = nearest_centroid(old, pal)
+        labels[ys, xs] = idx
+        err = old - pal[idx]
+        buf[ys, xs + 2] += err * (7 / 16)
+        buf[ys + 1, xs] += err * (3 / 16)
+        buf[ys + 1, xs + 1] += err * (5 / 16)
+        buf[ys + 1, xs + 2] += err * (1 / 16)
+    return labels
+
+def palette_quantize(image, n_colors=16, method='median_cut', dither=False):
+    """
+    Kuantisasi deterministik dari histogram warna kompak.
+    method: 'median_cut' atau 'octree'. Mengembalikan (citra, label, palet uint8).
+    """
+    colors, counts = color_histogram(image)
+    if method == 'median_cut':
+        palette = median_cut_palette(colors, counts, n_colors)
+    elif method == 'octree':
+        palette = octree_palette(colors, counts, n_colors)
+    else:
+        raise ValueError(f"Metode '{method}' tidak dikenal (pilih 'median_cut' atau 'octree')")
+    palette = np.clip(np.rint(palette), 0, 255).astype(np.uint8)
+    labels = floyd_steinberg_dither(image, palette) if dither else assign_pixels(image, palette)
+    return palette[labels], labels, palette
+
+# ==========================================
+# PENYIMPANAN TERKOMPRESI (PALET + INDEKS BIT-PACKED)
+# ==========================================
+def encode_packed(labels, palette):
+    """
+    Simpan indeks palet dengan ceil(log2(jumlah level)) bit per indeks.
+    Indeks dipecah per bit-plane lalu dipadatkan dengan np.packbits.
+    labels: array indeks uint8 (mis. (h, w) untuk palet warna atau (h, w, 3)
+    untuk level per kanal), palette: nilai untuk setiap indeks. Level per
+    kanal yang berbeda tiap kanal memakai palet (n, 3) bersama labels (h, w, 3).
+    """
+    bits = max(1, int(np.ceil(np.log2(max(len(palette), 2)))))
+    flat = np.ascontiguousarray(labels, dtype=np.uint8).reshape(-1)
+    planes = np.stack([np.packbits((flat >> b) & 1) for b in range(bits)])
+    return {'shape': labels.shape, 'bits': bits,
+            'palette': np.asarray(palette, dtype=np.uint8).copy(), 'planes': planes}
+
+def decode_packed(packed):
+    """Kebalikan encode_packed: kembalikan citra terkuantisasi (palette[labels])"""
+    n = int(np.prod(packed['shape']))
+    labels = np.zeros(n, dtype=np.uint8)
+    for b, plane in enumerate(packed['planes']):
+        labels |= np.unpackbits(plane, count=n) << b
+    labels = labels.reshape(packed['shape'])
+    palette = packed['palette']
+    if palette.ndim == 2 and labels.ndim == 3:
+        # Palet per kanal: kanal c memakai kolom c
+        return palette[labels, np.arange(palette.shape[1])]
+    return palette[labels]
+
+def packed_nbytes(packed):
+    """Ukuran sebenarnya (bytes) dari representasi packed, tanpa menyalin data"""
+    return packed['planes'].nbytes + packed['palette'].nbytes
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    demo = rng.integers(0, 256, (2000, 3000, 3), dtype=np.uint8)
+    for method in ['histogram', 'sample']:
+        t0 = time.perf_counter()
+        quantized, labels, palette = kmeans_quantize(demo, 16, method)
+        dt = time.perf_counter() - t0
+        mse = np.mean((demo.astype(np.float32) - quantized) ** 2)
+        packed = encode_packed(labels, palette)
+        assert np.array_equal(decode_packed(packed), quantized)
+        print(f"{method:<10} | 6 MP -> 16 warna | {dt:.3f} detik | MSE: {mse:.1f} | "
+              f"{demo.nbytes} -> {packed_nbytes(packed)} bytes")
+    for method in ['median_cut', 'octree']:
+        t0 = time.perf_counter()
+        quantized, labels, palette = palette_quantize(demo, 16, method)
+        dt = time.perf_counter() - t0
+        mse = np.mean((demo.astype(np.float32) - quantized) ** 2)
+        packed = encode_packed(labels, palette)
+        assert np.array_equal(decode_packed(packed), quantized)
+        print(f"{method:<10} | 6 MP -> 16 warna | {dt:.3f} detik | MSE: {mse:.1f} | "
+              f"{demo.nbytes} -> {packed_nbytes(packed)} bytes")
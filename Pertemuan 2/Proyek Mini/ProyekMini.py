@@ -3,32 +3,87 @@ import numpy as np
 import matplotlib.pyplot as plt
 import time
 import sys
-from sklearn.cluster import KMeans
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from KuantisasiSkalar import quantize_channels, index_tables, apply_channel_tables
+from HistogramCitra import channel_histograms
+from KuantisasiWarna import kmeans_quantize, palette_quantize, encode_packed, packed_nbytes
+from BenchmarkKonversiWarna import time_conversion
 
-def calculate_metrics(original_data, processed_data, start_time, end_time):
-    mem_before = sys.getsizeof(original_data.tobytes())
-    mem_after = sys.getsizeof(processed_data.tobytes())
+def calculate_metrics(original_data, packed_data, start_time, end_time):
+    # nbytes tidak menyalin citra; ukuran sesudah = palet + indeks bit-packed
+    mem_before = original_data.nbytes
+    mem_after = packed_nbytes(packed_data)
     compression_ratio = mem_before / mem_after if mem_after > 0 else 0
     calc_time = end_time - start_time
     return mem_before, mem_after, compression_ratio, calc_time
 
 def uniform_quantization(image, levels=16):
     start = time.time()
-    h, w, c = image.shape
     factor = 256 // levels
-    quantized = (image // factor) * factor
+    indices = image // factor
+    quantized = indices * factor
+    # Palet per kanal: level ke-i bernilai i * factor. Indeks tertinggi adalah 255 // factor,
+    # yang sama dengan `levels` jika 256 tidak habis dibagi levels (mis. levels=10)
+    packed = encode_packed(indices, np.arange(255 // factor + 1) * factor)
     end = time.time()
-    return quantized, start, end
+    return quantized, packed, start, end
+
+def lloyd_max_quantization(image, levels=16):
+    start = time.time()
+    # Level per kanal dioptimalkan (MSE minimum) pada histogram 256-bin tiap kanal
+    hist = channel_histograms(image)
+    result = quantize_channels(image, levels, method='lloyd_max', hist=hist)
+    quantized = result['image']
+    # Palet (n, 3): kolom c berisi level kanal c, indeks diambil lewat LUT indeks per kanal
+    lut, palette = index_tables(hist, result['tables'])
+    packed = encode_packed(apply_channel_tables(image, lut), palette)
+    end = time.time()
+    return quantized, packed, start, end
 
 def nonuniform_quantization(image, n_clusters=16):
     start = time.time()
-    h, w, c = image.shape
-    image_2d = image.reshape(h * w, c)
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10).fit(image_2d)
-    quantized_2d = kmeans.cluster_centers_[kmeans.labels_]
-    quantized_image = quantized_2d.reshape(h, w, c).astype('uint8')
+    # Palet di-fit pada histogram warna, assignment via LUT RGB->palet
+    quantized_image, labels, palette = kmeans_quantize(image, n_colors=n_clusters, method='histogram')
+    packed = encode_packed(labels, palette)
+    end = time.time()
+    return quantized_image, packed, start, end
+
+def median_cut_quantization(image, n_colors=16, dither=False):
+    start = time.time()
+    quantized_image, labels, palette = palette_quantize(image, n_colors=n_colors, method='median_cut', dither=dither)
+    packed = encode_packed(labels, palette)
     end = time.time()
-    return quantized_image, start, end
+    return quantized_image, packed, start, end
+
+def octree_quantization(image, n_colors=16, dither=False):
+    start = time.time()
+    quantized_image, labels, palette = palette_quantize(image, n_colors=n_colors, method='octree', dither=dither)
+    packed = encode_packed(labels, palette)
+    end = time.time()
+    return quantized_image, packed, start, end
+
+def calculate_psnr(original_data, processed_data):
+    mse = np.mean((original_data.astype(np.float32) - processed_data.astype(np.float32)) ** 2)
+    return 10 * np.log10(255 ** 2 / mse) if mse > 0 else float('inf')
+
+def pick_fastest_quantizer(image, psnr_target=30.0, n_colors=16):
+    """Pilih kuantizer tercepat yang PSNR-nya >= target (fallback: PSNR tertinggi)"""
+    candidates = {
+        'Uniform': lambda img: uniform_quantization(img, n_colors),
+        'Lloyd-Max': lambda img: lloyd_max_quantization(img, n_colors),
+        'K-Means': lambda img: nonuniform_quantization(img, n_colors),
+        'Median-Cut': lambda img: median_cut_quantization(img, n_colors),
+        'Octree': lambda img: octree_quantization(img, n_colors),
+    }
+    results = []
+    for name, quantizer in candidates.items():
+        quantized, packed, start, end = quantizer(image)
+        _, _, _, calc_time = calculate_metrics(image, packed, start, end)
+        results.append((name, calc_time, calculate_psnr(image, quantized)))
+    passed = [r for r in results if r[2] >= psnr_target]
+    best = min(passed, key=lambda r: r[1]) if passed else max(results, key=lambda r: r[2])
+    return best, results
 
 def process_and_analyze(image_paths):
     for path in image_paths:
@@ -40,48 +95,67 @@ def process_and_analyze(image_paths):
         img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
         
         # 1. Konversi Ruang Warna
-        t0 = time.time()
-        img_gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-        t1 = time.time()
-        
-        t2 = time.time()
-        img_hsv = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2HSV)
-        t3 = time.time()
-        
-        t4 = time.time()
-        img_lab = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2LAB)
-        t5 = time.time()
+        # Median dari beberapa pengulangan (dengan warm-up), bukan satu pasang time.time()
+        t_gray = time_conversion(img_bgr, 'GRAY')
+        t_hsv = time_conversion(img_bgr, 'HSV')
+        t_lab = time_conversion(img_bgr, 'LAB')
+        megapixels = img_bgr.shape[0] * img_bgr.shape[1] / 1e6
 
         print(f"\n--- Analisis untuk {path} ---")
-        print(f"Waktu Konversi RGB ke Grayscale: {t1-t0:.5f} detik")
-        print(f"Waktu Konversi RGB ke HSV: {t3-t2:.5f} detik")
-        print(f"Waktu Konversi RGB ke LAB: {t5-t4:.5f} detik")
+        print(f"Waktu Konversi RGB ke Grayscale: {t_gray:.5f} detik ({megapixels / t_gray:.1f} MP/s)")
+        print(f"Waktu Konversi RGB ke HSV: {t_hsv:.5f} detik ({megapixels / t_hsv:.1f} MP/s)")
+        print(f"Waktu Konversi RGB ke LAB: {t_lab:.5f} detik ({megapixels / t_lab:.1f} MP/s)")
 
         # 2. Implementasi Kuantisasi pada RGB (sebagai contoh perbandingan metrik)
         # Kuantisasi Uniform
-        quant_uni_rgb, s_uni, e_uni = uniform_quantization(img_rgb, 16)
-        mem_b_uni, mem_a_uni, cr_uni, time_uni = calculate_metrics(img_rgb, quant_uni_rgb, s_uni, e_uni)
+        quant_uni_rgb, packed_uni, s_uni, e_uni = uniform_quantization(img_rgb, 16)
+        mem_b_uni, mem_a_uni, cr_uni, time_uni = calculate_metrics(img_rgb, packed_uni, s_uni, e_uni)
         
         print("\nParameter Teknis Kuantisasi Uniform (RGB 256 -> 16 level):")
         print(f"Memori Sebelum: {mem_b_uni} bytes | Sesudah: {mem_a_uni} bytes")
         print(f"Rasio Kompresi: {cr_uni:.2f}x | Waktu: {time_uni:.5f} detik")
 
+        # Kuantisasi Lloyd-Max per kanal (level optimal dari histogram, jumlah level sama)
+        quant_lm_rgb, packed_lm, s_lm, e_lm = lloyd_max_quantization(img_rgb, 16)
+        mem_b_lm, mem_a_lm, cr_lm, time_lm = calculate_metrics(img_rgb, packed_lm, s_lm, e_lm)
+
+        print("\nParameter Teknis Kuantisasi Lloyd-Max (RGB 256 -> 16 level per kanal):")
+        print(f"Memori Sebelum: {mem_b_lm} bytes | Sesudah: {mem_a_lm} bytes")
+        print(f"Rasio Kompresi: {cr_lm:.2f}x | Waktu: {time_lm:.5f} detik | "
+              f"PSNR: {calculate_psnr(img_rgb, quant_lm_rgb):.2f} dB (Uniform: {calculate_psnr(img_rgb, quant_uni_rgb):.2f} dB)")
+
         # Kuantisasi Non-Uniform (K-Means)
-        # Catatan: K-Means memakan waktu lebih lama, resize dilakukan agar lebih cepat jika diperlukan
-        scale_percent = 50 
-        w = int(img_rgb.shape[1] * scale_percent / 100)
-        h = int(img_rgb.shape[0] * scale_percent / 100)
-        img_rgb_small = cv2.resize(img_rgb, (w, h), interpolation=cv2.INTER_AREA)
+        # K-Means di-fit pada histogram warna, jadi citra resolusi penuh bisa langsung diproses
+        quant_nonuni_rgb, packed_non, s_non, e_non = nonuniform_quantization(img_rgb, 16)
+        mem_b_non, mem_a_non, cr_non, time_non = calculate_metrics(img_rgb, packed_non, s_non, e_non)
         
-        quant_nonuni_rgb, s_non, e_non = nonuniform_quantization(img_rgb_small, 16)
-        mem_b_non, mem_a_non, cr_non, time_non = calculate_metrics(img_rgb_small, quant_nonuni_rgb, s_non, e_non)
-        
-        print("\nParameter Teknis Kuantisasi Non-Uniform (K-Means 16 clusters, skala 50%):")
+        print("\nParameter Teknis Kuantisasi Non-Uniform (K-Means 16 clusters, resolusi penuh):")
         print(f"Memori Sebelum: {mem_b_non} bytes | Sesudah: {mem_a_non} bytes")
         print(f"Rasio Kompresi: {cr_non:.2f}x | Waktu: {time_non:.5f} detik")
 
+        # Kuantisasi Median-Cut & Octree (deterministik, dari histogram warna)
+        quant_mc_rgb, packed_mc, s_mc, e_mc = median_cut_quantization(img_rgb, 16)
+        mem_b_mc, mem_a_mc, cr_mc, time_mc = calculate_metrics(img_rgb, packed_mc, s_mc, e_mc)
+        
+        print("\nParameter Teknis Kuantisasi Median-Cut (16 warna):")
+        print(f"Memori Sebelum: {mem_b_mc} bytes | Sesudah: {mem_a_mc} bytes")
+        print(f"Rasio Kompresi: {cr_mc:.2f}x | Waktu: {time_mc:.5f} detik | PSNR: {calculate_psnr(img_rgb, quant_mc_rgb):.2f} dB")
+
+        quant_oct_rgb, packed_oct, s_oct, e_oct = octree_quantization(img_rgb, 16)
+        mem_b_oct, mem_a_oct, cr_oct, time_oct = calculate_metrics(img_rgb, packed_oct, s_oct, e_oct)
+        
+        print("\nParameter Teknis Kuantisasi Octree (16 warna):")
+        print(f"Memori Sebelum: {mem_b_oct} bytes | Sesudah: {mem_a_oct} bytes")
+        print(f"Rasio Kompresi: {cr_oct:.2f}x | Waktu: {time_oct:.5f} detik | PSNR: {calculate_psnr(img_rgb, quant_oct_rgb):.2f} dB")
+
+        # Pilih kuantizer tercepat yang memenuhi target PSNR
+        psnr_target = 28.0
+        (best_name, best_time, best_psnr), _ = pick_fastest_quantizer(img_rgb, psnr_target, 16)
+        print(f"\nKuantizer tercepat dengan PSNR >= {psnr_target} dB: {best_name} "
+              f"({best_time:.5f} detik, PSNR {best_psnr:.2f} dB)")
+
         # 3. Visualisasi (Kualitas Subjektif & Histogram)
-        fig, axes = plt.subplots(2, 3, figsize=(15, 8))
+        fig, axes = plt.subplots(2, 6, figsize=(30, 8))
         fig.suptitle(f'Visualisasi Kuantisasi & Histogram - {path} (Zahran - 24343077)')
         
         # Original
@@ -95,12 +169,30 @@ def process_and_analyze(image_paths):
         axes[0, 1].set_title("Uniform Quantization (16)")
         axes[1, 1].hist(quant_uni_rgb.ravel(), 256, [0, 256], color='gray')
         axes[1, 1].set_title("Histogram Uniform")
+
+        # Lloyd-Max
+        axes[0, 2].imshow(quant_lm_rgb)
+        axes[0, 2].set_title("Lloyd-Max (16 per kanal)")
+        axes[1, 2].hist(quant_lm_rgb.ravel(), 256, [0, 256], color='gray')
+        axes[1, 2].set_title("Histogram Lloyd-Max")
         
         # Non-Uniform
-        axes[0, 2].imshow(quant_nonuni_rgb)
-        axes[0, 2].set_title("Non-Uniform (K-Means)")
-        axes[1, 2].hist(quant_nonuni_rgb.ravel(), 256, [0, 256], color='gray')
-        axes[1, 2].set_title("Histogram Non-Uniform")
+        axes[0, 3].imshow(quant_nonuni_rgb)
+        axes[0, 3].set_title("Non-Uniform (K-Means)")
+        axes[1, 3].hist(quant_nonuni_rgb.ravel(), 256, [0, 256], color='gray')
+        axes[1, 3].set_title("Histogram Non-Uniform")
+        
+        # Median-Cut
+        axes[0, 4].imshow(quant_mc_rgb)
+        axes[0, 4].set_title("Median-Cut (16)")
+        axes[1, 4].hist(quant_mc_rgb.ravel(), 256, [0, 256], color='gray')
+        axes[1, 4].set_title("Histogram Median-Cut")
+        
+        # Octree
+        axes[0, 5].imshow(quant_oct_rgb)
+        axes[0, 5].set_title("Octree (16)")
+        axes[1, 5].hist(quant_oct_rgb.ravel(), 256, [0, 256], color='gray')
+        axes[1, 5].set_title("Histogram Octree")
         
         plt.tight_layout()
         plt.show()
@@ -0,0 +1,107 @@
+import numpy as np
+import time
+
+# ==========================================
+# SAMPLING & REKONSTRUKSI SINYAL 1-D
+# ==========================================
+# Semua fungsi tervektorisasi (tanpa loop per sampel) sehingga sinyal jutaan
+# titik dan sweep banyak sampling rate bisa diproses dalam satu panggilan.
+
+def sample_signal(signal_fn, fs, duration=1.0, t0=0.0):
+    """Sampling sinyal kontinu signal_fn(t) dengan frekuensi fs pada [t0, t0+duration)"""
+    t_sampled = t0 + np.arange(int(np.ceil(duration * fs - 1e-9))) / fs
+    return t_sampled, signal_fn(t_sampled)
+
+def zero_order_hold(t_sampled, samples, t_eval):
+    """ZOH: setiap titik t_eval memakai sampel terakhir dengan t_sampled <= t (via searchsorted)"""
+    idx = np.searchsorted(t_sampled, t_eval, side='right') - 1
+    out = samples[np.clip(idx, 0, len(samples) - 1)]
+    # Sebelum sampel pertama tidak ada informasi -> 0
+    return np.where(idx >= 0, out, 0.0)
+
+def linear_reconstruct(t_sampled, samples, t_eval):
+    """First-order hold (interpolasi linear antar sampel)"""
+    return np.interp(t_eval, t_sampled, samples)
+
+def sinc_reconstruct(samples, fs, t_eval, t0=0.0, method='fft', chunk=1 << 16):
+    """
+    Rekonstruksi Whittaker-Shannon: x(t) = sum_n x[n] sinc(fs (t - t0) - n).
+    method='fft'   : zero-padding spektrum (interpolasi band-limited periodik,
+                     eksak untuk sinyal periodik dalam jendela sampel),
+                     O(M log M), lalu interpolasi linear ke t_eval.
+    method='direct': jumlah sinc eksplisit per chunk t_eval, O(N x P).
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    n = samples.shape[-1]
+    if method == 'direct':
+        k = np.arange(n)
+        out = np.empty(len(t_eval))
+        for i in range(0, len(t_eval), chunk):
+            u = fs * (t_eval[i:i + chunk] - t0)
+            out[i:i + chunk] = np.sinc(u[:, None] - k[None, :]) @ samples
+        return out
+    if method != 'fft':
+        raise ValueError(f"Metode '{method}' tidak dikenal (pilih 'fft' atau 'direct')")
+
+    # Grid halus minimal 2x lebih rapat dari t_eval; panjang pangkat 2 agar FFT cepat
+    m = 1 << int(np.ceil(np.log2(max(2 * len(t_eval), 2 * n))))
+    spectrum = np.fft.rfft(samples)
+    if n % 2 == 0:
+        # Bin Nyquist dibagi rata ke frekuensi +/- agar hasil tetap real & simetris
+        spectrum[-1] *= 0.5
+    fine = np.fft.irfft(spectrum, n=m) * (m / n)
+    t_fine = t0 + np.arange(m + 1) * (n / (fs * m))
+    # Titik tambahan di ujung = titik awal (periodik) agar interp tidak terpotong
+    return np.interp(t_eval, t_fine, np.append(fine, fine[0]))
+
+RECONSTRUCTORS = ('zoh', 'linear', 'sinc')
+
+def reconstruct(t_sampled, samples, t_eval, method='zoh', fs=None):
+    """Dispatcher rekonstruksi: 'zoh', 'linear' atau 'sinc'"""
+    if method == 'zoh':
+        return zero_order_hold(t_sampled, samples, t_eval)
+    if method == 'linear':
+        return linear_reconstruct(t_sampled, samples, t_eval)
+    if method == 'sinc':
+        fs = fs if fs is not None else 1.0 / (t_sampled[1] - t_sampled[0])
+        return sinc_reconstruct(samples, fs, t_eval, t0=t_sampled[0])
+    raise ValueError(f"Metode '{method}' tidak dikenal (pilih dari {RECONSTRUCTORS})")
+
+def sweep_sampling_rates(signal_fn, sampling_rates, t_eval, duration=1.0,
+                         methods=RECONSTRUCTORS, return_signals=False):
+    """
+    Evaluasi banyak sampling rate sekaligus. Untuk ZOH, indeks sampel semua
+    rate dihitung dalam satu operasi broadcast floor(t * fs) berukuran
+    (rate x titik); linear & sinc diproses per rate dengan operasi O(P) / FFT.
+    Mengembalikan dict {method: MSE per rate} (dan sinyal rekonstruksi jika diminta).
+    """
+    rates = np.asarray(sampling_rates, dtype=np.float64)
+    reference = signal_fn(t_eval)
+    results, signals = {}, {}
+    for method in methods:
+        if method == 'zoh':
+            n_samples = np.ceil(duration * rates - 1e-9).astype(np.int64)
+            idx = np.minimum(np.floor(t_eval[None, :] * rates[:, None]), n_samples[:, None] - 1)
+            recon = signal_fn(idx / rates[:, None])
+        else:
+            recon = np.empty((len(rates), len(t_eval)))
+            for r, fs in enumerate(rates):
+                t_sampled, samples = sample_signal(signal_fn, fs, duration)
+                recon[r] = reconstruct(t_sampled, samples, t_eval, method, fs)
+        results[method] = np.mean((recon - reference[None, :]) ** 2, axis=1)
+        if return_signals:
+            signals[method] = recon
+    return (results, signals) if return_signals else results
+
+if __name__ == "__main__":
+    f_high, f_low = 50, 5
+    signal_fn = lambda t: np.sin(2 * np.pi * f_high * t) + 0.5 * np.sin(2 * np.pi * f_low * t)
+
+    t_eval = np.linspace(0, 1, 1_000_000, endpoint=False)
+    rates = np.arange(20, 420, 20)
+    t0 = time.perf_counter()
+    mse = sweep_sampling_rates(signal_fn, rates, t_eval)
+    print(f"Sweep {len(rates)} sampling rate x {len(t_eval)} titik: {time.perf_counter() - t0:.2f} detik")
+    print(f"{'fs (Hz)':<8} | {'MSE ZOH':<10} | {'MSE Linear':<10} | {'MSE Sinc':<10}")
+    for i, fs in enumerate(rates):
+        print(f"{fs:<8} | {mse['zoh'][i]:<10.5f} | {mse['linear'][i]:<10.5f} | {mse['sinc'][i]:<10.5f}")
@@ -0,0 +1,109 @@
+import cv2
+import numpy as np
+import time
+
+# ==========================================
+# CACHE RUANG WARNA (KONVERSI LAZY + MEMO)
+# ==========================================
+CONVERSION_CODES = {
+    'HSV': cv2.COLOR_BGR2HSV,
+    'LAB': cv2.COLOR_BGR2LAB,
+    'GRAY': cv2.COLOR_BGR2GRAY,
+    'RGB_DISPLAY': cv2.COLOR_BGR2RGB,
+}
+
+class ColorSpaceCache:
+    """
+    Membungkus satu citra BGR; setiap model warna dikonversi paling banyak sekali
+    saat pertama diminta. Jika approximate_gray=True dan LAB sudah dihitung,
+    GRAY diambil dari kanal L (tanpa cvtColor tambahan).
+    'RGB' mengembalikan citra asli (sama seperti analyze_color_model).
+    """
+
+    def __init__(self, image, approximate_gray=False):
+        self.image = image
+        self.approximate_gray = approximate_gray
+        self._converted = {'RGB': image}
+        self._channels = {}
+        self._stats = {}
+        self.conversions = 0
+
+    def get(self, model):
+        if model in self._converted:
+            return self._converted[model]
+        if model == 'GRAY' and self.approximate_gray and 'LAB' in self._converted:
+            # L pada LAB 8-bit = L* x 255/100, cukup dekat dengan luma untuk analisis
+            result = np.ascontiguousarray(self._converted['LAB'][..., 0])
+        elif model in CONVERSION_CODES:
+            result = cv2.cvtColor(self.image, CONVERSION_CODES[model])
+            self.conversions += 1
+        else:
+            raise ValueError(f"Model warna '{model}' tidak dikenal (pilih dari RGB, {list(CONVERSION_CODES)})")
+        self._converted[model] = result
+        return result
+
+    def channels(self, model):
+        """Kanal-kanal model warna (di-split sekali lalu dipakai ulang)"""
+        if model not in self._channels:
+            converted = self.get(model)
+            self._channels[model] = (converted,) if converted.ndim == 2 else tuple(cv2.split(converted))
+        return self._channels[model]
+
+    def channel_stats(self, model):
+        """Statistik per kanal: list dict mean/std/min/max (dihitung sekali)"""
+        if model not in self._stats:
+            stats = []
+            for ch in self.channels(model):
+                mean, std = cv2.meanStdDev(ch)
+                min_val, max_val, _, _ = cv2.minMaxLoc(ch)
+                stats.append({'mean': float(mean[0, 0]), 'std': float(std[0, 0]),
+                              'min': min_val, 'max': max_val})
+            self._stats[model] = stats
+        return self._stats[model]
+
+# ==========================================
+# BATCH PATCH WARNA
+# ==========================================
+def batch_patches(patches):
+    """Gabungkan patch (nama, citra) berukuran sama menjadi satu strip horizontal"""
+    names = [name for name, _ in patches]
+    strip = np.hstack([patch for _, patch in patches])
+    return names, strip
+
+def split_batch(strip, n):
+    """Pecah hasil konversi strip kembali menjadi n view patch (tanpa salinan)"""
+    width = strip.shape[1] // n
+    return [strip[:, i * width:(i + 1) * width] for i in range(n)]
+
+def convert_patches(patches, models=('RGB', 'HSV', 'LAB', 'GRAY')):
+    """
+    Konversi semua patch ke setiap model dengan SATU cvtColor per model.
+    Mengembalikan {model: [patch terkonversi, ...]} dengan urutan sama dengan input.
+    """
+    names, strip = batch_patches(patches)
+    cache = ColorSpaceCache(strip)
+    return {model: split_batch(cache.get(model), len(names)) for model in models}
+
+if __name__ == "__main__":
+    colors = [(0, 0, 255), (0, 255, 0), (255, 0, 0), (0, 255, 255),
+              (255, 0, 255), (255, 255, 0), (255, 255, 255), (0, 0, 0)]
+    patches = [(str(c), np.full((100, 100, 3), c, dtype=np.uint8)) for c in colors]
+    models = ('RGB', 'HSV', 'LAB', 'GRAY')
+
+    t0 = time.perf_counter()
+    for _ in range(100):
+        per_patch = {m: [ColorSpaceCache(p).get(m) for _, p in patches] for m in models}
+    t_naive = (time.perf_counter() - t0) / 100
+    t0 = time.perf_counter()
+    for _ in range(100):
+        batched = convert_patches(patches, models)
+    t_batch = (time.perf_counter() - t0) / 100
+    same = all(np.array_equal(a, b) for m in models for a, b in zip(per_patch[m], batched[m]))
+    print(f"Per patch: {t_naive * 1e3:.3f} ms | Batch: {t_batch * 1e3:.3f} ms | identik: {same}")
+
+    img = np.random.default_rng(0).integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+    cache = ColorSpaceCache(img, approximate_gray=True)
+    cache.channel_stats('LAB')
+    cache.channel_stats('GRAY')
+    cache.channel_stats('LAB')
+    print(f"Konversi yang benar-benar dijalankan: {cache.conversions} (LAB saja, GRAY dari L)")
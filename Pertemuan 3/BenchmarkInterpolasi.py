@@ -0,0 +1,134 @@
+import cv2
+import numpy as np
+import os
+import sys
+import csv
+import argparse
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PolaSintetis import get_pattern
+from PengukuranWaktu import time_call
+
+# ==========================================
+# 1. METODE INTERPOLASI & SKOR KUALITAS
+# ==========================================
+INTERPOLATION_METHODS = {
+    'nearest': cv2.INTER_NEAREST,
+    'linear': cv2.INTER_LINEAR,
+    'cubic': cv2.INTER_CUBIC,
+    'area': cv2.INTER_AREA,
+    'lanczos': cv2.INTER_LANCZOS4,
+}
+
+def quality_scores(reference, result):
+    """
+    MSE, PSNR dan error maksimum dalam dua reduksi cv2.norm (tanpa array
+    selisih float64 sementara dan tanpa wrap-around uint8).
+    """
+    n = reference.size
+    mse = cv2.norm(reference, result, cv2.NORM_L2SQR) / n
+    max_err = cv2.norm(reference, result, cv2.NORM_INF)
+    psnr = 10 * np.log10(255 ** 2 / mse) if mse > 0 else float('inf')
+    return {'mse': mse, 'psnr': psnr, 'max_err': max_err}
+
+def round_trip(image, scale, flag):
+    """Downscale dengan faktor scale lalu upscale kembali ke ukuran asli"""
+    h, w = image.shape[:2]
+    small = cv2.resize(image, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=flag)
+    return small, cv2.resize(small, (w, h), interpolation=flag)
+
+# ==========================================
+# 2. BENCHMARK & PARETO
+# ==========================================
+def benchmark_interpolation(images, scales=(0.25, 0.5, 2.0), sizes=(256, 512, 1024),
+                            methods=tuple(INTERPOLATION_METHODS), thread_counts=(1, 0),
+                            warmup=1, repeats=7):
+    """
+    Round-trip resize (skala -> ukuran asli) untuk setiap metode, skala, ukuran
+    (sisi persegi) dan jumlah thread OpenCV. Waktu adalah jumlah median seluruh
+    citra; kualitas adalah rata-rata skor per citra. thread_count 0 = default.
+    """
+    default_threads = cv2.getNumThreads()
+    # 0 dipetakan ke default; duplikat dibuang agar grup Pareto tidak tercampur
+    thread_counts = list(dict.fromkeys(t if t > 0 else default_threads for t in thread_counts))
+    rows = []
+    try:
+        for size in sizes:
+            batch = [cv2.resize(img, (size, size), interpolation=cv2.INTER_AREA) for img in images]
+            megapixels = len(batch) * size * size / 1e6
+            for threads in thread_counts:
+                cv2.setNumThreads(threads)
+                for scale in scales:
+                    for method in methods:
+                        flag = INTERPOLATION_METHODS[method]
+                        total, spread, scores = 0.0, 0.0, []
+                        for img in batch:
+                            (_, restored), med, iqr = time_call(lambda: round_trip(img, scale, flag),
+                                                                warmup, repeats)
+                            total += med
+                            spread += iqr
+                            scores.append(quality_scores(img, restored))
+                        rows.append({
+                            'Size': size,
+                            'Scale': scale,
+                            'Threads': threads,
+                            'Method': method,
+                            'Time_ms': round(total * 1000, 3),
+                            'IQR_ms': round(spread * 1000, 3),
+                            'MPps': round(megapixels / total, 1),
+                            'MSE': round(float(np.mean([s['mse'] for s in scores])), 2),
+                            'PSNR': round(float(np.mean([s['psnr'] for s in scores])), 2),
+                            'MaxErr': max(s['max_err'] for s in scores),
+                        })
+    finally:
+        cv2.setNumThreads(default_threads)
+    return mark_pareto(rows)
+
+def mark_pareto(rows):
+    """
+    Tandai metode yang Pareto-optimal (tidak ada metode lain yang lebih cepat
+    sekaligus berkualitas lebih tinggi) dalam setiap grup ukuran/skala/thread.
+    """
+    groups = {}
+    for r in rows:
+        groups.setdefault((r['Size'], r['Scale'], r['Threads']), []).append(r)
+    for group in groups.values():
+        # Urut dari tercepat; sebuah titik optimal jika PSNR-nya melampaui semua yang lebih cepat
+        best_psnr = -np.inf
+        for r in sorted(group, key=lambda r: (r['Time_ms'], -r['PSNR'])):
+            r['Pareto'] = r['PSNR'] > best_psnr
+            best_psnr = max(best_psnr, r['PSNR'])
+    return rows
+
+def print_table(rows, pareto_only=False):
+    print(f"{'Ukuran':<6} | {'Skala':<5} | {'Thr':<3} | {'Metode':<8} | {'Waktu (ms)':<10} | {'IQR':<7} | "
+          f"{'MP/s':<7} | {'PSNR':<6} | {'Pareto':<6}")
+    print("-" * 85)
+    for r in rows:
+        if pareto_only and not r['Pareto']:
+            continue
+        print(f"{r['Size']:<6} | {r['Scale']:<5} | {r['Threads']:<3} | {r['Method']:<8} | {r['Time_ms']:<10} | "
+              f"{r['IQR_ms']:<7} | {r['MPps']:<7} | {r['PSNR']:<6} | {'*' if r['Pareto'] else '':<6}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark metode interpolasi (kecepatan vs kualitas)")
+    parser.add_argument("images", nargs="*", help="Path citra grayscale (kosong = pola uji geometrik)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 512, 1024])
+    parser.add_argument("--scales", type=float, nargs="+", default=[0.25, 0.5, 2.0])
+    parser.add_argument("--methods", nargs="+", choices=list(INTERPOLATION_METHODS), default=list(INTERPOLATION_METHODS))
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 0])
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--pareto-only", action="store_true")
+    parser.add_argument("--csv", default=None)
+    args = parser.parse_args()
+
+    images = [img for img in (cv2.imread(p, 0) for p in args.images if os.path.exists(p)) if img is not None]
+    if not images:
+        images = [get_pattern('geometric', max(args.sizes))]
+    rows = benchmark_interpolation(images, args.scales, args.sizes, args.methods, args.threads,
+                                   repeats=args.repeats)
+    print_table(rows, args.pareto_only)
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
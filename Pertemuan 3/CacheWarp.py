@@ -0,0 +1,114 @@
+import cv2
+import numpy as np
+import time
+from collections import OrderedDict
+
+# ==========================================
+# CACHE TABEL REMAP UNTUK WARP BERULANG
+# ==========================================
+# warpPerspective menghitung ulang H^-1 * (x, y, 1) untuk setiap piksel di
+# setiap panggilan. Untuk homografi yang sama (kamera tetap, beberapa metode
+# interpolasi) koordinat sumber cukup dihitung sekali, dikonversi ke peta
+# fixed-point (CV_16SC2 + tabel fraksi) dengan cv2.convertMaps, lalu dipakai
+# ulang oleh cv2.remap.
+
+def _as_homography(M):
+    M = np.asarray(M, dtype=np.float64)
+    return np.vstack([M, [0, 0, 1]]) if M.shape == (2, 3) else M
+
+def build_remap_tables(M, size, nearest=False):
+    """
+    Peta remap fixed-point untuk matriks M (2x3 atau 3x3, arah sumber -> tujuan)
+    dan ukuran keluaran size=(w, h). nearest=True menghasilkan peta tanpa
+    tabel fraksi (untuk INTER_NEAREST).
+    """
+    w, h = size
+    inv = np.linalg.inv(_as_homography(M)).astype(np.float32)
+    xs = np.arange(w, dtype=np.float32)[None, :]
+    ys = np.arange(h, dtype=np.float32)[:, None]
+    # Koordinat homogen dibangun dari dua suku 1-D (outer sum), tanpa meshgrid
+    X = inv[0, 0] * xs + (inv[0, 1] * ys + inv[0, 2])
+    Y = inv[1, 0] * xs + (inv[1, 1] * ys + inv[1, 2])
+    if not np.allclose(inv[2], [0, 0, 1]):
+        Z = inv[2, 0] * xs + (inv[2, 1] * ys + inv[2, 2])
+        Z = np.divide(1.0, Z, out=np.zeros_like(Z), where=Z != 0)
+        X *= Z
+        Y *= Z
+    return cv2.convertMaps(X, Y, cv2.CV_16SC2, nninterpolation=nearest)
+
+class WarpCache:
+    """
+    Cache LRU tabel remap, dikunci oleh (matriks, ukuran keluaran, nearest).
+    Dipakai untuk homografi yang sama pada banyak frame / metode interpolasi.
+    """
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(M, size, nearest):
+        # Dibulatkan agar matriks hasil perhitungan ulang yang identik tetap cocok
+        return (np.round(_as_homography(M), 9).tobytes(), tuple(size), bool(nearest))
+
+    def maps(self, M, size, nearest=False):
+        key = self.make_key(M, size, nearest)
+        if key in self._items:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+        self.misses += 1
+        tables = build_remap_tables(M, size, nearest)
+        self._items[key] = tables
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+        return tables
+
+    def warp(self, image, M, size, interpolation=cv2.INTER_LINEAR,
+             border_mode=cv2.BORDER_CONSTANT, border_value=0):
+        """Setara cv2.warpPerspective(image, M, size, flags=interpolation) via remap"""
+        # remap tidak mendukung INTER_AREA; untuk warp, OpenCV sendiri memakai linear
+        if interpolation == cv2.INTER_AREA:
+            interpolation = cv2.INTER_LINEAR
+        map1, map2 = self.maps(M, size, nearest=interpolation == cv2.INTER_NEAREST)
+        return cv2.remap(image, map1, map2, interpolation,
+                         borderMode=border_mode, borderValue=border_value)
+
+    def clear(self):
+        self._items.clear()
+
+_default_cache = WarpCache()
+
+def cached_warp_perspective(image, M, size, interpolation=cv2.INTER_LINEAR,
+                            border_mode=cv2.BORDER_CONSTANT, border_value=0):
+    """Warp dengan cache global (tabel remap dibangun sekali per matriks & ukuran)"""
+    return _default_cache.warp(image, M, size, interpolation, border_mode, border_value)
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    frames = [cv2.GaussianBlur(rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8), (5, 5), 1.5)
+              for _ in range(4)]
+    pts_src = np.float32([[100, 150], [1800, 120], [30, 1000], [1880, 1050]])
+    pts_dst = np.float32([[0, 0], [1920, 0], [0, 1080], [1920, 1080]])
+    H = cv2.getPerspectiveTransform(pts_src, pts_dst)
+    size = (1920, 1080)
+    cache = WarpCache()
+
+    for name, flag in [("Nearest", cv2.INTER_NEAREST), ("Bilinear", cv2.INTER_LINEAR), ("Bicubic", cv2.INTER_CUBIC)]:
+        t0 = time.perf_counter()
+        for f in frames:
+            ref = cv2.warpPerspective(f, H, size, flags=flag)
+        t_warp = (time.perf_counter() - t0) / len(frames)
+        t0 = time.perf_counter()
+        cache.maps(H, size, flag == cv2.INTER_NEAREST)
+        t_build = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for f in frames:
+            out = cache.warp(f, H, size, flag)
+        t_remap = (time.perf_counter() - t0) / len(frames)
+        diff = np.abs(out.astype(np.int16) - ref).max()
+        print(f"{name:<8} | warpPerspective: {t_warp * 1000:6.2f} ms | remap cache: {t_remap * 1000:6.2f} ms "
+              f"(bangun tabel {t_build * 1000:.1f} ms) | selisih maks: {diff}")
+    print(f"Cache: hit {cache.hits}, miss {cache.misses}")
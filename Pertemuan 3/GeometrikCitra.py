@@ -1,7 +1,13 @@
 import cv2
 import numpy as np
-import time
 import matplotlib.pyplot as plt
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from CacheWarp import WarpCache
+from BenchmarkInterpolasi import quality_scores
+from PengukuranWaktu import time_call
+from RektifikasiDokumen import detect_document_corners
 
 # ==========================================
 # IDENTITAS
@@ -17,15 +23,9 @@ def print_identity():
     print("=" * 35)
 
 def evaluate_quality(target, result):
-    # MSE
-    mse = np.mean((target - result) ** 2)
-    # PSNR
-    if mse == 0:
-        psnr = 100
-    else:
-        pixel_max = 255.0
-        psnr = 20 * np.log10(pixel_max / np.sqrt(mse))
-    return mse, psnr
+    # MSE & PSNR lewat cv2.norm (selisih uint8 tidak wrap-around)
+    scores = quality_scores(target, result)
+    return scores['mse'], min(scores['psnr'], 100)
 
 def main():
     print_identity()
@@ -48,6 +48,11 @@ def main():
     # Klik/Cari koordinat 4 pojok dokumen pada foto 'miring.jpg'
     # Urutan: Kiri Atas, Kanan Atas, Kiri Bawah, Kanan Bawah
     pts_miring = np.float32([[100, 150], [520, 120], [30, 720], [580, 750]]) # Ganti sesuai foto
+    # Deteksi otomatis (kontur + approxPolyDP); titik manual di atas dipakai jika gagal.
+    # Untuk satu folder penuh foto gunakan: python RektifikasiDokumen.py <input> <output>
+    detected = detect_document_corners(img_src)
+    if detected is not None:
+        pts_miring = detected
     pts_lurus = np.float32([[0, 0], [width, 0], [0, height], [width, height]])
 
     matrix_p = cv2.getPerspectiveTransform(pts_miring, pts_lurus)
@@ -59,17 +64,17 @@ def main():
         ("Bicubic", cv2.INTER_CUBIC)
     ]
 
+    # Tabel remap untuk matrix_p dibangun sekali lalu dipakai ulang oleh semua metode
+    warp_cache = WarpCache()
+
     results_img = []
     print(f"{'Metode':<12} | {'MSE':<10} | {'PSNR':<10} | {'Waktu (ms)':<10}")
     print("-" * 50)
 
     for name, flag in methods:
-        start = time.time()
-        # Eksekusi Transformasi
-        warped = cv2.warpPerspective(img_src, matrix_p, (width, height), flags=flag)
-        end = time.time()
-        
-        duration = (end - start) * 1000
+        # Eksekusi Transformasi (median beberapa pengulangan setelah warm-up)
+        warped, t_med, _ = time_call(lambda: warp_cache.warp(img_src, matrix_p, (width, height), interpolation=flag))
+        duration = t_med * 1000
         mse, psnr = evaluate_quality(img_ref, warped)
         
         results_img.append(warped)
@@ -5,6 +5,14 @@ import cv2
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import ndimage
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PolaSintetis import get_pattern
+from KomposisiTransformasi import TransformChain, transformation_matrix, warp_with_matrix
+from BenchmarkInterpolasi import quality_scores, round_trip
+from PengukuranWaktu import time_call
+from RegistrasiCitra import FeatureRegistrar
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -19,101 +27,20 @@ print("Materi: Geometric Transformations, Homogeneous Coordinates, Interpolation
 
 # =============== FUNGSI BANTU ===============
 def create_test_image(size=256):
-    """Create test image with geometric patterns"""
-    img = np.zeros((size, size), dtype=np.uint8)
-    
-    # Draw coordinate axes
-    cv2.line(img, (size//2, 0), (size//2, size), 200, 1)
-    cv2.line(img, (0, size//2), (size, size//2), 200, 1)
-    
-    # Draw geometric shapes
-    # Circle at center
-    cv2.circle(img, (size//2, size//2), size//8, 255, 2)
-    
-    # Square
-    square_size = size//6
-    cv2.rectangle(img, 
-                 (size//4 - square_size//2, size//4 - square_size//2),
-                 (size//4 + square_size//2, size//4 + square_size//2),
-                 150, 2)
-    
-    # Triangle
-    triangle_pts = np.array([
-        [size*3//4, size//4 - size//8],
-        [size*3//4 - size//8, size//4 + size//8],
-        [size*3//4 + size//8, size//4 + size//8]
-    ])
-    cv2.polylines(img, [triangle_pts], True, 100, 2)
-    
-    # Diagonal lines
-    cv2.line(img, (0, 0), (size, size), 180, 1)
-    cv2.line(img, (size, 0), (0, size), 180, 1)
-    
-    # Add text for orientation
-    cv2.putText(img, 'TOP', (size//2 - 20, 30), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, 255, 1)
-    cv2.putText(img, 'BOTTOM', (size//2 - 30, size - 10), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, 255, 1)
-    
-    return img
+    """Create test image with geometric patterns (axes, circle, square, triangle, diagonals, text)"""
+    # Dibuat sekali per ukuran lalu di-cache oleh PolaSintetis
+    return get_pattern('geometric', size).copy()
 
 def apply_transformation(image, transformation_name, params=None):
     """Apply different geometric transformations"""
-    h, w = image.shape
-    
-    if transformation_name == 'translation':
-        tx, ty = params.get('tx', 50), params.get('ty', 30)
-        M = np.float32([[1, 0, tx], [0, 1, ty]])
-        result = cv2.warpAffine(image, M, (w, h))
-        
-    elif transformation_name == 'rotation':
-        angle = params.get('angle', 45)
-        center = params.get('center', (w//2, h//2))
-        scale = params.get('scale', 1.0)
-        M = cv2.getRotationMatrix2D(center, angle, scale)
-        result = cv2.warpAffine(image, M, (w, h))
-        
-    elif transformation_name == 'scaling':
-        sx, sy = params.get('sx', 1.5), params.get('sy', 1.5)
-        new_w, new_h = int(w * sx), int(h * sy)
-        result = cv2.resize(image, (new_w, new_h))
-        # Pad or crop to original size
-        if sx > 1 or sy > 1:
-            result = result[:h, :w]
-        else:
-            padded = np.zeros_like(image)
-            padded[:new_h, :new_w] = result
-            result = padded
-            
-    elif transformation_name == 'shearing':
-        shx, shy = params.get('shx', 0.3), params.get('shy', 0.2)
-        M = np.float32([[1, shx, 0], [shy, 1, 0]])
-        result = cv2.warpAffine(image, M, (w, h))
-        
-    elif transformation_name == 'affine':
-        # Three point affine transformation
-        pts1 = np.float32([[50,50], [200,50], [50,200]])
-        pts2 = np.float32([[10,100], [200,50], [100,250]])
-        M = cv2.getAffineTransform(pts1, pts2)
-        result = cv2.warpAffine(image, M, (w, h))
-        
-    elif transformation_name == 'perspective':
-        # Four point perspective transformation
-        pts1 = np.float32([[50,50], [w-50,50], [w-50,h-50], [50,h-50]])
-        pts2 = np.float32([[0,0], [w,0], [w-100,h], [100,h]])
-        M = cv2.getPerspectiveTransform(pts1, pts2)
-        result = cv2.warpPerspective(image, M, (w, h))
-        
-    else:
-        result = image.copy()
-    
-    return result
+    # Semua transformasi dinyatakan sebagai matriks homogen 3x3 lalu di-warp sekali
+    # (lihat KomposisiTransformasi.py untuk merangkai beberapa transformasi)
+    if transformation_name not in ('translation', 'rotation', 'scaling', 'shearing', 'affine', 'perspective'):
+        return image.copy()
+    return TransformChain(image).apply(transformation_name, params).result()
 
 def compare_interpolation_methods(image, scale_factor=0.5):
     """Compare different interpolation methods"""
-    h, w = image.shape
-    new_size = (int(w * scale_factor), int(h * scale_factor))
-    
     methods = [
         ('Nearest Neighbor', cv2.INTER_NEAREST),
         ('Bilinear', cv2.INTER_LINEAR),
@@ -124,21 +51,19 @@ def compare_interpolation_methods(image, scale_factor=0.5):
     results = []
     
     for method_name, inter_flag in methods:
-        # Downscale
-        downscaled = cv2.resize(image, new_size, interpolation=inter_flag)
-        # Upscale back to original size
-        upscaled = cv2.resize(downscaled, (w, h), interpolation=inter_flag)
+        # Downscale lalu upscale kembali (waktu median setelah warm-up)
+        (downscaled, upscaled), t_med, _ = time_call(lambda: round_trip(image, scale_factor, inter_flag))
         
-        # Calculate metrics
-        mse = np.mean((image.astype(float) - upscaled.astype(float))**2)
-        psnr = 10 * np.log10(255**2 / mse) if mse > 0 else float('inf')
+        # Calculate metrics (cv2.norm, tanpa array selisih float64)
+        scores = quality_scores(image, upscaled)
         
         results.append({
             'name': method_name,
             'downscaled': downscaled,
             'upscaled': upscaled,
-            'mse': mse,
-            'psnr': psnr
+            'mse': scores['mse'],
+            'psnr': scores['psnr'],
+            'time_ms': t_med * 1000
         })
     
     return results
@@ -240,6 +165,19 @@ print("\nMatriks Scaling:\n", scaling_matrix)
 composite = translation_matrix @ rotation_matrix @ scaling_matrix
 print("\nTransformasi Komposit:\n", np.round(composite, 3))
 
+# Rantai transformasi lazy: matriks dikalikan dulu, citra di-warp sekali saja
+chain_steps = [('translation', {'tx': 20, 'ty': 10}), ('rotation', {'angle': 30}),
+               ('shearing', {'shx': 0.1, 'shy': 0.05})]
+chain = TransformChain(test_img, interpolation=cv2.INTER_CUBIC)
+sequential = test_img
+for name, p in chain_steps:
+    chain.apply(name, p)
+    sequential = warp_with_matrix(sequential, transformation_matrix(name, p, test_img.shape),
+                                  interpolation=cv2.INTER_CUBIC)
+composed = chain.result()
+print(f"\nRantai {' -> '.join(chain.steps)} (1 warp):\n", np.round(chain.matrix, 3))
+print(f"MSE warp berurutan vs komposit: {np.mean((sequential.astype(np.float32) - composed) ** 2):.2f}")
+
 # 3. PERBANDINGAN METODE INTERPOLASI (BUG FIXED)
 print("\n3. PERBANDINGAN METODE INTERPOLASI")
 test_img_detail = create_test_image(400)
@@ -272,7 +210,7 @@ for idx, result in enumerate(interpolation_results):
     # Baris 3: Error Map
     error_map = np.abs(test_img_detail.astype(float) - result['upscaled'].astype(float))
     im = axes[2, col_idx].imshow(error_map, cmap='hot', vmin=0, vmax=100)
-    axes[2, col_idx].set_title(f"Error Map\nMSE: {result['mse']:.1f}, PSNR: {result['psnr']:.1f}dB")
+    axes[2, col_idx].set_title(f"Error Map\nMSE: {result['mse']:.1f}, PSNR: {result['psnr']:.1f}dB, {result['time_ms']:.2f} ms")
     axes[2, col_idx].axis('off')
     plt.colorbar(im, ax=axes[2, col_idx], fraction=0.046, pad=0.04)
 
@@ -380,24 +318,12 @@ def demonstrate_image_registration():
     noise = np.random.normal(0, 10, moving_img.shape)
     moving_img = np.clip(moving_img.astype(float) + noise, 0, 255).astype(np.uint8)
     
-    orb = cv2.ORB_create(500)
-    kp1, des1 = orb.detectAndCompute(ref_img, None)
-    kp2, des2 = orb.detectAndCompute(moving_img, None)
-    
-    matcher = cv2.DescriptorMatcher_create(cv2.DESCRIPTOR_MATCHER_BRUTEFORCE_HAMMING)
-    matches = matcher.match(des1, des2, None)
-    matches = sorted(matches, key=lambda x: x.distance)
-    good_matches = matches[:50]
-    
-    points1 = np.zeros((len(good_matches), 2), dtype=np.float32)
-    points2 = np.zeros((len(good_matches), 2), dtype=np.float32)
-    
-    for i, match in enumerate(good_matches):
-        points1[i, :] = kp1[match.queryIdx].pt
-        points2[i, :] = kp2[match.trainIdx].pt
-        
-    M_registered, inliers = cv2.estimateAffinePartial2D(points2, points1)
-    registered_img = cv2.warpAffine(moving_img, M_registered, (256, 256))
+    # Keypoint referensi di-cache di registrar; pencocokan k=2 + ratio test
+    registrar = FeatureRegistrar(ref_img, n_features=500, matcher='bf', model='partial')
+    registered_img, M_registered, stats = registrar.register(moving_img)
+    if registered_img is None:
+        registered_img = np.zeros_like(moving_img)
+    print(f"Keypoint: {stats['keypoints']}, match lolos ratio test: {stats['matches']}, inlier: {stats['inliers']}")
     
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
     axes[0].imshow(ref_img, cmap='gray')
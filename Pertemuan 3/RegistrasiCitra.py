@@ -0,0 +1,309 @@
+import cv2
+import numpy as np
+import time
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PolaSintetis import get_pattern
+
+# ==========================================
+# REGISTRASI CITRA BERBASIS FEATURE MATCHING
+# ==========================================
+# Keypoint & deskriptor ORB referensi dihitung SEKALI. Setiap citra bergerak
+# cukup dideteksi, dicocokkan (k=2 + Lowe ratio test) lalu titiknya diambil
+# dengan indexing NumPy dari array koordinat yang sudah disiapkan.
+
+FLANN_INDEX_LSH = 6
+
+def keypoint_array(keypoints):
+    """Koordinat keypoint sebagai array (n, 2) float32 (konversi di C++, tanpa loop Python)"""
+    if not keypoints:
+        return np.empty((0, 2), dtype=np.float32)
+    return cv2.KeyPoint_convert(keypoints).astype(np.float32)
+
+def create_matcher(kind='bf'):
+    """'bf' = brute force Hamming, 'flann' = FLANN LSH (untuk deskriptor dalam jumlah besar)"""
+    if kind == 'bf':
+        return cv2.BFMatcher(cv2.NORM_HAMMING)
+    if kind == 'flann':
+        index_params = dict(algorithm=FLANN_INDEX_LSH, table_number=6, key_size=12, multi_probe_level=1)
+        return cv2.FlannBasedMatcher(index_params, dict(checks=50))
+    raise ValueError(f"Matcher '{kind}' tidak dikenal (pilih 'bf' atau 'flann')")
+
+def ratio_test(knn_matches, ratio=0.75):
+    """Indeks (query, train) yang lolos Lowe ratio test sebagai dua array int"""
+    # LSH bisa mengembalikan < 2 tetangga untuk sebagian query
+    pairs = [(m[0].queryIdx, m[0].trainIdx) for m in knn_matches
+             if len(m) == 2 and m[0].distance < ratio * m[1].distance]
+    if not pairs:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    idx = np.array(pairs, dtype=np.intp)
+    return idx[:, 0], idx[:, 1]
+
+class FeatureRegistrar:
+    """
+    Registrasi banyak citra bergerak terhadap satu referensi.
+    model: 'partial' (rotasi+skala+translasi), 'affine', atau 'homography'.
+    ORB dan matcher dibuat per thread (deskriptor referensi sudah di-train
+    di setiap matcher) sehingga register_stream aman dijalankan paralel.
+    """
+
+    def __init__(self, reference, n_features=500, matcher='bf', ratio=0.75, model='partial',
+                 min_matches=6):
+        if model not in ('partial', 'affine', 'homography'):
+            raise ValueError(f"Model '{model}' tidak dikenal (pilih 'partial', 'affine' atau 'homography')")
+        self.reference = reference
+        self.size = (reference.shape[1], reference.shape[0])
+        self.n_features = n_features
+        self.matcher_kind = matcher
+        self.ratio = ratio
+        self.model = model
+        self.min_matches = min_matches
+        self._local = threading.local()
+        orb, _ = self._tools(train=False)
+        kp, self.ref_descriptors = orb.detectAndCompute(self._gray(reference), None)
+        self.ref_points = keypoint_array(kp)
+
+    @staticmethod
+    def _gray(image):
+        return image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    def _tools(self, train=True):
+        local = self._local
+        if not hasattr(local, 'orb'):
+            local.orb = cv2.ORB_create(self.n_features)
+            local.matcher = None
+        if train and local.matcher is None:
+            local.matcher = create_matcher(self.matcher_kind)
+            local.matcher.add([self.ref_descriptors])
+            local.matcher.train()
+        return local.orb, local.matcher
+
+    def estimate(self, moving):
+        """Matriks moving -> referensi (2x3 atau 3x3) dan statistik pencocokan; M None jika gagal"""
+        orb, matcher = self._tools()
+        kp, des = orb.detectAndCompute(self._gray(moving), None)
+        stats = {'keypoints': len(kp), 'matches': 0, 'inliers': 0}
+        if des is None or self.ref_descriptors is None or len(kp) < 2:
+            return None, stats
+        query_idx, train_idx = ratio_test(matcher.knnMatch(des, k=2), self.ratio)
+        stats['matches'] = len(query_idx)
+        if len(query_idx) < self.min_matches:
+            return None, stats
+        src = keypoint_array(kp)[query_idx]
+        dst = self.ref_points[train_idx]
+        if self.model == 'partial':
+            M, inliers = cv2.estimateAffinePartial2D(src, dst, method=cv2.RANSAC)
+        elif self.model == 'affine':
+            M, inliers = cv2.estimateAffine2D(src, dst, method=cv2.RANSAC)
+        else:
+            M, inliers = cv2.findHomography(src, dst, cv2.RANSAC, 3.0)
+        stats['inliers'] = int(inliers.sum()) if inliers is not None else 0
+        return M, stats
+
+    def register(self, moving, interpolation=cv2.INTER_LINEAR):
+        """(citra ter-registrasi atau None, M, statistik)"""
+        M, stats = self.estimate(moving)
+        if M is None:
+            return None, None, stats
+        if M.shape == (2, 3):
+            registered = cv2.warpAffine(moving, M, self.size, flags=interpolation)
+        else:
+            registered = cv2.warpPerspective(moving, M, self.size, flags=interpolation)
+        return registered, M, stats
+
+    def register_stream(self, frames, workers=4, interpolation=cv2.INTER_LINEAR):
+        """
+        Registrasi iterable frame secara paralel (thread; ORB & matching melepas
+        GIL), urutan dipertahankan. Paling banyak 2*workers frame sedang diproses,
+        jadi generator kamera/video dibaca sesuai kecepatan konsumen.
+        """
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                for frame in frames:
+                    pending.append(pool.submit(self.register, frame, interpolation))
+                    if len(pending) >= 2 * workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # Konsumen berhenti lebih awal: batalkan frame yang belum mulai
+                for future in pending:
+                    future.cancel()
+
+# ==========================================
+# REGISTRASI PIRAMIDA (COARSE-TO-FINE)
+# ==========================================
+def _to_3x3(M):
+    M = np.asarray(M, dtype=np.float64)
+    return np.vstack([M, [0, 0, 1]]) if M.shape == (2, 3) else M
+
+def _shift(tx, ty):
+    return np.array([[1, 0, tx], [0, 1, ty], [0, 0, 1]], dtype=np.float64)
+
+def _center_window(shape, window):
+    h, w = shape[:2]
+    ww, wh = min(window, w), min(window, h)
+    return (w - ww) // 2, (h - wh) // 2, ww, wh
+
+def refine_ecc(reference, moving, M, motion='affine', window=768, iterations=30, eps=1e-4):
+    """
+    Perbaiki M (moving -> reference, 3x3) dengan findTransformECC hanya pada
+    jendela tengah reference dan potongan moving yang dipetakan ke jendela itu.
+    """
+    ox, oy, ww, wh = _center_window(reference.shape, window)
+    template = reference[oy:oy + wh, ox:ox + ww]
+    W = np.linalg.inv(M)  # reference -> moving (konvensi warpMatrix ECC)
+    corners = np.float32([[ox, oy], [ox + ww, oy], [ox, oy + wh], [ox + ww, oy + wh]])[:, None]
+    mapped = cv2.perspectiveTransform(corners, W)[:, 0]
+    margin = 16
+    x0, y0 = np.maximum(np.floor(mapped.min(axis=0)).astype(int) - margin, 0)
+    x1, y1 = np.minimum(np.ceil(mapped.max(axis=0)).astype(int) + margin,
+                        [moving.shape[1], moving.shape[0]])
+    if x1 - x0 < 32 or y1 - y0 < 32:
+        return M
+    W_local = _shift(-x0, -y0) @ W @ _shift(ox, oy)
+    W_local /= W_local[2, 2]
+    if motion == 'affine':
+        motion_type, warp = cv2.MOTION_AFFINE, W_local[:2].astype(np.float32)
+    else:
+        motion_type, warp = cv2.MOTION_HOMOGRAPHY, W_local.astype(np.float32)
+    criteria = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, iterations, eps)
+    try:
+        _, warp = cv2.findTransformECC(template, moving[y0:y1, x0:x1], warp, motion_type, criteria, None, 5)
+    except cv2.error:
+        # Tidak konvergen: pertahankan estimasi level sebelumnya
+        return M
+    W = _shift(x0, y0) @ _to_3x3(warp) @ _shift(-ox, -oy)
+    return np.linalg.inv(W)
+
+def refine_features(reference, moving, M, motion='affine', window=768, n_features=500):
+    """
+    Perbaiki M dengan ORB pada jendela tengah: moving di-warp ke jendela itu
+    dengan estimasi sekarang, lalu sisa transformasinya diestimasi dan dikomposisi.
+    """
+    ox, oy, ww, wh = _center_window(reference.shape, window)
+    template = reference[oy:oy + wh, ox:ox + ww]
+    to_window = _shift(-ox, -oy) @ M
+    patch = cv2.warpPerspective(moving, to_window, (ww, wh))
+    model = 'affine' if motion == 'affine' else 'homography'
+    R, _ = FeatureRegistrar(template, n_features=n_features, model=model).estimate(patch)
+    if R is None:
+        return M
+    return _shift(ox, oy) @ _to_3x3(R) @ to_window
+
+def register_pyramid(reference, moving, method='ecc', motion='affine', coarse_max=800,
+                     window=768, n_features=1000):
+    """
+    Estimasi transformasi moving -> reference secara coarse-to-fine:
+    ORB penuh pada level piramida terkecil (sisi terpanjang <= coarse_max),
+    lalu di setiap level yang lebih halus matriks diskalakan 2x dan diperbaiki
+    dengan ECC atau ORB hanya di dalam jendela berukuran `window`.
+    Mengembalikan (M atau None, list waktu per level).
+    """
+    if method not in ('ecc', 'features'):
+        raise ValueError(f"Metode '{method}' tidak dikenal (pilih 'ecc' atau 'features')")
+    t0 = time.perf_counter()
+    ref_pyr = [FeatureRegistrar._gray(reference)]
+    mov_pyr = [FeatureRegistrar._gray(moving)]
+    while max(ref_pyr[-1].shape) > coarse_max:
+        ref_pyr.append(cv2.pyrDown(ref_pyr[-1]))
+        mov_pyr.append(cv2.pyrDown(mov_pyr[-1]))
+    timings = [{'Level': 'pyramid', 'Size': '-', 'Time_ms': round((time.perf_counter() - t0) * 1000, 2)}]
+
+    coarsest = len(ref_pyr) - 1
+    t0 = time.perf_counter()
+    model = 'affine' if motion == 'affine' else 'homography'
+    M, _ = FeatureRegistrar(ref_pyr[coarsest], n_features=n_features, model=model).estimate(mov_pyr[coarsest])
+    timings.append({'Level': coarsest, 'Size': f"{ref_pyr[coarsest].shape[1]}x{ref_pyr[coarsest].shape[0]}",
+                    'Time_ms': round((time.perf_counter() - t0) * 1000, 2)})
+    if M is None:
+        return None, timings
+    M = _to_3x3(M)
+
+    scale_up = np.diag([2.0, 2.0, 1.0])
+    for level in range(coarsest - 1, -1, -1):
+        t0 = time.perf_counter()
+        M = scale_up @ M @ np.linalg.inv(scale_up)
+        if method == 'ecc':
+            M = refine_ecc(ref_pyr[level], mov_pyr[level], M, motion, window)
+        else:
+            M = refine_features(ref_pyr[level], mov_pyr[level], M, motion, window)
+        timings.append({'Level': level, 'Size': f"{ref_pyr[level].shape[1]}x{ref_pyr[level].shape[0]}",
+                        'Time_ms': round((time.perf_counter() - t0) * 1000, 2)})
+    M /= M[2, 2]
+    return (M[:2] if motion == 'affine' else M), timings
+
+def naive_register(ref_img, moving_img, n_features=500):
+    """Alur lama demonstrate_image_registration (deteksi ulang referensi, sort, loop titik)"""
+    orb = cv2.ORB_create(n_features)
+    kp1, des1 = orb.detectAndCompute(ref_img, None)
+    kp2, des2 = orb.detectAndCompute(moving_img, None)
+    matcher = cv2.DescriptorMatcher_create(cv2.DESCRIPTOR_MATCHER_BRUTEFORCE_HAMMING)
+    matches = sorted(matcher.match(des1, des2, None), key=lambda x: x.distance)[:50]
+    points1 = np.zeros((len(matches), 2), dtype=np.float32)
+    points2 = np.zeros((len(matches), 2), dtype=np.float32)
+    for i, match in enumerate(matches):
+        points1[i, :] = kp1[match.queryIdx].pt
+        points2[i, :] = kp2[match.trainIdx].pt
+    M, _ = cv2.estimateAffinePartial2D(points2, points1)
+    return M
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    ref = cv2.GaussianBlur(get_pattern('geometric', 1024), (3, 3), 0)
+    ref = cv2.add(ref, rng.integers(0, 40, ref.shape, dtype=np.uint8))
+    frames, truths = [], []
+    for _ in range(40):
+        M = cv2.getRotationMatrix2D((512, 512), rng.uniform(-20, 20), rng.uniform(0.85, 1.1))
+        M[:, 2] += rng.uniform(-30, 30, 2)
+        frames.append(cv2.warpAffine(ref, M, (1024, 1024)))
+        truths.append(cv2.invertAffineTransform(M))
+
+    def corner_error(M_est, M_true):
+        pts = np.float32([[0, 0], [1023, 0], [0, 1023], [1023, 1023]])[:, None]
+        return float(np.abs(cv2.transform(pts, M_est) - cv2.transform(pts, M_true)).max())
+
+    t0 = time.perf_counter()
+    naive = [naive_register(ref, f, 2000) for f in frames]
+    t_naive = time.perf_counter() - t0
+    print(f"{'Naive':<14} | {len(frames) / t_naive:6.1f} citra/s | error pojok maks: "
+          f"{max(corner_error(m, t) for m, t in zip(naive, truths)):.2f} px")
+
+    for kind, workers in [('bf', 1), ('flann', 1), ('flann', 4)]:
+        registrar = FeatureRegistrar(ref, n_features=2000, matcher=kind)
+        t0 = time.perf_counter()
+        results = list(registrar.register_stream(frames, workers=workers))
+        elapsed = time.perf_counter() - t0
+        errors = [corner_error(M, t) for (_, M, _), t in zip(results, truths) if M is not None]
+        print(f"{kind + f' x{workers}':<14} | {len(frames) / elapsed:6.1f} citra/s | error pojok maks: "
+              f"{max(errors):.2f} px | berhasil {len(errors)}/{len(frames)}")
+
+    # Citra besar (~20 MP): ORB resolusi penuh vs piramida + ECC/ORB berjendela
+    big_w, big_h = 5472, 3648
+    texture = cv2.resize(rng.integers(0, 256, (big_h // 16, big_w // 16), dtype=np.uint8), (big_w, big_h),
+                         interpolation=cv2.INTER_CUBIC)
+    big_ref = cv2.addWeighted(texture, 0.7, cv2.resize(ref, (big_w, big_h)), 0.3, 0)
+    M_true = cv2.getRotationMatrix2D((big_w / 2, big_h / 2), 7, 1.03)
+    M_true[:, 2] += (40, -25)
+    big_mov = cv2.warpAffine(big_ref, M_true, (big_w, big_h))
+    M_inv = cv2.invertAffineTransform(M_true)
+    pts = np.float32([[0, 0], [big_w, 0], [0, big_h], [big_w, big_h]])[:, None]
+
+    t0 = time.perf_counter()
+    M_full, _ = FeatureRegistrar(big_ref, n_features=2000, model='affine').estimate(big_mov)
+    t_full = time.perf_counter() - t0
+    print(f"\nORB resolusi penuh {big_w}x{big_h}: {t_full * 1000:.0f} ms | error pojok maks: "
+          f"{np.abs(cv2.transform(pts, M_full) - cv2.transform(pts, M_inv)).max():.2f} px")
+    for method in ['ecc', 'features']:
+        t0 = time.perf_counter()
+        M_pyr, timings = register_pyramid(big_ref, big_mov, method=method, motion='affine')
+        t_pyr = time.perf_counter() - t0
+        per_level = ", ".join(f"L{t['Level']} {t['Time_ms']} ms" if t['Level'] != 'pyramid'
+                              else f"piramida {t['Time_ms']} ms" for t in timings)
+        print(f"Piramida ({method:<8}): {t_pyr * 1000:.0f} ms | error pojok maks: "
+              f"{np.abs(cv2.transform(pts, M_pyr) - cv2.transform(pts, M_inv)).max():.2f} px | {per_level}")
@@ -0,0 +1,122 @@
+import cv2
+import numpy as np
+import time
+import os
+import argparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from CacheWarp import WarpCache
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff')
+
+# ==========================================
+# 1. DETEKSI 4 POJOK DOKUMEN
+# ==========================================
+def order_corners(pts):
+    """Urutan seperti GeometrikCitra: Kiri Atas, Kanan Atas, Kiri Bawah, Kanan Bawah"""
+    pts = np.asarray(pts, dtype=np.float32).reshape(4, 2)
+    s = pts.sum(axis=1)
+    d = pts[:, 0] - pts[:, 1]
+    return np.float32([pts[np.argmin(s)], pts[np.argmax(d)], pts[np.argmin(d)], pts[np.argmax(s)]])
+
+def detect_document_corners(image, work_height=500, min_area_ratio=0.1):
+    """
+    Cari kontur segi empat terbesar (Canny + approxPolyDP) pada versi kecil
+    citra, lalu skala pojoknya kembali ke resolusi asli. None jika tidak ada.
+    """
+    h, w = image.shape[:2]
+    scale = h / work_height if h > work_height else 1.0
+    small = cv2.resize(image, (round(w / scale), round(h / scale)), interpolation=cv2.INTER_AREA) if scale > 1 else image
+    gray = small if small.ndim == 2 else cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    edges = cv2.Canny(cv2.GaussianBlur(gray, (5, 5), 0), 50, 150)
+    edges = cv2.dilate(edges, np.ones((3, 3), np.uint8))
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    min_area = min_area_ratio * gray.shape[0] * gray.shape[1]
+    for contour in sorted(contours, key=cv2.contourArea, reverse=True)[:5]:
+        if cv2.contourArea(contour) < min_area:
+            break
+        approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+        if len(approx) == 4 and cv2.isContourConvex(approx):
+            # Dibulatkan ke piksel agar foto dari kamera tetap menghasilkan matriks identik (cache hit)
+            return np.round(order_corners(approx) * scale)
+    return None
+
+# ==========================================
+# 2. REKTIFIKASI (REMAP TER-CACHE)
+# ==========================================
+_warp_cache = WarpCache(max_entries=64)
+
+def rectify_document(image, corners, size=(600, 800), interpolation=cv2.INTER_LINEAR, cache=None):
+    """Warp perspektif pojok dokumen ke persegi panjang size=(w, h)"""
+    width, height = size
+    pts_dst = np.float32([[0, 0], [width, 0], [0, height], [width, height]])
+    matrix_p = cv2.getPerspectiveTransform(np.float32(corners), pts_dst)
+    return (cache or _warp_cache).warp(image, matrix_p, size, interpolation=interpolation,
+                                       border_mode=cv2.BORDER_REPLICATE)
+
+# ==========================================
+# 3. BATCH: DECODE (THREAD) + PROSES (PROSES)
+# ==========================================
+def _init_worker():
+    # Paralelisme sudah di level proses; thread OpenCV internal hanya berebut core
+    cv2.setNumThreads(1)
+
+def _process_chunk(task):
+    """Satu chunk file: decode paralel dengan thread (imread melepas GIL), lalu deteksi, warp, tulis"""
+    paths, output_dir, size, decode_threads = task
+    with ThreadPoolExecutor(max_workers=decode_threads) as pool:
+        images = list(pool.map(cv2.imread, paths))
+    rows = []
+    for path, image in zip(paths, images):
+        t0 = time.perf_counter()
+        row = {'File': os.path.basename(path), 'Status': 'ok', 'Corners': None}
+        if image is None:
+            row['Status'] = 'gagal dibaca'
+        else:
+            corners = detect_document_corners(image)
+            if corners is None:
+                row['Status'] = 'pojok tidak ditemukan'
+            else:
+                result = rectify_document(image, corners, size)
+                if not cv2.imwrite(os.path.join(output_dir, os.path.basename(path)), result):
+                    row['Status'] = 'gagal ditulis'
+                row['Corners'] = corners.astype(int).tolist()
+        row['Time_ms'] = round((time.perf_counter() - t0) * 1000, 2)
+        rows.append(row)
+    return rows
+
+def rectify_directory(input_dir, output_dir, size=(600, 800), workers=None, chunk_size=16, decode_threads=4):
+    """Rektifikasi semua citra di input_dir ke output_dir, kembalikan list hasil per file"""
+    paths = sorted(os.path.join(input_dir, f) for f in os.listdir(input_dir)
+                   if f.lower().endswith(IMAGE_EXTENSIONS))
+    os.makedirs(output_dir, exist_ok=True)
+    # Nama file output sama dengan input: folder yang sama akan menimpa foto asli
+    if os.path.samefile(input_dir, output_dir):
+        raise ValueError(f"output_dir {output_dir} sama dengan input_dir; pilih folder lain")
+    # Proses menerima path (bukan piksel) sehingga tidak ada citra yang di-pickle
+    tasks = [(paths[i:i + chunk_size], output_dir, tuple(size), decode_threads)
+             for i in range(0, len(paths), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return [row for rows in pool.map(_process_chunk, tasks) for row in rows]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rektifikasi batch foto dokumen miring")
+    parser.add_argument("input_dir")
+    parser.add_argument("output_dir")
+    parser.add_argument("--size", type=int, nargs=2, default=[600, 800], metavar=("W", "H"))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=16)
+    parser.add_argument("--decode-threads", type=int, default=4)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    rows = rectify_directory(args.input_dir, args.output_dir, args.size, args.workers, args.chunk, args.decode_threads)
+    elapsed = time.perf_counter() - t0
+    if args.verbose:
+        print(f"{'File':<30} | {'Status':<22} | {'Waktu (ms)':<10}")
+        print("-" * 70)
+        for r in rows:
+            print(f"{r['File']:<30} | {r['Status']:<22} | {r['Time_ms']:<10}")
+    ok = sum(r['Status'] == 'ok' for r in rows)
+    print(f"{ok}/{len(rows)} dokumen direktifikasi dalam {elapsed:.2f} s "
+          f"({len(rows) / elapsed if elapsed > 0 else 0:.1f} citra/s)")
@@ -0,0 +1,231 @@
+import cv2
+import numpy as np
+import time
+import argparse
+import threading
+import queue
+from collections import deque
+from CacheWarp import WarpCache
+
+# ==========================================
+# STABILISASI VIDEO (OPTICAL FLOW SPARSE)
+# ==========================================
+# Satu kali baca video: titik fitur dilacak frame-ke-frame dengan Lucas-Kanade
+# (deteksi ulang hanya jika titik yang tersisa terlalu sedikit), gerak kamera
+# diakumulasi menjadi trajektori (dx, dy, sudut), lalu dihaluskan dengan
+# moving average berjendela 2*radius+1. Frame ditahan `radius` frame di buffer
+# sampai trajektori masa depannya tersedia, jadi memori tetap terbatas.
+
+class FeatureTracker:
+    """Lacak titik sparse antar frame berurutan pada citra gray berskala track_scale"""
+
+    def __init__(self, max_corners=200, min_points=80, track_scale=0.5):
+        self.max_corners = max_corners
+        self.min_points = min_points
+        self.track_scale = track_scale
+        self.prev_gray = None
+        self.prev_pts = None
+        self.redetections = 0
+
+    def _prepare(self, frame):
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if self.track_scale != 1.0:
+            gray = cv2.resize(gray, None, fx=self.track_scale, fy=self.track_scale, interpolation=cv2.INTER_AREA)
+        return gray
+
+    def _detect(self, gray):
+        self.redetections += 1
+        return cv2.goodFeaturesToTrack(gray, self.max_corners, 0.01, 20, blockSize=3)
+
+    def update(self, frame):
+        """Gerak (dx, dy, da) dari frame sebelumnya ke frame ini dalam piksel resolusi asli"""
+        gray = self._prepare(frame)
+        motion = np.zeros(3)
+        if self.prev_gray is not None and self.prev_pts is not None and len(self.prev_pts) >= 3:
+            curr_pts, status, _ = cv2.calcOpticalFlowPyrLK(self.prev_gray, gray, self.prev_pts, None,
+                                                           winSize=(21, 21), maxLevel=3)
+            ok = status.ravel() == 1
+            prev_ok, curr_ok = self.prev_pts[ok], curr_pts[ok]
+            if len(prev_ok) >= 3:
+                M, _ = cv2.estimateAffinePartial2D(prev_ok, curr_ok, method=cv2.RANSAC)
+                if M is not None:
+                    motion = np.array([M[0, 2] / self.track_scale, M[1, 2] / self.track_scale,
+                                       np.arctan2(M[1, 0], M[0, 0])])
+            # Titik yang berhasil dilacak menjadi titik awal frame berikutnya (tanpa deteksi ulang)
+            self.prev_pts = curr_ok.reshape(-1, 1, 2)
+        if self.prev_pts is None or len(self.prev_pts) < self.min_points:
+            self.prev_pts = self._detect(gray)
+        self.prev_gray = gray
+        return motion
+
+def correction_matrix(correction, size, border_scale=1.04):
+    """Matriks 2x3: rotasi+translasi koreksi, lalu zoom tetap di pusat untuk menutup tepi hitam"""
+    dx, dy, da = correction
+    w, h = size
+    M = np.array([[np.cos(da), -np.sin(da), dx], [np.sin(da), np.cos(da), dy], [0, 0, 1]])
+    Z = np.vstack([cv2.getRotationMatrix2D((w / 2, h / 2), 0, border_scale), [0, 0, 1]])
+    return (Z @ M)[:2]
+
+class Stabilizer:
+    """
+    Stabilisasi online dengan tunda `radius` frame. push(frame) mengembalikan
+    list frame stabil yang siap ditulis; flush() mengeluarkan sisanya.
+    cache_step (px) > 0 membulatkan koreksi dan memakai tabel remap ter-cache
+    (efektif untuk kamera yang hampir diam); None memakai warpAffine biasa.
+    """
+
+    def __init__(self, size, radius=15, border_scale=1.04, cache_step=None, tracker=None):
+        self.size = size
+        self.radius = radius
+        self.border_scale = border_scale
+        self.cache_step = cache_step
+        self.tracker = tracker or FeatureTracker()
+        self.warp_cache = WarpCache(max_entries=256) if cache_step else None
+        self.frames = deque()
+        # Hanya jendela trajectory yang masih dibutuhkan (indeks >= emitted - radius,
+        # paling banyak 2*radius+2 entri); trajectory[k] = posisi frame base + k
+        self.trajectory = deque([np.zeros(3)])
+        self.base = 0
+        self.emitted = 0
+
+    def _position(self, i):
+        return self.trajectory[i - self.base]
+
+    def _smoothed(self, i, n):
+        lo, hi = max(0, i - self.radius), min(n, i + self.radius + 1)
+        return np.mean([self._position(k) for k in range(lo, hi)], axis=0)
+
+    def _emit(self, n):
+        frame = self._warp(self.frames.popleft(), self.emitted, n)
+        self.emitted += 1
+        # Posisi di luar jendela frame berikutnya tidak dipakai lagi
+        while self.base < self.emitted - self.radius:
+            self.trajectory.popleft()
+            self.base += 1
+        return frame
+
+    def _warp(self, frame, i, n):
+        correction = self._smoothed(i, n) - self._position(i)
+        if self.warp_cache is not None:
+            # Sudut dibulatkan setara cache_step px di tepi frame
+            step = np.array([self.cache_step, self.cache_step, self.cache_step / max(self.size)])
+            correction = np.round(correction / step) * step
+            M = correction_matrix(correction, self.size, self.border_scale)
+            return self.warp_cache.warp(frame, M, self.size, border_mode=cv2.BORDER_REPLICATE)
+        M = correction_matrix(correction, self.size, self.border_scale)
+        return cv2.warpAffine(frame, M, self.size, borderMode=cv2.BORDER_REPLICATE)
+
+    def push(self, frame):
+        if self.frames or self.emitted:
+            self.trajectory.append(self.trajectory[-1] + self.tracker.update(frame))
+        else:
+            self.tracker.update(frame)
+        self.frames.append(frame)
+        out = []
+        n = self.base + len(self.trajectory)
+        # Frame i bisa dikeluarkan setelah trajectory[i + radius] diketahui
+        while self.frames and self.emitted + self.radius < n:
+            out.append(self._emit(n))
+        return out
+
+    def flush(self):
+        n = self.base + len(self.trajectory)
+        out = []
+        while self.frames:
+            out.append(self._emit(n))
+        return out
+
+def _read_frames(cap, frames_q, stop):
+    """Thread decoder: decode berjalan paralel dengan tracking/warp (OpenCV melepas GIL)"""
+    while not stop.is_set():
+        ok, frame = cap.read()
+        item = frame if ok else None
+        # put dengan timeout agar thread tidak tertahan selamanya di antrian penuh saat dihentikan
+        while not stop.is_set():
+            try:
+                frames_q.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        if not ok:
+            break
+
+def _write_frames(writer, out_q):
+    """Thread encoder"""
+    while True:
+        frame = out_q.get()
+        if frame is None:
+            break
+        writer.write(frame)
+
+def stabilize_video(input_path, output_path, radius=15, border_scale=1.04, cache_step=None,
+                    track_scale=0.5, fourcc='mp4v'):
+    """Stabilisasi file video tanpa GUI; kembalikan statistik (frame, fps, waktu)"""
+    cap = cv2.VideoCapture(input_path)
+    if not cap.isOpened():
+        raise IOError(f"Video '{input_path}' tidak bisa dibuka")
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+    writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*fourcc), fps, size)
+    if not writer.isOpened():
+        cap.release()
+        raise IOError(f"Video output '{output_path}' tidak bisa ditulis")
+    stabilizer = Stabilizer(size, radius, border_scale, cache_step, FeatureTracker(track_scale=track_scale))
+    # Antrian terbatas agar decoder tidak menumpuk frame 1080p di memori
+    frames_q, out_q = queue.Queue(maxsize=8), queue.Queue(maxsize=8)
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_frames, args=(cap, frames_q, stop), daemon=True)
+    encoder = threading.Thread(target=_write_frames, args=(writer, out_q), daemon=True)
+    frames = 0
+    t0 = time.perf_counter()
+    reader.start()
+    encoder.start()
+    try:
+        while True:
+            frame = frames_q.get()
+            if frame is None:
+                break
+            frames += 1
+            for out in stabilizer.push(frame):
+                out_q.put(out)
+        for out in stabilizer.flush():
+            out_q.put(out)
+    finally:
+        out_q.put(None)
+        encoder.join()
+        # Hentikan decoder lalu kosongkan antrian agar put yang sedang menunggu tidak memblokir join
+        stop.set()
+        while True:
+            try:
+                frames_q.get_nowait()
+            except queue.Empty:
+                break
+        reader.join()
+        cap.release()
+        writer.release()
+    elapsed = time.perf_counter() - t0
+    stats = {'frames': frames, 'seconds': elapsed, 'fps': frames / elapsed if elapsed > 0 else 0.0,
+             'video_fps': fps, 'redetections': stabilizer.tracker.redetections}
+    if stabilizer.warp_cache is not None:
+        stats['cache_hits'] = stabilizer.warp_cache.hits
+        stats['cache_misses'] = stabilizer.warp_cache.misses
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stabilisasi video (optical flow sparse + moving average)")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--radius", type=int, default=15, help="Radius jendela smoothing (frame)")
+    parser.add_argument("--border-scale", type=float, default=1.04)
+    parser.add_argument("--track-scale", type=float, default=0.5)
+    parser.add_argument("--cache-step", type=float, default=None,
+                        help="Bulatkan koreksi (px) dan pakai remap ter-cache")
+    args = parser.parse_args()
+
+    stats = stabilize_video(args.input, args.output, args.radius, args.border_scale,
+                            args.cache_step, args.track_scale)
+    realtime = stats['fps'] / stats['video_fps']
+    print(f"{stats['frames']} frame dalam {stats['seconds']:.2f} s ({stats['fps']:.1f} fps, "
+          f"{realtime:.2f}x real time) | deteksi ulang fitur: {stats['redetections']}")
+    if 'cache_hits' in stats:
+        print(f"Cache remap: hit {stats['cache_hits']}, miss {stats['cache_misses']}")
@@ -0,0 +1,247 @@
+import cv2
+import numpy as np
+import time
+import os
+import argparse
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from EkualisasiAdaptif import TiledCLAHE
+
+# ==========================================
+# BATCH ENHANCEMENT CITRA MEDIS PER MODALITAS
+# ==========================================
+# Pipeline sama dengan medical_image_enhancement (latihan2.py), tetapi untuk
+# satu studi berisi banyak stack irisan (.npy uint8/uint16, bentuk
+# (irisan, baris, kolom)). Seri dikelompokkan per (modalitas, dtype) dan
+# setiap kelompok membangun sekali: objek CLAHE, LUT gamma, dan LUT jendela
+# CT dari histogram seluruh studi (bukan np.percentile per irisan). Irisan
+# dibaca/ditulis lewat memmap oleh worker proses, sehingga tidak ada volume
+# yang dimuat utuh ke memori atau di-pickle antar proses.
+
+MODALITY_SETTINGS = {
+    'X-ray': {'clip_limit': 2.0},
+    'MRI': {'gamma': 0.7, 'clip_limit': 1.5},
+    'CT': {'window': (2, 98)},
+    'Ultrasound': {'clip_limit': 1.0},
+}
+
+def modality_from_name(path):
+    """Modalitas dari prefiks nama file, mis. 'CT_thorax.npy' -> 'CT' (tidak dikenal -> 'Other')"""
+    prefix = os.path.basename(path).split('_')[0].lower()
+    for modality in MODALITY_SETTINGS:
+        if prefix == modality.lower():
+            return modality
+    return 'Other'
+
+def stack_histogram(stack):
+    """Histogram per nilai (256 atau 65536 bin) seluruh stack, dibaca per irisan dari memmap"""
+    value_range = 1 << (stack.dtype.itemsize * 8)
+    hist = np.zeros(value_range, dtype=np.int64)
+    for image in stack:
+        # bincount (int64) agar hitungan tetap eksak; calcHist float32 membulatkan bin > 2^24
+        hist += np.bincount(image.ravel(), minlength=value_range)
+    return hist
+
+def histogram_percentile(hist, q):
+    """Sama dengan np.percentile (interpolasi linear) pada piksel yang diurutkan"""
+    cdf = np.cumsum(hist)
+    k = q / 100 * (cdf[-1] - 1)
+    lo, hi = int(np.floor(k)), int(np.ceil(k))
+    v_lo = np.searchsorted(cdf, lo, side='right')
+    v_hi = np.searchsorted(cdf, hi, side='right')
+    return v_lo + (v_hi - v_lo) * (k - lo)
+
+class ModalityEnhancer:
+    """
+    Pipeline satu modalitas yang dibangun sekali per studi. hist (histogram
+    seluruh seri modalitas ini) menentukan jendela persentil CT, sehingga
+    semua irisan memakai LUT yang sama. bit_depth berasal dari detektor/
+    modalitas (None = lebar dtype), bukan dari nilai maksimum studi.
+    """
+
+    def __init__(self, modality, hist, dtype, bit_depth=None):
+        self.modality = modality
+        self.dtype = np.dtype(dtype)
+        self.bit_depth = bit_depth or self.dtype.itemsize * 8
+        if self.bit_depth > self.dtype.itemsize * 8:
+            raise ValueError(f"bit_depth {self.bit_depth} melebihi tipe {self.dtype} ({modality})")
+        max_value = (1 << self.bit_depth) - 1
+        values = np.arange(len(hist))
+        settings = MODALITY_SETTINGS.get(modality, {})
+        self.lut = None
+        self.clahe = None
+        steps = []
+        if 'gamma' in settings:
+            # Rumus sama dengan latihan2, dievaluasi sekali untuk setiap nilai piksel
+            gamma = settings['gamma']
+            self.lut = (np.power(values.astype(np.float32) / max_value, gamma) * max_value).astype(self.dtype)
+            steps.append(f"Gamma (y={gamma})")
+        if 'window' in settings:
+            lo, hi = (histogram_percentile(hist, q) for q in settings['window'])
+            clipped = np.clip(values, lo, hi)
+            self.lut = ((clipped - lo) / max(hi - lo, 1e-12) * max_value).astype(self.dtype)
+            steps.append(f"Jendela studi p{settings['window'][0]}-p{settings['window'][1]} [{lo:.0f}, {hi:.0f}]")
+        if 'clip_limit' in settings:
+            # workers=1: paralelisme sudah di tingkat proses
+            self.clahe = TiledCLAHE(settings['clip_limit'], (8, 8), bit_depth=self.bit_depth, workers=1)
+            steps.append(f"CLAHE (clip={settings['clip_limit']})")
+        if not settings:
+            # Ekualisasi global = CLAHE satu tile tanpa clipping (berlaku juga untuk uint16)
+            self.clahe = TiledCLAHE(0, (1, 1), bit_depth=self.bit_depth, workers=1)
+            steps.append("Ekualisasi global")
+        self.pipeline = " -> ".join(steps) + f" [{self.bit_depth}-bit]"
+
+    def enhance(self, image, out=None):
+        if self.lut is not None:
+            image = np.take(self.lut, image, out=out if self.clahe is None else None)
+        if self.clahe is not None:
+            image = self.clahe.apply(np.ascontiguousarray(image), out=out)
+        return image
+
+def _init_worker():
+    # Satu thread OpenCV per proses agar worker tidak saling berebut core
+    cv2.setNumThreads(1)
+
+def _process_chunk(task):
+    """Satu rentang irisan: baca dari memmap input, enhance, tulis langsung ke memmap output"""
+    in_path, out_path, start, end, enhancer = task
+    src = np.load(in_path, mmap_mode='r')
+    dst = np.load(out_path, mmap_mode='r+')
+    rows = []
+    for i in range(start, end):
+        t0 = time.perf_counter()
+        enhancer.enhance(src[i], out=dst[i])
+        rows.append({'Series': os.path.basename(in_path), 'Modality': enhancer.modality,
+                     'Slice': i, 'Time_ms': (time.perf_counter() - t0) * 1000})
+    dst.flush()
+    return rows
+
+def build_enhancers(series, bit_depths=None):
+    """
+    Kelompokkan seri per (modalitas, dtype) dan bangun ModalityEnhancer sekali
+    per kelompok; bit_depths = {modalitas: bit} (modalitas lain: lebar dtype).
+    """
+    bit_depths = bit_depths or {}
+    groups = defaultdict(list)
+    for path, modality in series:
+        groups[(modality, np.load(path, mmap_mode='r').dtype)].append(path)
+    enhancers = {}
+    for (modality, dtype), paths in groups.items():
+        hist = sum(stack_histogram(np.load(p, mmap_mode='r')) for p in paths)
+        enhancers[(modality, dtype)] = ModalityEnhancer(modality, hist, dtype, bit_depths.get(modality))
+    return enhancers
+
+def process_study(input_dir, output_dir, workers=None, chunk_size=8, bit_depths=None):
+    """
+    Enhance semua stack .npy di input_dir ke output_dir (nama file sama).
+    bit_depths = {modalitas: bit}, mis. {'CT': 12}; tanpa entri = lebar dtype.
+    Mengembalikan (baris per irisan, ringkasan studi, enhancer per kelompok).
+    """
+    paths = sorted(os.path.join(input_dir, f) for f in os.listdir(input_dir) if f.endswith('.npy'))
+    series = [(p, modality_from_name(p)) for p in paths]
+    os.makedirs(output_dir, exist_ok=True)
+    # open_memmap mode w+ mengosongkan file: output tidak boleh menimpa stack input
+    for path, _ in series:
+        out_path = os.path.join(output_dir, os.path.basename(path))
+        if os.path.exists(out_path) and os.path.samefile(path, out_path):
+            raise ValueError(f"Output {out_path} sama dengan input; pilih output_dir lain")
+
+    t0 = time.perf_counter()
+    enhancers = build_enhancers(series, bit_depths)
+    t_build = time.perf_counter() - t0
+
+    tasks = []
+    n_pixels = 0
+    for path, modality in series:
+        src = np.load(path, mmap_mode='r')
+        out_path = os.path.join(output_dir, os.path.basename(path))
+        # File output dibuat di proses utama; worker membukanya kembali dengan mode r+
+        np.lib.format.open_memmap(out_path, mode='w+', dtype=src.dtype, shape=src.shape).flush()
+        enhancer = enhancers[(modality, src.dtype)]
+        n_pixels += src.size
+        tasks += [(path, out_path, i, min(i + chunk_size, len(src)), enhancer)
+                  for i in range(0, len(src), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        rows = [row for chunk in pool.map(_process_chunk, tasks) for row in chunk]
+    elapsed = time.perf_counter() - t0
+    summary = {'series': len(series), 'slices': len(rows), 'seconds': elapsed, 'build_seconds': t_build,
+               'slices_per_s': len(rows) / elapsed if elapsed > 0 else 0.0,
+               'mp_per_s': n_pixels / 1e6 / elapsed if elapsed > 0 else 0.0}
+    return rows, summary, enhancers
+
+def print_report(rows, summary, enhancers):
+    print(f"{'Modalitas':<11} | {'Pipeline':<58} | {'Irisan':>6} | {'Median (ms)':>11} | {'p95 (ms)':>8}")
+    print("-" * 106)
+    for (modality, _), enhancer in enhancers.items():
+        times = [r['Time_ms'] for r in rows if r['Modality'] == modality]
+        if times:
+            print(f"{modality:<11} | {enhancer.pipeline:<58} | {len(times):>6} | "
+                  f"{np.median(times):>11.2f} | {np.percentile(times, 95):>8.2f}")
+    print(f"\nStudi: {summary['series']} seri, {summary['slices']} irisan dalam {summary['seconds']:.2f} s "
+          f"(persiapan LUT/CLAHE {summary['build_seconds'] * 1000:.0f} ms) | "
+          f"{summary['slices_per_s']:.1f} irisan/s | {summary['mp_per_s']:.1f} MP/s")
+
+def _bit_depth_arg(item):
+    """Argumen --bit-depth 'CT=12' -> ('CT', 12)"""
+    modality, _, bits = item.rpartition('=')
+    if modality not in MODALITY_SETTINGS or not bits.isdigit() or not 8 <= int(bits) <= 16:
+        raise argparse.ArgumentTypeError(f"harus MODALITAS=BIT (8..16), bukan {item!r}")
+    return modality, int(bits)
+
+# Kedalaman bit detektor untuk studi sintetis di bawah
+SYNTHETIC_BIT_DEPTHS = {'CT': 12, 'MRI': 12, 'X-ray': 14}
+
+def _synthetic_study(directory, n_slices=24, size=512):
+    """Studi sintetis: CT & MRI 12-bit, X-ray 14-bit, Ultrasound 8-bit"""
+    rng = np.random.default_rng(0)
+    yy, xx = np.mgrid[0:size, 0:size]
+    body = ((yy - size / 2) ** 2 + (xx - size / 2) ** 2 < (size * 0.4) ** 2)
+    specs = [('CT_thorax.npy', 4095, np.uint16, n_slices), ('MRI_brain.npy', 4095, np.uint16, n_slices),
+             ('X-ray_ap.npy', 16383, np.uint16, 2), ('Ultrasound_abdomen.npy', 255, np.uint8, n_slices)]
+    for name, max_value, dtype, count in specs:
+        stack = np.lib.format.open_memmap(os.path.join(directory, name), mode='w+', dtype=dtype,
+                                          shape=(count, size, size))
+        for i in range(count):
+            base = max_value * (0.15 + 0.35 * body + 0.1 * np.sin(xx / 40.0 + i / 5.0))
+            stack[i] = np.clip(base + rng.normal(0, max_value * 0.03, (size, size)), 0, max_value)
+        stack.flush()
+        del stack
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Enhancement batch studi medis per modalitas (stack .npy memmap)")
+    parser.add_argument("input_dir", nargs="?", help="Folder stack .npy bernama <Modalitas>_*.npy (kosong = studi sintetis)")
+    parser.add_argument("output_dir", nargs="?")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=8, help="Jumlah irisan per tugas worker")
+    parser.add_argument("--bit-depth", action="append", type=_bit_depth_arg, default=[], metavar="MODALITAS=BIT",
+                        help="Kedalaman bit detektor per modalitas, mis. CT=12 (default: lebar dtype)")
+    args = parser.parse_args()
+
+    if args.input_dir and args.output_dir:
+        print_report(*process_study(args.input_dir, args.output_dir, args.workers, args.chunk,
+                                    dict(args.bit_depth)))
+    else:
+        from latihan2 import medical_image_enhancement
+        with tempfile.TemporaryDirectory() as tmp:
+            src_dir, dst_dir = os.path.join(tmp, 'studi'), os.path.join(tmp, 'hasil')
+            os.makedirs(src_dir)
+            _synthetic_study(src_dir)
+            rows, summary, enhancers = process_study(src_dir, dst_dir, args.workers, args.chunk,
+                                                     SYNTHETIC_BIT_DEPTHS)
+            print_report(rows, summary, enhancers)
+
+            # Bandingkan dengan pemrosesan satu per satu (CLAHE & persentil per irisan)
+            ct = np.load(os.path.join(src_dir, 'CT_thorax.npy'), mmap_mode='r')
+            t0 = time.perf_counter()
+            for image in ct:
+                medical_image_enhancement(np.array(image), 'CT', SYNTHETIC_BIT_DEPTHS['CT'])
+            t_single = (time.perf_counter() - t0) / len(ct)
+            ct_rows = [r['Time_ms'] for r in rows if r['Modality'] == 'CT']
+            print(f"CT per irisan: satu per satu {t_single * 1000:.2f} ms (termasuk metrik) | "
+                  f"batch {np.median(ct_rows):.2f} ms")
+            mri_in = np.array(np.load(os.path.join(src_dir, 'MRI_brain.npy'), mmap_mode='r')[0])
+            mri_out = np.load(os.path.join(dst_dir, 'MRI_brain.npy'), mmap_mode='r')[0]
+            print("Irisan MRI sama dengan medical_image_enhancement:",
+                  np.array_equal(mri_out, medical_image_enhancement(mri_in, 'MRI', SYNTHETIC_BIT_DEPTHS['MRI'])[0]))
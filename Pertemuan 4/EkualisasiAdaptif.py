@@ -0,0 +1,254 @@
+import cv2
+import numpy as np
+import os
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PengukuranWaktu import time_call
+
+# ==========================================
+# CLAHE BERBASIS TILE UNTUK UINT8 & UINT16
+# ==========================================
+# Semantik sama dengan cv2.createCLAHE (tile, clip limit relatif terhadap
+# rata-rata isi bin, redistribusi excess, interpolasi bilinear antar pusat
+# tile), tetapi berjalan pada kedalaman bit asli citra (mis. X-ray 12-bit,
+# CT/MRI 16-bit) dengan jumlah bin yang bisa diatur. Jika bin lebih kasar dari
+# rentang nilai, CDF diinterpolasi linear di dalam bin sehingga LUT tetap
+# memiliki resolusi nilai penuh (tidak ada pemotongan ke 8-bit).
+#  1. Histogram tile: cv2.calcHist per tile, baris tile dibagi ke thread pool
+#  2. Clip & redistribusi: operasi NumPy pada array (tile, bin) sekaligus
+#  3. Interpolasi: citra dibagi menjadi region yang empat tile tetangganya
+#     sama, sehingga bobot bilinear terpisah per baris/kolom
+
+DEFAULT_MAX_BINS = 4096
+
+def resolve_bit_depth(image, bit_depth=None):
+    """bit_depth dari pemanggil/modalitas; None = lebar dtype citra (8 untuk uint8, 16 untuk uint16)"""
+    return bit_depth or image.dtype.itemsize * 8
+
+def infer_bit_depth(image):
+    """
+    Tebakan opsional dari isi citra: 8 untuk uint8, bit_length(maks) (minimal
+    8) untuk uint16. Bergantung pada nilai maksimum tiap citra, jadi hanya
+    dipakai jika pemanggil memilihnya secara eksplisit.
+    """
+    if image.dtype == np.uint8:
+        return 8
+    return max(8, int(cv2.minMaxLoc(image)[1]).bit_length())
+
+def tile_histograms(image, tile_grid, n_bins, value_range, workers=None):
+    """Histogram (tiles_y, tiles_x, n_bins) semua tile; ukuran citra kelipatan tile_grid"""
+    tiles_y, tiles_x = tile_grid
+    th, tw = image.shape[0] // tiles_y, image.shape[1] // tiles_x
+
+    def row_histograms(i):
+        rows = image[i * th:(i + 1) * th]
+        return [cv2.calcHist([rows[:, j * tw:(j + 1) * tw]], [0], None, [n_bins], [0, value_range]).ravel()
+                for j in range(tiles_x)]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        hists = list(pool.map(row_histograms, range(tiles_y)))
+    # Tetap float32 seperti keluaran calcHist: eksak selama luas tile <= 2^24 piksel
+    return np.array(hists)
+
+def clip_histograms(hists, clip):
+    """
+    Potong setiap histogram di `clip` lalu bagikan excess seperti OpenCV:
+    rata ke semua bin, sisanya +1 pada bin berjarak n_bins // sisa.
+    """
+    shape, n_bins = hists.shape, hists.shape[-1]
+    total = hists.reshape(-1, n_bins).sum(axis=-1)
+    hists = np.minimum(hists.reshape(-1, n_bins), clip)
+    excess = (total - hists.sum(axis=-1)).astype(np.int64)
+    batch, residual = np.divmod(excess, n_bins)
+    hists += batch[:, None].astype(hists.dtype)
+    # Sisa: bin 0, step, 2*step, ... sebanyak `residual` (slice berlangkah, satu per tile)
+    step = np.maximum(n_bins // np.maximum(residual, 1), 1)
+    for hist, count, stride in zip(hists, residual, step):
+        if count:
+            hist[:count * stride:stride] += 1
+    return hists.reshape(shape)
+
+def tile_luts(hists, value_range, max_value, tile_area):
+    """
+    LUT float32 (tiles, value_range) berisi nilai bulat dari histogram ter-clip.
+    Nilai v di bin b dengan posisi k (0..w-1) dipetakan ke
+    (cdf(b-1) + h(b) * (k+1)/w) * max/area; untuk w = 1 ini sama persis
+    dengan CDF inklusif OpenCV.
+    """
+    width = value_range // hists.shape[-1]
+    hists = hists.astype(np.float32, copy=False)
+    if width == 1:
+        lut = np.cumsum(hists, axis=-1, dtype=np.float32)
+    else:
+        cdf_before = np.cumsum(hists, axis=-1) - hists
+        ramp = np.arange(1, width + 1, dtype=np.float32) / width
+        lut = (cdf_before[..., None] + hists[..., None] * ramp).reshape(*hists.shape[:-1], value_range)
+    lut *= np.float32(max_value / tile_area)
+    np.rint(lut, out=lut)
+    # Tetap float32 (bukan dtype citra) agar interpolasi memakainya langsung
+    return np.minimum(lut, max_value, out=lut)
+
+def _axis_weights(n, tile_size, n_tiles):
+    """Indeks tile kiri/kanan dan bobot bilinear per baris atau kolom (rumus OpenCV)"""
+    pos = np.arange(n, dtype=np.float32) * np.float32(1.0 / tile_size) - np.float32(0.5)
+    t1 = np.floor(pos).astype(np.intp)
+    weight = pos - t1
+    return np.maximum(t1, 0), np.minimum(t1 + 1, n_tiles - 1), weight
+
+def _runs(first, second):
+    """Batas [awal, akhir) segmen berurutan dengan pasangan tile yang sama"""
+    change = np.flatnonzero((np.diff(first) != 0) | (np.diff(second) != 0)) + 1
+    bounds = np.concatenate([[0], change, [len(first)]])
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def interpolate_tiles(image, luts, tile_size, out, workers=None):
+    """Bilinear antar LUT empat pusat tile terdekat; region dengan tile sama diproses sekaligus"""
+    tiles_y, tiles_x = luts.shape[:2]
+    th, tw = tile_size
+    y1, y2, ya = _axis_weights(image.shape[0], th, tiles_y)
+    x1, x2, xa = _axis_weights(image.shape[1], tw, tiles_x)
+    col_runs = _runs(x1, x2)
+    max_cols = max(c1 - c0 for c0, c1 in col_runs)
+
+    if image.dtype == np.uint8:
+        # cv2.LUT dengan tabel float32 256 entri jauh lebih cepat daripada np.take
+        def gather(lut, block, out):
+            return cv2.LUT(block, lut, dst=out)
+    else:
+        def gather(lut, block, out):
+            return np.take(lut, block, out=out)
+
+    def process_rows(run):
+        r0, r1 = run
+        ty1, ty2 = y1[r0], y2[r0]
+        wy = ya[r0:r1, None]
+        # Buffer float32 dipakai ulang untuk semua region pada baris tile ini
+        buffers = np.empty((3, r1 - r0, max_cols), dtype=np.float32)
+        for c0, c1 in col_runs:
+            tx1, tx2 = x1[c0], x2[c0]
+            block = image[r0:r1, c0:c1]
+            wx = xa[c0:c1]
+            top, bottom, other = buffers[:, :, :c1 - c0]
+            # top = A + (B - A) * wx, bottom = C + (D - C) * wx, hasil = top + (bottom - top) * wy
+            top = gather(luts[ty1, tx1], block, top)
+            other = gather(luts[ty1, tx2], block, other)
+            other -= top
+            other *= wx
+            top += other
+            bottom = gather(luts[ty2, tx1], block, bottom)
+            other = gather(luts[ty2, tx2], block, other)
+            other -= bottom
+            other *= wx
+            bottom += other
+            bottom -= top
+            bottom *= wy
+            top += bottom
+            out[r0:r1, c0:c1] = np.rint(top, out=top)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(process_rows, _runs(y1, y2)))
+    return out
+
+class TiledCLAHE:
+    """
+    Pengganti cv2.createCLAHE(clipLimit, tileGridSize) untuk citra gray uint8
+    atau uint16; tile_grid = (tile_x, tile_y) seperti tileGridSize.
+    bit_depth=None memakai lebar dtype (8 atau 16 bit); citra 12-bit dalam
+    uint16 perlu bit_depth=12 dari pemanggil/modalitas agar keluar dalam
+    rentang 0..4095 untuk setiap citra. n_bins=None
+    memakai min(2^bit_depth, 4096, luas tile) dibulatkan ke pangkat dua
+    (minimal 256), agar rata-rata isi bin tidak jatuh di bawah satu piksel
+    dan clip limit tetap bermakna pada tile kecil. clip_limit <= 0 berarti
+    tanpa clipping.
+    """
+
+    def __init__(self, clip_limit=2.0, tile_grid=(8, 8), n_bins=None, bit_depth=None, workers=None):
+        self.clip_limit = clip_limit
+        self.tile_grid = tuple(tile_grid)
+        self.n_bins = n_bins
+        self.bit_depth = bit_depth
+        self.workers = workers or os.cpu_count() or 1
+
+    def _resolve_depth(self, image):
+        if image.dtype not in (np.uint8, np.uint16) or image.ndim != 2:
+            raise ValueError(f"CLAHE butuh citra gray uint8/uint16, bukan {image.dtype} {image.shape}")
+        bit_depth = resolve_bit_depth(image, self.bit_depth)
+        if bit_depth > image.dtype.itemsize * 8:
+            raise ValueError(f"bit_depth {bit_depth} melebihi tipe {image.dtype}")
+        if bit_depth < image.dtype.itemsize * 8 and cv2.minMaxLoc(image)[1] >= 1 << bit_depth:
+            raise ValueError(f"Nilai piksel melebihi rentang {bit_depth}-bit")
+        return 1 << bit_depth
+
+    def _resolve_bins(self, value_range, tile_area):
+        if self.n_bins is None:
+            per_tile = 1 << max(8, tile_area.bit_length() - 1)
+            return min(value_range, DEFAULT_MAX_BINS, per_tile)
+        if self.n_bins > value_range or value_range % self.n_bins:
+            raise ValueError(f"n_bins {self.n_bins} harus membagi rentang nilai {value_range}")
+        return self.n_bins
+
+    def apply(self, image, out=None):
+        value_range = self._resolve_depth(image)
+        tiles_x, tiles_y = self.tile_grid
+        h, w = image.shape
+        # Sama seperti OpenCV: jika salah satu sisi bukan kelipatan grid, histogram dihitung
+        # pada citra yang dipad (reflect 101) sebesar tiles - (sisi % tiles) di kedua sisi
+        # (sisi yang sudah kelipatan pun bertambah satu tile); interpolasi hanya piksel asli
+        if h % tiles_y or w % tiles_x:
+            padded = cv2.copyMakeBorder(image, 0, tiles_y - h % tiles_y, 0, tiles_x - w % tiles_x,
+                                        cv2.BORDER_REFLECT_101)
+        else:
+            padded = image
+        tile_size = (padded.shape[0] // tiles_y, padded.shape[1] // tiles_x)
+        tile_area = tile_size[0] * tile_size[1]
+        n_bins = self._resolve_bins(value_range, tile_area)
+
+        hists = tile_histograms(padded, (tiles_y, tiles_x), n_bins, value_range, self.workers)
+        if self.clip_limit > 0:
+            clip = max(int(self.clip_limit * tile_area / n_bins), 1)
+            hists = clip_histograms(hists, clip)
+        luts = tile_luts(hists, value_range, value_range - 1, tile_area)
+        if out is None:
+            out = np.empty_like(image)
+        return interpolate_tiles(image, luts, tile_size, out, self.workers)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLAHE tile uint8/uint16 vs cv2.createCLAHE")
+    parser.add_argument("--size", type=int, nargs=2, default=(2048, 2048), metavar=("BARIS", "KOLOM"))
+    parser.add_argument("--clip", type=float, default=2.0)
+    parser.add_argument("--grid", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    h, w = args.size
+    yy, xx = np.mgrid[0:h, 0:w]
+    # Radiograf sintetis 12-bit: gradien lembut + struktur + noise
+    base = 1500 + 900 * np.sin(xx / 180.0) * np.cos(yy / 240.0) + 600 * (xx / w)
+    img12 = np.clip(base + rng.normal(0, 40, (h, w)), 0, 4095).astype(np.uint16)
+    img8 = (img12 >> 4).astype(np.uint8)
+    img16 = img12 << 4
+    grid = (args.grid, args.grid)
+
+    print(f"{'Kasus':<34} | {'OpenCV (ms)':>11} | {'Tile (ms)':>9} | {'Maks selisih':>12}")
+    print("-" * 78)
+    cases = [
+        ('uint8, 256 bin', img8, TiledCLAHE(args.clip, grid)),
+        ('uint16 16-bit, 65536 bin', img16, TiledCLAHE(args.clip, grid, n_bins=65536, bit_depth=16)),
+    ]
+    for name, img, engine in cases:
+        ref_clahe = cv2.createCLAHE(clipLimit=args.clip, tileGridSize=grid)
+        ref = ref_clahe.apply(img)
+        res = engine.apply(img)
+        diff = int(np.abs(ref.astype(np.int64) - res).max())
+        print(f"{name:<34} | {time_call(lambda: ref_clahe.apply(img), repeats=5)[1] * 1000:>11.1f} | "
+              f"{time_call(lambda: engine.apply(img), repeats=5)[1] * 1000:>9.1f} | {diff:>12}")
+
+    # Presisi: 12-bit native vs dipotong ke 8-bit lebih dulu
+    native = TiledCLAHE(args.clip, grid, bit_depth=12)
+    t_native = time_call(lambda: native.apply(img12), repeats=5)[1]
+    res12 = native.apply(img12)
+    res8 = cv2.createCLAHE(clipLimit=args.clip, tileGridSize=grid).apply(img8)
+    print(f"\n12-bit native: {t_native * 1000:.1f} ms | level unik: {len(np.unique(res12))} "
+          f"(lewat 8-bit: {len(np.unique(res8))})")
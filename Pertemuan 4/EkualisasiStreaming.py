@@ -0,0 +1,122 @@
+import numpy as np
+import time
+import os
+import argparse
+import tempfile
+
+# ==========================================
+# EKUALISASI HISTOGRAM STREAMING (DUA PASS)
+# ==========================================
+# Pass 1: histogram dibangun per blok baris dengan np.bincount (blok baris
+# array C-contiguous di-ravel tanpa salinan). Pass 2: LUT diterapkan per blok
+# langsung ke output memory-mapped. Memori yang dipakai hanya sebesar satu
+# blok, berapapun ukuran citranya. Murni NumPy, sama seperti latihan1.py.
+
+# np.bincount mengonversi blok ke intp (8 byte/piksel), jadi blok 16 MB
+# memakai sekitar 128 MB sementara saat pass histogram
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+def equalization_lut(hist):
+    """
+    LUT ekualisasi dari histogram 256-bin, rumus sama dengan
+    manual_histogram_equalization: T(v) = (cdf(v) - cdf_min) * 255 / (M*N - cdf_min),
+    bin dengan cdf = 0 dipetakan ke 0.
+    """
+    cdf = np.cumsum(hist, dtype=np.int64)
+    nonzero = np.flatnonzero(cdf)
+    if nonzero.size == 0:
+        return np.zeros(256, dtype=np.uint8)
+    cdf_min = cdf[nonzero[0]]
+    denom = max(cdf[-1] - cdf_min, 1)
+    lut = (cdf - cdf_min) * 255.0 / denom
+    lut[cdf == 0] = 0
+    return lut.astype(np.uint8)
+
+def _row_chunks(n_rows, row_bytes, chunk_rows=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    chunk_rows = chunk_rows or max(1, chunk_bytes // max(row_bytes, 1))
+    for r0 in range(0, n_rows, chunk_rows):
+        yield r0, min(r0 + chunk_rows, n_rows)
+
+def histogram_chunked(image, chunk_rows=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Histogram 256-bin citra uint8 (array atau memmap), dibaca blok demi blok"""
+    hist = np.zeros(256, dtype=np.int64)
+    row_bytes = image[0].nbytes if len(image) else 0
+    for r0, r1 in _row_chunks(image.shape[0], row_bytes, chunk_rows, chunk_bytes):
+        hist += np.bincount(image[r0:r1].ravel(), minlength=256)
+    return hist
+
+def apply_lut_chunked(image, lut, out, chunk_rows=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """out[...] = lut[image] per blok baris (tanpa temporary seukuran citra)"""
+    row_bytes = image[0].nbytes if len(image) else 0
+    for r0, r1 in _row_chunks(image.shape[0], row_bytes, chunk_rows, chunk_bytes):
+        np.take(lut, image[r0:r1], out=out[r0:r1])
+    return out
+
+def equalize_streaming(image, out=None, chunk_rows=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Ekualisasi dua pass untuk array/memmap uint8. Mengembalikan (output, LUT)"""
+    if image.dtype != np.uint8:
+        raise ValueError(f"Ekualisasi streaming butuh citra uint8, bukan {image.dtype}")
+    lut = equalization_lut(histogram_chunked(image, chunk_rows, chunk_bytes))
+    if out is None:
+        out = np.empty_like(image)
+    return apply_lut_chunked(image, lut, out, chunk_rows, chunk_bytes), lut
+
+def open_image_memmap(path, shape=None):
+    """File .npy dibuka dengan mmap_mode='r'; file raw butuh shape (baris, kolom)"""
+    if path.endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+    if shape is None:
+        raise ValueError("File raw membutuhkan --shape BARIS KOLOM")
+    return np.memmap(path, dtype=np.uint8, mode='r', shape=tuple(shape))
+
+def equalize_file(input_path, output_path, shape=None, chunk_rows=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Ekualisasi file citra besar ke file output (.npy atau raw) secara streaming"""
+    # Mode w+ mengosongkan file output: tidak boleh menimpa file input yang sedang dibaca
+    if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        raise ValueError(f"Output {output_path} sama dengan input; pilih file lain")
+    image = open_image_memmap(input_path, shape)
+    if output_path.endswith('.npy'):
+        out = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.uint8, shape=image.shape)
+    else:
+        out = np.memmap(output_path, dtype=np.uint8, mode='w+', shape=image.shape)
+    _, lut = equalize_streaming(image, out, chunk_rows, chunk_bytes)
+    out.flush()
+    return lut
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ekualisasi histogram streaming untuk citra sangat besar")
+    parser.add_argument("input", nargs="?", help="File .npy atau raw uint8 (kosong = citra sintetis)")
+    parser.add_argument("output", nargs="?")
+    parser.add_argument("--shape", type=int, nargs=2, metavar=("BARIS", "KOLOM"))
+    parser.add_argument("--chunk-mb", type=int, default=DEFAULT_CHUNK_BYTES // (1024 * 1024))
+    parser.add_argument("--size", type=int, default=8192, help="Sisi citra sintetis")
+    args = parser.parse_args()
+    chunk_bytes = args.chunk_mb * 1024 * 1024
+
+    if args.input and args.output:
+        t0 = time.perf_counter()
+        equalize_file(args.input, args.output, args.shape, chunk_bytes=chunk_bytes)
+        print(f"Selesai dalam {time.perf_counter() - t0:.2f} s -> {args.output}")
+    else:
+        from latihan1 import manual_histogram_equalization
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, 'scan.npy')
+            dst = os.path.join(tmp, 'scan_eq.npy')
+            # Citra sintetis gelap ditulis per blok agar pembuatannya juga tidak memakan memori besar
+            rng = np.random.default_rng(0)
+            image = np.lib.format.open_memmap(src, mode='w+', dtype=np.uint8, shape=(args.size, args.size))
+            for r0, r1 in _row_chunks(args.size, args.size, chunk_bytes=chunk_bytes):
+                image[r0:r1] = np.clip(rng.normal(50, 15, (r1 - r0, args.size)), 0, 255)
+            image.flush()
+            del image
+
+            t0 = time.perf_counter()
+            lut = equalize_file(src, dst, chunk_bytes=chunk_bytes)
+            t_stream = time.perf_counter() - t0
+            print(f"Streaming {args.size}x{args.size} ({args.size ** 2 / 1e6:.0f} MP, blok {args.chunk_mb} MB): "
+                  f"{t_stream:.2f} s ({args.size ** 2 / 1e6 / t_stream:.0f} MP/s)")
+
+            sample = np.load(src, mmap_mode='r')[:1024]
+            _, lut_manual = manual_histogram_equalization(np.array(sample))
+            _, lut_stream = equalize_streaming(np.array(sample))
+            print("LUT sama dengan manual_histogram_equalization:", np.array_equal(lut_manual, lut_stream))
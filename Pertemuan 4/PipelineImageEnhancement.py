@@ -2,6 +2,7 @@ import cv2
 import numpy as np
 import matplotlib.pyplot as plt
 from skimage.measure import shannon_entropy
+from EkualisasiAdaptif import TiledCLAHE, resolve_bit_depth
 
 # ==========================================
 # IDENTITAS MAHASISWA
@@ -43,21 +44,27 @@ def point_processing(img):
     
     return img_neg, img_log, img_gamma_low, img_gamma_mid, img_gamma_high
 
-def histogram_processing(img):
-    """Implementasi Contrast Stretching, Global HE, dan CLAHE."""
+def histogram_processing(img, bit_depth=None):
+    """Implementasi Contrast Stretching, Global HE, dan CLAHE (uint8 atau uint16 12-16 bit; bit_depth None = lebar dtype)."""
+    bit_depth = resolve_bit_depth(img, bit_depth)
+    max_value = (1 << bit_depth) - 1
+
     # 1. Contrast Stretching (Manual: Clip 5-95 percentile)
     p5, p95 = np.percentile(img, (5, 95))
     img_stretch_man = np.clip(img, p5, p95)
-    img_stretch_man = ((img_stretch_man - p5) / (p95 - p5) * 255).astype(np.uint8)
+    img_stretch_man = ((img_stretch_man - p5) / (p95 - p5) * max_value).astype(img.dtype)
     
     # 2. Contrast Stretching (Automatic: Min-Max)
-    img_stretch_auto = cv2.normalize(img, None, 0, 255, cv2.NORM_MINMAX)
+    img_stretch_auto = cv2.normalize(img, None, 0, max_value, cv2.NORM_MINMAX)
     
-    # 3. Global Histogram Equalization
-    img_he = cv2.equalizeHist(img)
+    # 3. Global Histogram Equalization (equalizeHist hanya 8-bit; uint16 = CLAHE 1 tile tanpa clip)
+    if img.dtype == np.uint8:
+        img_he = cv2.equalizeHist(img)
+    else:
+        img_he = TiledCLAHE(clip_limit=0, tile_grid=(1, 1), bit_depth=bit_depth).apply(img)
     
-    # 4. Adaptive HE (CLAHE)
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+    # 4. Adaptive HE (CLAHE) pada kedalaman bit asli
+    clahe = TiledCLAHE(clip_limit=2.0, tile_grid=(8, 8), bit_depth=bit_depth)
     img_clahe = clahe.apply(img)
     
     return img_stretch_man, img_stretch_auto, img_he, img_clahe
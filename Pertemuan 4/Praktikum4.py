@@ -6,6 +6,11 @@ import cv2
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from HistogramCitra import cached_histogram, image_statistics
+from EkualisasiAdaptif import TiledCLAHE, resolve_bit_depth
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -45,16 +50,8 @@ def load_sample_images():
 
 def analyze_image_statistics(image, name):
     """Calculate image statistics"""
-    stats_dict = {
-        'name': name,
-        'mean': np.mean(image),
-        'std': np.std(image),
-        'min': np.min(image),
-        'max': np.max(image),
-        'dynamic_range': np.max(image) - np.min(image),
-        'entropy': stats.entropy(np.histogram(image.flatten(), 256, [0,256])[0])
-    }
-    return stats_dict
+    # Semua statistik dari satu pass histogram (uint8) atau Welford (float)
+    return image_statistics(image, name)
 
 # =============== MAIN PRAKTIKUM ===============
 
@@ -287,25 +284,28 @@ for metric in ['mean', 'std', 'min', 'max', 'dynamic_range', 'entropy']:
 # 4. CLAHE (CONTRAST LIMITED ADAPTIVE HISTOGRAM EQUALIZATION)
 print("\n4. CLAHE - CONTRAST LIMITED ADAPTIVE HISTOGRAM EQUALIZATION")
 
-def demonstrate_clahe(image):
-    """Demonstrate CLAHE with different parameters"""
+def demonstrate_clahe(image, bit_depth=None):
+    """Demonstrate CLAHE with different parameters (uint8 or 12-16 bit uint16)"""
     
     # Create CLAHE object with different parameters
+    # TiledCLAHE = hasil cv2.createCLAHE untuk uint8, tetapi juga berjalan pada kedalaman bit asli
+    bit_depth = resolve_bit_depth(image, bit_depth)
+    value_range = 1 << bit_depth
     clahe_configs = [
-        ('Default', cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))),
-        ('High Clip', cv2.createCLAHE(clipLimit=4.0, tileGridSize=(8, 8))),
-        ('Small Tiles', cv2.createCLAHE(clipLimit=2.0, tileGridSize=(4, 4))),
-        ('Large Tiles', cv2.createCLAHE(clipLimit=2.0, tileGridSize=(16, 16)))
+        ('Default', TiledCLAHE(clip_limit=2.0, tile_grid=(8, 8), bit_depth=bit_depth)),
+        ('High Clip', TiledCLAHE(clip_limit=4.0, tile_grid=(8, 8), bit_depth=bit_depth)),
+        ('Small Tiles', TiledCLAHE(clip_limit=2.0, tile_grid=(4, 4), bit_depth=bit_depth)),
+        ('Large Tiles', TiledCLAHE(clip_limit=2.0, tile_grid=(16, 16), bit_depth=bit_depth))
     ]
     
     fig, axes = plt.subplots(2, 5, figsize=(20, 8))
     
     # Original image and histogram
     axes[0, 0].imshow(image, cmap='gray')
-    axes[0, 0].set_title('Original Image')
+    axes[0, 0].set_title(f'Original Image ({bit_depth}-bit)')
     axes[0, 0].axis('off')
     
-    axes[1, 0].hist(image.ravel(), 256, [0, 256], color='gray', alpha=0.7)
+    axes[1, 0].hist(image.ravel(), 256, [0, value_range], color='gray', alpha=0.7)
     axes[1, 0].set_title('Original Histogram')
     axes[1, 0].set_xlabel('Intensity')
     axes[1, 0].set_ylabel('Frequency')
@@ -321,7 +321,7 @@ def demonstrate_clahe(image):
         axes[0, idx].axis('off')
         
         # Display histogram
-        axes[1, idx].hist(clahe_result.ravel(), 256, [0, 256], color='blue', alpha=0.7)
+        axes[1, idx].hist(clahe_result.ravel(), 256, [0, value_range], color='blue', alpha=0.7)
         axes[1, idx].set_title(f'{title} Histogram')
         axes[1, idx].set_xlabel('Intensity')
         axes[1, idx].set_ylabel('Frequency')
@@ -337,6 +337,10 @@ def demonstrate_clahe(image):
 dark_image = sample_images['dark']
 clahe_configs = demonstrate_clahe(dark_image)
 
+# Citra gelap 12-bit (mis. keluaran detektor) diproses tanpa dipotong ke 8-bit
+dark_image_12bit = dark_image.astype(np.uint16) * 16 + np.random.randint(0, 16, dark_image.shape).astype(np.uint16)
+demonstrate_clahe(dark_image_12bit, bit_depth=12)
+
 # 5. COMPREHENSIVE ENHANCEMENT PIPELINE
 print("\n5. COMPREHENSIVE ENHANCEMENT PIPELINE")
 
@@ -421,8 +425,9 @@ def calculate_enhancement_metrics(original, enhanced):
     metrics['CII'] = enhanced_contrast / original_contrast if original_contrast > 0 else 0
     
     # 2. Entropy improvement
-    orig_hist, _ = np.histogram(original.flatten(), 256, [0, 256])
-    enh_hist, _ = np.histogram(enhanced.flatten(), 256, [0, 256])
+    # Histogram dihitung sekali per citra (test_img dipakai ulang untuk semua metode)
+    orig_hist = cached_histogram(original)
+    enh_hist = cached_histogram(enhanced)
     orig_entropy = stats.entropy(orig_hist + 1e-10)  # Add small value to avoid log(0)
     enh_entropy = stats.entropy(enh_hist + 1e-10)
     metrics['entropy_improvement'] = enh_entropy - orig_entropy
@@ -1,6 +1,10 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.image as mpimg
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from HistogramCitra import histogram_uint8
 
 def manual_histogram_equalization(image):
     """
@@ -13,8 +17,8 @@ def manual_histogram_equalization(image):
     Returns:
     Equalized image and transformation function
     """
-    # 1. Hitung histogram menggunakan NumPy
-    hist, bins = np.histogram(image.flatten(), 256, [0, 256])
+    # 1. Hitung histogram menggunakan NumPy (np.bincount per blok, tanpa salinan flatten())
+    hist = histogram_uint8(image, backend='numpy')
     
     # 2. Hitung cumulative histogram (CDF)
     cdf = hist.cumsum()
@@ -2,6 +2,11 @@ import cv2
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from HistogramCitra import cached_histogram
+from EkualisasiAdaptif import TiledCLAHE, resolve_bit_depth
 
 def calculate_enhancement_metrics(original, enhanced):
     """
@@ -17,8 +22,10 @@ def calculate_enhancement_metrics(original, enhanced):
     
     # 2. Entropy Improvement (Informasi Visual)
     # Mengukur jumlah informasi (detail) yang berhasil dimunculkan
-    orig_hist, _ = np.histogram(original.flatten(), 256, [0, 256])
-    enh_hist, _ = np.histogram(enhanced.flatten(), 256, [0, 256])
+    # Histogram dihitung sekali per citra (citra asli yang sama dipakai ulang antar pemanggilan);
+    # citra 12-16 bit memakai histogram dengan bin per nilai
+    orig_hist = cached_histogram(original) if original.dtype == np.uint8 else np.bincount(original.ravel())
+    enh_hist = cached_histogram(enhanced) if enhanced.dtype == np.uint8 else np.bincount(enhanced.ravel())
     
     # Ditambah 1e-10 untuk menghindari error log(0)
     orig_entropy = stats.entropy(orig_hist + 1e-10) 
@@ -30,15 +37,19 @@ def calculate_enhancement_metrics(original, enhanced):
     
     return metrics
 
-def medical_image_enhancement(medical_image, modality='X-ray'):
+def medical_image_enhancement(medical_image, modality='X-ray', bit_depth=None):
     """
-    Adaptive enhancement pipeline khusus untuk citra medis
+    Adaptive enhancement pipeline khusus untuk citra medis. Citra uint16
+    (X-ray/CT/MRI 12-16 bit) diproses pada kedalaman bit aslinya; bit_depth
+    berasal dari detektor/modalitas (None = lebar dtype, 8 atau 16 bit).
     """
-    # Pastikan citra format grayscale 8-bit
+    # Pastikan citra grayscale (uint8 atau uint16, tanpa dipotong ke 8-bit)
     if len(medical_image.shape) > 2:
         img = cv2.cvtColor(medical_image, cv2.COLOR_BGR2GRAY)
     else:
         img = medical_image.copy()
+    bit_depth = resolve_bit_depth(img, bit_depth)
+    max_value = (1 << bit_depth) - 1
         
     enhanced = np.zeros_like(img)
     pipeline_info = ""
@@ -48,17 +59,17 @@ def medical_image_enhancement(medical_image, modality='X-ray'):
     if modality == 'X-ray':
         # Constraint: Tingkatkan kontras jaringan lunak tanpa over-ekspos tulang
         # Solusi: CLAHE dengan clip limit standar
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        clahe = TiledCLAHE(clip_limit=2.0, tile_grid=(8, 8), bit_depth=bit_depth)
         enhanced = clahe.apply(img)
-        pipeline_info = "CLAHE (clipLimit=2.0, grid=8x8)"
+        pipeline_info = f"CLAHE (clipLimit=2.0, grid=8x8, {bit_depth}-bit)"
         
     elif modality == 'MRI':
         # Constraint: Angkat detail di area gelap tanpa merusak area terang
         # Solusi: Gamma Correction (gamma < 1) + Mild CLAHE
-        img_float = img.astype(np.float32) / 255.0
-        gamma_corrected = (np.power(img_float, 0.7) * 255).astype(np.uint8) #
+        img_float = img.astype(np.float32) / max_value
+        gamma_corrected = (np.power(img_float, 0.7) * max_value).astype(img.dtype) #
         
-        clahe = cv2.createCLAHE(clipLimit=1.5, tileGridSize=(8, 8))
+        clahe = TiledCLAHE(clip_limit=1.5, tile_grid=(8, 8), bit_depth=bit_depth)
         enhanced = clahe.apply(gamma_corrected)
         pipeline_info = "Gamma Correction (y=0.7) -> Mild CLAHE (clip=1.5)"
         
@@ -68,20 +79,24 @@ def medical_image_enhancement(medical_image, modality='X-ray'):
         p2, p98 = np.percentile(img, (2, 98))
         img_clipped = np.clip(img, p2, p98)
         
-        # Normalisasi ke 0-255
-        enhanced = ((img_clipped - p2) / (p98 - p2) * 255).astype(np.uint8)
+        # Normalisasi ke 0-max (255 untuk 8-bit, 4095 untuk 12-bit, ...)
+        enhanced = ((img_clipped - p2) / (p98 - p2) * max_value).astype(img.dtype)
         pipeline_info = "Robust Contrast Stretching (2nd-98th Percentile)"
         
     elif modality == 'Ultrasound':
         # Constraint: Speckle noise sangat tinggi, dilarang amplifikasi ekstrem
         # Solusi: Sangat konservatif CLAHE
-        clahe = cv2.createCLAHE(clipLimit=1.0, tileGridSize=(8, 8))
+        clahe = TiledCLAHE(clip_limit=1.0, tile_grid=(8, 8), bit_depth=bit_depth)
         enhanced = clahe.apply(img)
         pipeline_info = "Conservative CLAHE (clipLimit=1.0) to prevent speckle amp."
         
     else:
-        # Fallback
-        enhanced = cv2.equalizeHist(img) #
+        # Fallback: equalizeHist hanya menerima 8-bit; untuk uint16 ekualisasi
+        # global = CLAHE satu tile tanpa clipping
+        if img.dtype == np.uint8:
+            enhanced = cv2.equalizeHist(img) #
+        else:
+            enhanced = TiledCLAHE(clip_limit=0, tile_grid=(1, 1), bit_depth=bit_depth).apply(img)
         pipeline_info = "Standard Global Histogram Equalization"
 
     # --- GENERATE REPORT ---
@@ -133,4 +148,14 @@ if __name__ == "__main__":
         axes[1, idx].grid(True, alpha=0.3)
         
     plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    plt.show()
+
+    # 3. Citra 12-bit (rentang detektor X-ray) diproses tanpa dipotong ke 8-bit
+    dummy_xray12 = np.clip(np.random.normal(1600, 320, (256, 256)), 0, 4095).astype(np.uint16)
+    dummy_xray12[100:150, 100:150] = np.clip(np.random.normal(1760, 80, (50, 50)), 0, 4095).astype(np.uint16)
+    print(f"\n{'='*40}")
+    print("REPORT: CITRA 12-BIT (uint16)")
+    for mod in modalities:
+        enh_img, report = medical_image_enhancement(dummy_xray12, modality=mod, bit_depth=12)
+        print(f"{mod:<10} | {report['Applied_Pipeline']:<55} | level unik: {len(np.unique(enh_img)):>4} | "
+              f"CII: {report['Metrics']['CII']:.3f}")
\ No newline at end of file
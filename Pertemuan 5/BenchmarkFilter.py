@@ -0,0 +1,145 @@
+import cv2
+import numpy as np
+import time
+import os
+import csv
+import json
+import argparse
+import sys
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from skimage.metrics import peak_signal_noise_ratio as psnr
+from skimage.metrics import structural_similarity as ssim
+from skimage.util import random_noise
+from skimage import img_as_ubyte
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PengukuranWaktu import time_call
+
+# ==========================================
+# 1. DEKLARASI NOISE & FILTER BANK (DATA)
+# ==========================================
+# Setiap entri: (nama, fungsi, parameter). Fungsi harus top-level agar bisa
+# dikirim (pickle) ke worker process.
+NOISE_BANK = [
+    ("Gaussian", "gaussian", {"var": 0.01}),
+    ("Salt-and-Pepper", "s&p", {"amount": 0.05}),
+    ("Speckle", "speckle", {"var": 0.05}),
+]
+
+def mean_filter(img, k):
+    return cv2.blur(img, (k, k))
+
+def gaussian_filter(img, sigma, k=5):
+    return cv2.GaussianBlur(img, (k, k), sigmaX=sigma)
+
+def median_filter(img, k):
+    return cv2.medianBlur(img, k)
+
+def min_filter(img, k):
+    return cv2.erode(img, np.ones((k, k), np.uint8))
+
+def max_filter(img, k):
+    return cv2.dilate(img, np.ones((k, k), np.uint8))
+
+FILTER_BANK = [
+    ("Mean 3x3", mean_filter, {"k": 3}),
+    ("Mean 5x5", mean_filter, {"k": 5}),
+    ("Gaussian (s=1.0)", gaussian_filter, {"sigma": 1.0}),
+    ("Gaussian (s=2.0)", gaussian_filter, {"sigma": 2.0}),
+    ("Median 3x3", median_filter, {"k": 3}),
+    ("Median 5x5", median_filter, {"k": 5}),
+    ("Min Filter 3x3", min_filter, {"k": 3}),
+    ("Max Filter 3x3", max_filter, {"k": 3}),
+]
+
+# ==========================================
+# 2. INPUT (DI-CACHE PER WORKER)
+# ==========================================
+@lru_cache(maxsize=8)
+def load_image(path, size=512):
+    img = cv2.imread(path, 0)
+    if img is None:
+        raise FileNotFoundError(f"Gagal! File '{path}' tidak ditemukan.")
+    if size:
+        img = cv2.resize(img, (size, size), interpolation=cv2.INTER_AREA)
+    return img
+
+@lru_cache(maxsize=32)
+def make_noisy(path, size, noise_idx, seed=42):
+    # Seed tetap agar semua worker melihat citra noisy yang identik
+    _, mode, params = NOISE_BANK[noise_idx]
+    original = load_image(path, size)
+    return img_as_ubyte(random_noise(original, mode=mode, rng=seed, **params))
+
+# ==========================================
+# 3. EKSEKUSI SATU KOMBINASI
+# ==========================================
+def run_combination(task):
+    path, size, noise_idx, filter_idx, repeats = task
+    original = load_image(path, size)
+    noisy = make_noisy(path, size, noise_idx)
+    filter_name, func, params = FILTER_BANK[filter_idx]
+
+    res, med, iqr = time_call(lambda: func(noisy, **params), repeats=repeats)
+    mse = np.mean((original.astype(np.float32) - res.astype(np.float32)) ** 2)
+    return {
+        "Image": os.path.basename(path),
+        "Noise": NOISE_BANK[noise_idx][0],
+        "Filter": filter_name,
+        "MSE": round(float(mse), 2),
+        "PSNR": round(float(psnr(original, res, data_range=255)), 2),
+        "SSIM": round(float(ssim(original, res, data_range=255)), 3),
+        "TimeMedian_ms": round(med * 1000, 4),
+        "TimeIQR_ms": round(iqr * 1000, 4),
+    }
+
+def run_benchmark(image_paths, size=512, repeats=7, workers=None):
+    """Jalankan semua kombinasi (citra x noise x filter) di process pool"""
+    tasks = [(p, size, n, f, repeats)
+             for p in image_paths
+             for n in range(len(NOISE_BANK))
+             for f in range(len(FILTER_BANK))]
+    # Worker dibatasi 1 thread OpenCV supaya waktu tidak saling berebut core
+    with ProcessPoolExecutor(max_workers=workers, initializer=cv2.setNumThreads,
+                             initargs=(1,)) as pool:
+        # chunksize per (citra, noise) agar cache citra noisy terpakai di worker yang sama
+        return list(pool.map(run_combination, tasks, chunksize=len(FILTER_BANK)))
+
+# ==========================================
+# 4. OUTPUT TABEL (CSV / JSON)
+# ==========================================
+def save_results(results, csv_path=None, json_path=None):
+    if csv_path and results:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+def print_table(results):
+    print(f"{'Image':<16} | {'Noise Type':<16} | {'Filter':<18} | {'PSNR':<6} | {'SSIM':<6} | {'Median (ms)':<11} | {'IQR (ms)':<8}")
+    print("-" * 100)
+    for r in results:
+        print(f"{r['Image']:<16} | {r['Noise']:<16} | {r['Filter']:<18} | {r['PSNR']:<6} | {r['SSIM']:<6} | {r['TimeMedian_ms']:<11} | {r['TimeIQR_ms']:<8}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark filter bank spasial (PSNR/SSIM/waktu)")
+    parser.add_argument("images", nargs="*", default=["TehPucuk.jpg"], help="Path citra uji")
+    parser.add_argument("--size", type=int, default=512, help="Resize ke size x size (0 = asli)")
+    parser.add_argument("--repeats", type=int, default=7, help="Jumlah pengulangan timing")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah worker process")
+    parser.add_argument("--csv", default="hasil_benchmark.csv")
+    parser.add_argument("--json", default=None)
+    args = parser.parse_args()
+
+    paths = [p for p in args.images if os.path.exists(p)]
+    if not paths:
+        print(f"Error: Tidak ada file citra yang ditemukan dari {args.images}")
+    else:
+        t0 = time.perf_counter()
+        results = run_benchmark(paths, args.size, args.repeats, args.workers)
+        print_table(results)
+        save_results(results, args.csv, args.json)
+        print(f"\n{len(results)} kombinasi selesai dalam {time.perf_counter() - t0:.2f} detik")
@@ -2,6 +2,10 @@ import numpy as np
 import cv2
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PolaSintetis import get_pattern
 
 # ==========================================
 # PRAKTIKUM 5.1: IMPLEMENTASI KONVOLUSI MANUAL
@@ -37,15 +41,8 @@ def manual_convolution(image, kernel):
 
 def create_test_pattern(size=100):
     """Membuat citra test pattern dengan edge yang jelas"""
-    img = np.zeros((size, size), dtype=np.float32)
-    
-    # Add different patterns
-    cv2.rectangle(img, (20, 20), (40, 40), 255, -1)  # White square
-    cv2.circle(img, (70, 70), 15, 128, -1)  # Gray circle
-    cv2.line(img, (10, 80), (90, 80), 200, 2)  # Horizontal line
-    cv2.line(img, (50, 10), (50, 90), 100, 2)  # Vertical line
-    
-    return img
+    # Square, circle, garis horizontal & vertikal (float32), di-cache oleh PolaSintetis
+    return get_pattern('edge_pattern', size).copy()
 
 def run_praktikum_5_1():
     print("PRAKTIKUM 5.1: IMPLEMENTASI KONVOLUSI MANUAL")
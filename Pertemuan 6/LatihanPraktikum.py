@@ -2,6 +2,10 @@ import numpy as np
 import cv2
 import matplotlib.pyplot as plt
 from scipy import signal
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PolaSintetis import get_pattern
 
 # =================================================================
 # FUNGSI PEMBANTU (UTILITY FUNCTIONS)
@@ -40,13 +44,7 @@ def praktikum_6_1():
     print("=" * 50)
     
     def create_test_image():
-        img = np.zeros((256, 256), dtype=np.uint8)
-        cv2.rectangle(img, (30, 30), (100, 100), 200, -1)
-        cv2.circle(img, (180, 80), 40, 150, -1)
-        cv2.line(img, (50, 180), (200, 180), 100, 3)
-        cv2.line(img, (180, 50), (180, 200), 100, 3)
-        cv2.putText(img, 'TEST', (100, 140), cv2.FONT_HERSHEY_SIMPLEX, 0.8, 180, 2)
-        return img
+        return get_pattern('degradation_test', 256).copy()
 
     def add_gaussian_noise(image, mean=0, sigma=25):
         noise = np.random.normal(mean, sigma, image.shape)
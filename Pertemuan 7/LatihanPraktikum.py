@@ -1,7 +1,10 @@
 import numpy as np
-import cv2
 import matplotlib.pyplot as plt
 from scipy.fft import fft2, fftshift, ifft2, ifftshift
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from PolaSintetis import get_frequency_test_images
 
 def praktikum_7_1_fixed():
     print("PRAKTIKUM 7.1: TRANSFORMASI FOURIER DAN ANALISIS SPEKTRUM")
@@ -9,37 +12,8 @@ def praktikum_7_1_fixed():
     
     # 1. Fungsi Pembuat Gambar (Tetap sama, hanya pembersihan kecil)
     def create_frequency_test_images():
-        images = {}
-        # Low Frequency
-        img_low = np.zeros((256, 256), dtype=np.float32)
-        cv2.rectangle(img_low, (50, 50), (200, 200), 1.0, -1)
-        img_low = cv2.GaussianBlur(img_low, (31, 31), 10)
-        images['Low Frequency'] = (img_low * 255).astype(np.uint8)
-        
-        # High Frequency
-        img_high = np.zeros((256, 256), dtype=np.uint8)
-        for i in range(0, 256, 16):
-            for j in range(0, 256, 16):
-                if (i//16 + j//16) % 2 == 0:
-                    img_high[i:i+16, j:j+16] = 255
-        images['High Frequency'] = img_high
-        
-        # Mixed Frequencies
-        img_mixed = np.zeros((256, 256), dtype=np.uint8)
-        cv2.rectangle(img_mixed, (30, 30), (150, 150), 200, -1)
-        for i in range(0, 256, 8):
-            cv2.line(img_mixed, (i, 0), (i, 255), 150, 1)
-        for i in range(20, 236, 20):
-            for j in range(20, 236, 20):
-                cv2.circle(img_mixed, (i, j), 2, 255, -1)
-        images['Mixed Frequencies'] = img_mixed
-        
-        # Periodic Pattern
-        x, y = np.meshgrid(np.arange(256), np.arange(256))
-        img_periodic = 127 + 127 * np.sin(2*np.pi*x/32) * np.sin(2*np.pi*y/64)
-        images['Periodic Pattern'] = img_periodic.astype(np.uint8)
-        
-        return images
+        # Low, High, Mixed, Periodic: dibuat langsung dalam uint8/float32 dan di-cache
+        return {name: img.copy() for name, img in get_frequency_test_images(256).items()}
 
     def analyze_fourier_spectrum(image):
         img_float = image.astype(np.float32) / 255.0
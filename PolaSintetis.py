@@ -0,0 +1,192 @@
+import cv2
+import numpy as np
+import os
+import time
+from collections import OrderedDict
+
+# ==========================================
+# LIBRARY POLA SINTETIS (ZONE PLATE, TEST IMAGE, POLA FREKUENSI)
+# ==========================================
+# Pola dibuat langsung dalam float32/uint8, di-cache per (jenis, ukuran,
+# parameter) dengan batas memori LRU, dan bisa disimpan sebagai file .npy
+# yang dibuka ulang secara memory-mapped. Dipakai bersama oleh praktikum di
+# folder "Pertemuan X" (tambahkan folder root repo ke sys.path).
+
+def _zone_plate(size=512, km=0.7 * np.pi):
+    """Zone plate (Pertemuan 2/Aliasing.py) dalam float32 -> uint8"""
+    x = np.linspace(-size / 2, size / 2, size, dtype=np.float32)
+    r2 = x[None, :] ** 2 + x[:, None] ** 2
+    img = np.sin(np.float32(km / size) * r2)
+    return ((img + 1) * np.float32(127.5)).astype(np.uint8)
+
+def _geometric(size=256):
+    """Citra uji geometrik (Pertemuan 3/Praktikum3.py)"""
+    img = np.zeros((size, size), dtype=np.uint8)
+    cv2.line(img, (size//2, 0), (size//2, size), 200, 1)
+    cv2.line(img, (0, size//2), (size, size//2), 200, 1)
+    cv2.circle(img, (size//2, size//2), size//8, 255, 2)
+    square_size = size//6
+    cv2.rectangle(img,
+                 (size//4 - square_size//2, size//4 - square_size//2),
+                 (size//4 + square_size//2, size//4 + square_size//2),
+                 150, 2)
+    triangle_pts = np.array([
+        [size*3//4, size//4 - size//8],
+        [size*3//4 - size//8, size//4 + size//8],
+        [size*3//4 + size//8, size//4 + size//8]
+    ])
+    cv2.polylines(img, [triangle_pts], True, 100, 2)
+    cv2.line(img, (0, 0), (size, size), 180, 1)
+    cv2.line(img, (size, 0), (0, size), 180, 1)
+    cv2.putText(img, 'TOP', (size//2 - 20, 30),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.7, 255, 1)
+    cv2.putText(img, 'BOTTOM', (size//2 - 30, size - 10),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.7, 255, 1)
+    return img
+
+def _edge_pattern(size=100):
+    """Test pattern edge (Pertemuan 5/LatihanPraktikum.py), float32 0-255"""
+    img = np.zeros((size, size), dtype=np.float32)
+    cv2.rectangle(img, (20, 20), (40, 40), 255, -1)
+    cv2.circle(img, (70, 70), 15, 128, -1)
+    cv2.line(img, (10, 80), (90, 80), 200, 2)
+    cv2.line(img, (50, 10), (50, 90), 100, 2)
+    return img
+
+def _degradation_test(size=256):
+    """Citra uji degradasi (Pertemuan 6/LatihanPraktikum.py)"""
+    img = np.zeros((size, size), dtype=np.uint8)
+    cv2.rectangle(img, (30, 30), (100, 100), 200, -1)
+    cv2.circle(img, (180, 80), 40, 150, -1)
+    cv2.line(img, (50, 180), (200, 180), 100, 3)
+    cv2.line(img, (180, 50), (180, 200), 100, 3)
+    cv2.putText(img, 'TEST', (100, 140), cv2.FONT_HERSHEY_SIMPLEX, 0.8, 180, 2)
+    return img
+
+def _freq_low(size=256):
+    img = np.zeros((size, size), dtype=np.float32)
+    cv2.rectangle(img, (50, 50), (200, 200), 1.0, -1)
+    img = cv2.GaussianBlur(img, (31, 31), 10)
+    return (img * 255).astype(np.uint8)
+
+def _freq_high(size=256, block=16):
+    idx = np.arange(size) // block
+    return np.where((idx[:, None] + idx[None, :]) % 2 == 0, 255, 0).astype(np.uint8)
+
+def _freq_mixed(size=256):
+    img = np.zeros((size, size), dtype=np.uint8)
+    cv2.rectangle(img, (30, 30), (150, 150), 200, -1)
+    for i in range(0, size, 8):
+        cv2.line(img, (i, 0), (i, size - 1), 150, 1)
+    for i in range(20, size - 20, 20):
+        for j in range(20, size - 20, 20):
+            cv2.circle(img, (i, j), 2, 255, -1)
+    return img
+
+def _freq_periodic(size=256, period_x=32, period_y=64):
+    # Separable: outer product dua sinus 1-D, bukan meshgrid float64 penuh
+    sx = np.sin(2 * np.pi * np.arange(size, dtype=np.float32) / period_x)
+    sy = np.sin(2 * np.pi * np.arange(size, dtype=np.float32) / period_y)
+    return (127 + 127 * sy[:, None] * sx[None, :]).astype(np.uint8)
+
+PATTERN_GENERATORS = {
+    'zone_plate': _zone_plate,
+    'geometric': _geometric,
+    'edge_pattern': _edge_pattern,
+    'degradation_test': _degradation_test,
+    'freq_low': _freq_low,
+    'freq_high': _freq_high,
+    'freq_mixed': _freq_mixed,
+    'freq_periodic': _freq_periodic,
+}
+
+# ==========================================
+# CACHE LRU (BATAS BYTES) + PERSISTENSI .NPY
+# ==========================================
+class PatternCache:
+    """
+    Cache pola sintetis berbasis LRU dengan batas total bytes. Jika cache_dir
+    diisi, pola juga disimpan sebagai .npy dan dimuat ulang dengan mmap_mode='r'
+    sehingga proses lain (benchmark, test) langsung memakai input yang identik.
+    Array yang dikembalikan bersifat read-only; salin jika perlu diubah.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, cache_dir=None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self._items = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(kind, size, params):
+        return (kind, size, tuple(sorted(params.items())))
+
+    def _file_path(self, key):
+        kind, size, params = key
+        suffix = "".join(f"_{k}{v}" for k, v in params)
+        return os.path.join(self.cache_dir, f"{kind}_{size}{suffix}.npy")
+
+    def _load_or_generate(self, key):
+        kind, size, params = key
+        if self.cache_dir:
+            path = self._file_path(key)
+            if not os.path.exists(path):
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(path, PATTERN_GENERATORS[kind](size, **dict(params)))
+            return np.load(path, mmap_mode='r')
+        arr = PATTERN_GENERATORS[kind](size, **dict(params))
+        arr.flags.writeable = False
+        return arr
+
+    def get(self, kind, size=256, **params):
+        if kind not in PATTERN_GENERATORS:
+            raise ValueError(f"Pola '{kind}' tidak dikenal (pilih dari {list(PATTERN_GENERATORS)})")
+        key = self.make_key(kind, size, params)
+        if key in self._items:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+        self.misses += 1
+        arr = self._load_or_generate(key)
+        self._items[key] = arr
+        self._bytes += arr.nbytes
+        # Buang entri paling lama sampai di bawah batas (entri terbaru selalu disimpan)
+        while self._bytes > self.max_bytes and len(self._items) > 1:
+            _, old = self._items.popitem(last=False)
+            self._bytes -= old.nbytes
+        return arr
+
+    def clear(self):
+        self._items.clear()
+        self._bytes = 0
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+_default_cache = PatternCache(cache_dir=os.environ.get('PCD_PATTERN_CACHE'))
+
+def get_pattern(kind, size=256, **params):
+    """Ambil pola dari cache global (read-only). Set env PCD_PATTERN_CACHE untuk persistensi .npy"""
+    return _default_cache.get(kind, size, **params)
+
+def get_frequency_test_images(size=256):
+    """Empat pola frekuensi Pertemuan 7 dalam satu dict"""
+    return {
+        'Low Frequency': get_pattern('freq_low', size),
+        'High Frequency': get_pattern('freq_high', size),
+        'Mixed Frequencies': get_pattern('freq_mixed', size),
+        'Periodic Pattern': get_pattern('freq_periodic', size),
+    }
+
+if __name__ == "__main__":
+    for kind, size in [('zone_plate', 2048), ('geometric', 1024), ('freq_periodic', 2048)]:
+        t0 = time.perf_counter()
+        get_pattern(kind, size)
+        t1 = time.perf_counter()
+        get_pattern(kind, size)
+        t2 = time.perf_counter()
+        print(f"{kind:<14} {size}x{size} | generate: {(t1 - t0) * 1000:.2f} ms | cache: {(t2 - t1) * 1e6:.1f} us")
+    print(f"Cache: {_default_cache.nbytes / 1e6:.1f} MB, hit {_default_cache.hits}, miss {_default_cache.misses}")